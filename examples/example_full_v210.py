@@ -7,10 +7,17 @@
 #       Github:     https://github.com/thieu1995                                                        %
 # ------------------------------------------------------------------------------------------------------%
 
+import numpy as np
 from opfunu.cec_basic.cec2014_nobias import *
 from mealpy.bio_based import SMA
+from mealpy.evolutionary_based import DE
+from mealpy.swarm_based import GWO
 from mealpy.problem import Problem
 from mealpy.utils.termination import Termination
+from mealpy.utils.storage import MemmapPopulationStore
+from mealpy.utils.checkpoint import Checkpoint
+from mealpy.utils.cache import FitnessCache
+from mealpy.utils.runner import Runner
 
 # Setting parameters
 
@@ -120,6 +127,10 @@ if __name__ == "__main__":
     model7 = SMA.BaseSMA(problem_dict1, epoch=100, pop_size=50, pr=0.03)
     model7.solve(mode='process')
 
+    ## The worker pool is created once per solve() call, you can limit its size by n_workers
+    model7b = SMA.BaseSMA(problem_dict1, epoch=100, pop_size=50, pr=0.03)
+    model7b.solve(mode='process', n_workers=4)
+
 # D - Drawing all available figures
 
 ## There are 8 different figures for each algorithm.
@@ -151,6 +162,12 @@ model8.history.save_exploration_exploitation_chart(filename="hello/eec")
 model8.history.save_diversity_chart(filename="hello/dc")
 model8.history.save_trajectory_chart(list_agent_idx=[3, 5], list_dimensions=[3], filename="hello/tc")
 
+## For long runs, the positions of all generations can be spilled to disk instead of RAM
+model8b = SMA.BaseSMA(problem_dict1, epoch=100, pop_size=50, pr=0.03, history_store=MemmapPopulationStore("hello/pop.dat", max_epochs=100))
+model8b.solve()
+model8b.history.save_trajectory_chart(list_agent_idx=[3, 5], list_dimensions=[3], filename="hello/tc-memmap")
+## And reloaded later: store = MemmapPopulationStore.load("hello/pop.dat")
+
 
 # E - Handling Multi-Objective function and Constraint Method
 
@@ -198,3 +215,65 @@ objective_values = model9.solution[1][1]
 
 model10 = SMA.OriginalSMA(problem_obj9, epoch=100, pop_size=50, pr=0.03)
 model10.solve()
+
+# G - Vectorized objective function
+
+## If your objective function can score a whole population at once, set "vectorized": True.
+## Then obj_func receives a 2-D matrix (n, n_dims) and returns an array (n,) or (n, n_objs)
+def vectorized_obj_function(solutions):
+    return np.sum(solutions ** 2, axis=1)
+
+
+problem_dict11 = {
+    "obj_func": vectorized_obj_function,
+    "lb": [-10, ] * 30,
+    "ub": [10, ] * 30,
+    "minmax": "min",
+    "verbose": True,
+    "vectorized": True  # Remember the keyword "vectorized"
+}
+model11 = SMA.BaseSMA(problem_dict11, epoch=100, pop_size=50, pr=0.03)
+model11.solve()
+
+# H - Checkpoint and resume a long run
+
+## Save the state after each 10 epochs, then continue the run after a crash (bit-identical to a single run)
+model12 = SMA.BaseSMA(problem_dict1, epoch=100, pop_size=50, pr=0.03, checkpoint=Checkpoint("hello/sma", every_epochs=10))
+model12.solve()
+model12b = SMA.BaseSMA(problem_dict1, epoch=100, pop_size=50, pr=0.03)
+model12b.solve(resume_from="hello/sma")
+
+# I - Fitness cache for expensive objective functions
+
+## The positions evaluated before are not sent to the objective function again. Round or project the position by
+## "decimals" or "key_func" if many positions are the same solution (discrete problems)
+cache = FitnessCache(max_size=10000, decimals=8)
+model13 = SMA.BaseSMA(problem_dict1, epoch=100, pop_size=50, pr=0.03, fitness_cache=cache)
+model13.solve()
+print(f"Cache hits: {cache.n_hits}, misses: {cache.n_misses}, hit rate: {cache.hit_rate:.3f}")
+
+# J - Asynchronous steady-state evaluation
+
+## When the time of the objective function varies a lot, a new candidate is sent to the worker pool as soon as a worker
+## is free, instead of waiting for the slowest evaluation of the generation (BaseDE, BaseGWO, BaseWOA, BaseHHO, BaseSSO, BaseCEM)
+model14 = DE.BaseDE(problem_dict1, epoch=100, pop_size=50)
+model14.solve(mode="thread", n_workers=4, steady_state=True, max_in_flight=8)
+
+# K - Vectorized evolve for large populations
+
+## The new positions of the whole population are built at once with numpy, instead of one agent at a time
+## (BaseGWO, BaseSSO, BaseCEM, BaseHS, BaseTLO, OriginalHC, BaseES, BasePSO, BaseDE)
+model15 = GWO.BaseGWO(problem_dict1, epoch=100, pop_size=1000, vectorized_evolve=True)
+model15.solve()
+
+# L - Benchmark many algorithms on many problems with many runs
+
+## The independent runs are spread over a process pool (all CPUs), each run is seeded so the results don't depend on
+## the number of workers. best_fit has the shape (n_algorithms, n_problems, n_runs)
+if __name__ == "__main__":
+    algorithms = {"GWO": (GWO.BaseGWO, {"epoch": 100, "pop_size": 50}), "DE": (DE.BaseDE, {"epoch": 100, "pop_size": 50})}
+    problems = {"F5-4D": problem_dict1, "F5-30D": problem_dict2}
+    runner = Runner(algorithms, problems, seeds=range(10))
+    runner.run(mode="process")
+    runner.save("history/runner")
+    print(np.mean(runner.best_fit, axis=2))
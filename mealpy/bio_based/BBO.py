@@ -47,7 +47,7 @@ class OriginalBBO(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        _, pop_elites, _ = self.get_special_solutions(self.pop, best=self.elites)
+        _, pop_elites, _ = self.get_special_solutions(self.pop, best=self.elites, sort=False)
         pop = []
         for idx in range(0, self.pop_size):
             # Probabilistic migration to the i-th position
@@ -99,7 +99,7 @@ class BaseBBO(OriginalBBO):
         Args:
             epoch (int): The current iteration
         """
-        _, pop_elites, _ = self.get_special_solutions(self.pop, best=self.elites)
+        _, pop_elites, _ = self.get_special_solutions(self.pop, best=self.elites, sort=False)
         list_fitness = [agent[self.ID_FIT][self.ID_TAR] for agent in self.pop]
         pop = []
         for idx in range(0, self.pop_size):
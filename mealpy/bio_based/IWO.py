@@ -60,12 +60,11 @@ class OriginalIWO(Optimizer):
             s = int(np.ceil(self.seeds[0] + (self.seeds[1] - self.seeds[0]) * ratio))
             if s > int(np.sqrt(self.pop_size)):
                 s = int(np.sqrt(self.pop_size))
-            pop_local = []
             for j in range(s):
                 # Initialize Offspring and Generate Random Location
                 pos_new = pop[idx][self.ID_POS] + sigma * np.random.normal(self.problem.lb, self.problem.ub)
                 pos_new = self.amend_position_faster(pos_new)
-                pop_local.append([pos_new, None])
-            pop_local = self.update_fitness_population(pop_local)
-            pop_new += pop_local
+                pop_new.append([pos_new, None])
+        # The seeds of all plants are evaluated in a single batch
+        pop_new = self.update_fitness_population(pop_new)
         self.pop = self.get_sorted_strim_population(pop_new, self.pop_size)
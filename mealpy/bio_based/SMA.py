@@ -91,7 +91,7 @@ class BaseSMA(Optimizer):
                 vc = np.random.uniform(-b, b, self.problem.n_dims)
 
                 # two positions randomly selected from population, apply for the whole problem size instead of 1 variable
-                id_a, id_b = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+                id_a, id_b = self.get_index_distinct_random(2, idx)
 
                 pos_1 = self.g_best[self.ID_POS] + vb * (self.pop[idx][self.ID_WEI] * self.pop[id_a][self.ID_POS] - self.pop[id_b][self.ID_POS])
                 pos_2 = vc * self.pop[idx][self.ID_POS]
@@ -155,7 +155,7 @@ class OriginalSMA(BaseSMA):
                 vc = np.random.uniform(-b, b, self.problem.n_dims)
                 for j in range(0, self.problem.n_dims):
                     # two positions randomly selected from population
-                    id_a, id_b = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+                    id_a, id_b = self.get_index_distinct_random(2, idx)
                     if np.random.uniform() < p:  # Eq.(2.1)
                         current_agent[self.ID_POS][j] = self.g_best[self.ID_POS][j] + vb[j] * (
                                 current_agent[self.ID_WEI][j] * self.pop[id_a][self.ID_POS][j] - self.pop[id_b][self.ID_POS][j])
@@ -87,7 +87,7 @@ class BaseVCS(Optimizer):
         ## Immune response
         for i in range(0, self.pop_size):
             pr = (self.problem.n_dims - i + 1) / self.problem.n_dims
-            id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+            id1, id2 = self.get_index_distinct_random(2, i)
             temp = self.pop[id1][self.ID_POS] - (self.pop[id2][self.ID_POS] - self.pop[i][self.ID_POS]) * np.random.uniform()
             pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < pr, self.pop[i][self.ID_POS], temp)
             self.pop[i][self.ID_POS] = self.amend_position_faster(pos_new)
@@ -145,7 +145,7 @@ class OriginalVCS(BaseVCS):
             pos_new = pop[i][self.ID_POS]
             for j in range(0, self.problem.n_dims):
                 if np.random.uniform() > pr:
-                    id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+                    id1, id2 = self.get_index_distinct_random(2, i)
                     pos_new[j] = pop[id1][self.ID_POS][j] - (pop[id2][self.ID_POS][j] - pop[i][self.ID_POS][j]) * np.random.uniform()
             pop[i][self.ID_POS] = self.amend_position_faster(pos_new)
         pop = self.update_fitness_population(pop)
@@ -58,16 +58,19 @@ class BaseWHO(Optimizer):
         """
         nfe_epoch = 0
         ## Begin the Wildebeest Herd Optimization process
-        pop_new = []
+        ### 1. Local movement (Milling behaviour), the local positions of all agents are evaluated in a batch
+        local_groups = []
         for i in range(0, self.pop_size):
-            ### 1. Local movement (Milling behaviour)
             local_list = []
             for j in range(0, self.n_s):
                 temp = self.pop[i][self.ID_POS] + self.eta * np.random.uniform() * np.random.uniform(self.problem.lb, self.problem.ub)
                 pos_new = self.amend_position_faster(temp)
                 local_list.append([pos_new, None])
-            local_list = self.update_fitness_population(local_list)
-            _, best_local = self.get_global_best_solution(local_list)
+            local_groups.append(local_list)
+        local_groups = self.update_fitness_groups(local_groups)
+        pop_new = []
+        for i, local_list in enumerate(local_groups):
+            _, best_local = self.get_global_best_solution(local_list, sort=False)
             temp = self.local_move[0] * best_local[self.ID_POS] + self.local_move[1] * (self.pop[i][self.ID_POS] - best_local[self.ID_POS])
             pos_new = self.amend_position_faster(temp)
             pop_new.append([pos_new, None])
@@ -75,18 +78,21 @@ class BaseWHO(Optimizer):
         pop_new = self.greedy_selection_population(self.pop, pop_new)
         nfe_epoch += self.pop_size
 
+        ### 2. Herd instinct, the agents follow the herd of the previous step and are evaluated in a batch
+        list_idx, pop_herd = [], []
         for i in range(0, self.pop_size):
-            ### 2. Herd instinct
             idr = np.random.choice(range(0, self.pop_size))
             if self.compare_agent(pop_new[idr], pop_new[i]) and np.random.rand() < self.p_hi:
                 temp = self.global_move[0] * pop_new[i][self.ID_POS] + self.global_move[1] * pop_new[idr][self.ID_POS]
-                pos_new = self.amend_position_faster(temp)
-                fit_new = self.get_fitness_position(pos_new)
-                nfe_epoch += 1
-                if self.compare_agent([pos_new, fit_new], pop_new[i]):
-                    pop_new[i] = [pos_new, fit_new]
+                list_idx.append(i)
+                pop_herd.append([self.amend_position_faster(temp), None])
+        pop_herd = self.update_fitness_population(pop_herd)
+        nfe_epoch += len(pop_herd)
+        for i, agent in zip(list_idx, pop_herd):
+            if self.compare_agent(agent, pop_new[i]):
+                pop_new[i] = agent
 
-        _, best, worst = self.get_special_solutions(pop_new, worst=1)
+        _, best, worst = self.get_special_solutions(pop_new, worst=1, sort=False)
         g_best, g_worst = best[0], worst[0]
 
         pop_child = []
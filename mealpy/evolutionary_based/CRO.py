@@ -180,9 +180,7 @@ class OCRO(BaseCRO):
 
     def _opposition_based_position(self, reef, g_best):
         pos_new = self.problem.ub + self.problem.lb - g_best[self.ID_POS] + np.random.uniform() * (g_best[self.ID_POS] - reef[self.ID_POS])
-        pos_new = self.amend_position_faster(pos_new)
-        fit_new = self.get_fitness_position(pos_new)
-        return [pos_new, fit_new]
+        return self.amend_position_faster(pos_new)
 
     def evolve(self, epoch):
         """
@@ -207,8 +205,9 @@ class OCRO(BaseCRO):
             num__depredation__ = int(len(self.occupied_idx_list) * self.Fd)
             idx_list_sorted = self._sort_occupied_reef()
             selected_depredator = idx_list_sorted[-num__depredation__:]
-            for idx in selected_depredator:
-                opposite_reef = self._opposition_based_position(self.pop[idx], self.g_best)
+            list_pos = [self._opposition_based_position(self.pop[idx], self.g_best) for idx in selected_depredator]
+            pop_opposite = self.update_fitness_population([[pos, None] for pos in list_pos])
+            for idx, opposite_reef in zip(selected_depredator, pop_opposite):
                 if self.compare_agent(opposite_reef, self.pop[idx]):
                     self.pop[idx] = opposite_reef
                 else:
@@ -221,7 +220,7 @@ class OCRO(BaseCRO):
             self.G1 -= self.gama
 
         self.reset_count += 1
-        _, local_best = self.get_global_best_solution(self.pop)
+        _, local_best = self.get_global_best_solution(self.pop, sort=False)
         if self.compare_agent(local_best, self.g_best):
             self.reset_count = 0
 
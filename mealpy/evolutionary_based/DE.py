@@ -9,8 +9,9 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
-from scipy.stats import cauchy
-from copy import deepcopy
+from mealpy.utils.population import Population
+from mealpy.utils.selection import get_ranked_index
+from mealpy.utils.adaptive import get_truncated_cauchy, get_clipped_normal, add_to_archive, resize_archive, get_current_to_pbest_trials
 """
 BaseDE: - the very first DE algorithm (Novel mutation strategy for enhancing SHADE and LSHADE algorithms for global numerical optimization)
     strategy = 0: DE/current-to-rand/1/bin
@@ -26,6 +27,7 @@ class BaseDE(Optimizer):
     """
         The original version of: Differential Evolution (DE)
     """
+    ARRAY_POPULATION = True
 
     def __init__(self, problem, epoch=10000, pop_size=100, wf=0.8, cr=0.9, strategy=0, **kwargs):
         """
@@ -50,60 +52,87 @@ class BaseDE(Optimizer):
         pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.crossover_rate, current_pos, new_pos)
         return self.amend_position_faster(pos_new)
 
-    def evolve(self, epoch):
+    def get_new_position(self, idx):
         """
         Args:
-            epoch (int): The current iteration
+            idx (int): index of the agent
+
+        Returns:
+            The trial position of agent idx by the selected strategy
         """
-        pop = []
         if self.strategy == 0:
             # Choose 3 random element and different to i
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                pos_new = self.pop[idx_list[0]][self.ID_POS] + self.weighting_factor * \
-                          (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
+            idx_list = self.get_index_distinct_random(3, idx)
+            pos_new = self.pop[idx_list[0]][self.ID_POS] + self.weighting_factor * \
+                      (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
         elif self.strategy == 1:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.g_best[self.ID_POS] + self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
+            idx_list = self.get_index_distinct_random(2, idx)
+            pos_new = self.g_best[self.ID_POS] + self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
         elif self.strategy == 2:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 4, replace=False)
-                pos_new = self.g_best[self.ID_POS] + self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS]) + \
-                          self.weighting_factor * (self.pop[idx_list[2]][self.ID_POS] - self.pop[idx_list[3]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
+            idx_list = self.get_index_distinct_random(4, idx)
+            pos_new = self.g_best[self.ID_POS] + self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS]) + \
+                      self.weighting_factor * (self.pop[idx_list[2]][self.ID_POS] - self.pop[idx_list[3]][self.ID_POS])
         elif self.strategy == 3:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 5, replace=False)
-                pos_new = self.pop[idx_list[0]][self.ID_POS] + self.weighting_factor * \
-                          (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS]) + \
-                          self.weighting_factor * (self.pop[idx_list[3]][self.ID_POS] - self.pop[idx_list[4]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
+            idx_list = self.get_index_distinct_random(5, idx)
+            pos_new = self.pop[idx_list[0]][self.ID_POS] + self.weighting_factor * \
+                      (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS]) + \
+                      self.weighting_factor * (self.pop[idx_list[3]][self.ID_POS] - self.pop[idx_list[4]][self.ID_POS])
         elif self.strategy == 4:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + self.weighting_factor * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
+            idx_list = self.get_index_distinct_random(2, idx)
+            pos_new = self.pop[idx][self.ID_POS] + self.weighting_factor * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + \
+                      self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx_list[1]][self.ID_POS])
         else:
-            for idx in range(0, self.pop_size):
-                idx_list = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
-                pos_new = self.pop[idx][self.ID_POS] + self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
-                          self.weighting_factor * (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
-                pos_new = self._mutation__(self.pop[idx][self.ID_POS], pos_new)
-                pop.append([pos_new, None])
+            idx_list = self.get_index_distinct_random(3, idx)
+            pos_new = self.pop[idx][self.ID_POS] + self.weighting_factor * (self.pop[idx_list[0]][self.ID_POS] - self.pop[idx][self.ID_POS]) + \
+                      self.weighting_factor * (self.pop[idx_list[1]][self.ID_POS] - self.pop[idx_list[2]][self.ID_POS])
+        return self._mutation__(self.pop[idx][self.ID_POS], pos_new)
+
+    def create_candidate(self, idx, epoch):
+        return [self.get_new_position(idx)]
+
+    def evolve(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        pop = Population(np.array([self.get_new_position(idx) for idx in range(0, self.pop_size)]))
         pop = self.update_fitness_population(pop)
 
         # create new pop by comparing fitness of corresponding each member in pop and children
         self.pop = self.greedy_selection_population(self.pop, pop)
 
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        list_pos = self.get_position_matrix(self.pop)
+        g_best = self.g_best[self.ID_POS]
+        wf = self.weighting_factor
+        # The distinct donors of all agents at once, each row is different to the agent itself
+        if self.strategy == 0:
+            r = self.get_index_distinct_random_matrix(3)
+            pos_new = list_pos[r[:, 0]] + wf * (list_pos[r[:, 1]] - list_pos[r[:, 2]])
+        elif self.strategy == 1:
+            r = self.get_index_distinct_random_matrix(2)
+            pos_new = g_best + wf * (list_pos[r[:, 0]] - list_pos[r[:, 1]])
+        elif self.strategy == 2:
+            r = self.get_index_distinct_random_matrix(4)
+            pos_new = g_best + wf * (list_pos[r[:, 0]] - list_pos[r[:, 1]]) + wf * (list_pos[r[:, 2]] - list_pos[r[:, 3]])
+        elif self.strategy == 3:
+            r = self.get_index_distinct_random_matrix(5)
+            pos_new = list_pos[r[:, 0]] + wf * (list_pos[r[:, 1]] - list_pos[r[:, 2]]) + wf * (list_pos[r[:, 3]] - list_pos[r[:, 4]])
+        elif self.strategy == 4:
+            r = self.get_index_distinct_random_matrix(2)
+            pos_new = list_pos + wf * (g_best - list_pos) + wf * (list_pos[r[:, 0]] - list_pos[r[:, 1]])
+        else:
+            r = self.get_index_distinct_random_matrix(3)
+            pos_new = list_pos + wf * (list_pos[r[:, 0]] - list_pos) + wf * (list_pos[r[:, 1]] - list_pos[r[:, 2]])
+        pos_new = np.where(np.random.uniform(0, 1, list_pos.shape) < self.crossover_rate, list_pos, pos_new)
+        pos_new = self.amend_position_faster(pos_new)
+        pop_new = self.update_fitness_population(Population(pos_new))
+        self.pop = self.greedy_selection_population(self.pop, pop_new)
+
 
 class JADE(Optimizer):
     """
@@ -136,7 +165,8 @@ class JADE(Optimizer):
         ## Dynamic variable, changing in run time
         self.dyn_miu_cr = self.miu_cr
         self.dyn_miu_f = self.miu_f
-        self.dyn_pop_archive = list()
+        self.dyn_pop_archive = np.zeros((self.pop_size, self.problem.n_dims))   # The positions of the archive
+        self.dyn_archive_size = 0                                               # Number of saved positions
 
     ### Survivor Selection
     def lehmer_mean(self, list_objects):
@@ -148,69 +178,31 @@ class JADE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        list_f = list()
-        list_cr = list()
-        temp_f = list()
-        temp_cr = list()
-
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-        pop = []
-        for idx in range(0, self.pop_size):
-            ## Calculate adaptive parameter cr and f
-            cr = np.random.normal(self.dyn_miu_cr, 0.1)
-            cr = np.clip(cr, 0, 1)
-            while True:
-                f = cauchy.rvs(self.dyn_miu_f, 0.1)
-                if f < 0:
-                    continue
-                elif f > 1:
-                    f = 1
-                break
-            temp_f.append(f)
-            temp_cr.append(cr)
-            top = int(self.pop_size * self.pt)
-            x_best = pop_sorted[np.random.randint(0, top)]
-            x_r1 = self.pop[np.random.choice(list(set(range(0, self.pop_size)) - {idx}))]
-            new_pop = self.pop + self.dyn_pop_archive
-            while True:
-                x_r2 = new_pop[np.random.randint(0, len(new_pop))]
-                if np.any(x_r2[self.ID_POS] - x_r1[self.ID_POS]) and np.any(x_r2[self.ID_POS] - self.pop[idx][self.ID_POS]):
-                    break
-            x_new = self.pop[idx][self.ID_POS] + f * (x_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + f * (x_r1[self.ID_POS] - x_r2[self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-            j_rand = np.random.randint(0, self.problem.n_dims)
-            pos_new[j_rand] = x_new[j_rand]
-            pos_new = self.amend_position_faster(pos_new)
-            pop.append([pos_new, None])
-        pop = self.update_fitness_population(pop)
-
-        for idx in range(0, self.pop_size):
-            if self.compare_agent(pop[idx], self.pop[idx]):
-                self.dyn_pop_archive.append(deepcopy(self.pop[idx]))
-                list_cr.append(temp_cr[idx])
-                list_f.append(temp_f[idx])
-                self.pop[idx] = deepcopy(pop[idx])
-
-        # Randomly remove solution
-        temp = len(self.dyn_pop_archive) - self.pop_size
-        if temp > 0:
-            idx_list = np.random.choice(range(0, len(self.dyn_pop_archive)), temp, replace=False)
-            archive_pop_new = []
-            for idx, solution in enumerate(self.dyn_pop_archive):
-                if idx not in idx_list:
-                    archive_pop_new.append(solution)
-            self.dyn_pop_archive = deepcopy(archive_pop_new)
+        ## Calculate adaptive parameter cr and f of all agents at once
+        list_cr = get_clipped_normal(self.dyn_miu_cr, 0.1, self.pop_size)
+        list_f = get_truncated_cauchy(self.dyn_miu_f, 0.1, self.pop_size)
+        list_pos = self.get_position_matrix(self.pop)
+        list_fit = self.get_list_target(self.pop)
+        top = max(int(self.pop_size * self.pt), 1)
+        list_best = get_ranked_index(list_fit, self.problem.minmax == "max")[np.random.randint(0, top, self.pop_size)]
+        pos_new = get_current_to_pbest_trials(list_pos, list_best, list_f, list_cr, self.dyn_pop_archive[:self.dyn_archive_size])
+        pos_new = self.amend_position_faster(pos_new)
+        pop = self.update_fitness_population([[pos, None] for pos in pos_new])
+
+        ## Same rule as compare_agent(): the trial wins if it is better (or equal in a maximization problem)
+        list_fit_new = self.get_list_target(pop)
+        list_success = np.nonzero(list_fit_new < list_fit if self.problem.minmax == "min" else ~(list_fit_new < list_fit))[0]
+        self.dyn_archive_size = add_to_archive(self.dyn_pop_archive, self.dyn_archive_size, list_pos[list_success])
+        for idx in list_success:
+            self.pop[idx] = pop[idx]
 
         # Update miu_cr and miu_f
-        if len(list_cr) == 0:
+        if len(list_success) == 0:
             self.dyn_miu_cr = (1 - self.ap) * self.dyn_miu_cr + self.ap * 0.5
-        else:
-            self.dyn_miu_cr = (1 - self.ap) * self.dyn_miu_cr + self.ap * np.mean(np.array(list_cr))
-        if len(list_f) == 0:
             self.dyn_miu_f = (1 - self.ap) * self.dyn_miu_f + self.ap * 0.5
         else:
-            self.dyn_miu_f = (1 - self.ap) * self.dyn_miu_f + self.ap * self.lehmer_mean(np.array(list_f))
-        return pop
+            self.dyn_miu_cr = (1 - self.ap) * self.dyn_miu_cr + self.ap * np.mean(list_cr[list_success])
+            self.dyn_miu_f = (1 - self.ap) * self.dyn_miu_f + self.ap * self.lehmer_mean(list_f[list_success])
 
 
 class SADE(Optimizer):
@@ -263,7 +255,7 @@ class SADE(Optimizer):
                     f = 1
                 break
 
-            id1, id2, id3 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
+            id1, id2, id3 = self.get_index_distinct_random(3, idx)
             if np.random.rand() < self.p1:
                 x_new = self.pop[id1][self.ID_POS] + f * (self.pop[id2][self.ID_POS] - self.pop[id3][self.ID_POS])
                 pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
@@ -287,14 +279,14 @@ class SADE(Optimizer):
             if list_probability[idx]:
                 if self.compare_agent(pop[idx], self.pop[idx]):
                     self.ns1 += 1
-                    self.pop[idx] = deepcopy(pop[idx])
+                    self.pop[idx] = pop[idx]
                 else:
                     self.nf1 += 1
             else:
                 if self.compare_agent(pop[idx], self.pop[idx]):
                     self.ns2 += 1
                     self.dyn_list_cr.append(list_cr[idx])
-                    self.pop[idx] = deepcopy(pop[idx])
+                    self.pop[idx] = pop[idx]
                 else:
                     self.nf2 += 1
 
@@ -333,7 +325,8 @@ class SHADE(Optimizer):
         # Dynamic variable
         self.dyn_miu_f = miu_f * np.ones(self.pop_size)     # list the initial f,
         self.dyn_miu_cr = miu_cr * np.ones(self.pop_size)   # list the initial cr,
-        self.dyn_pop_archive = list()
+        self.dyn_pop_archive = np.zeros((self.pop_size, self.problem.n_dims))   # The positions of the archive
+        self.dyn_archive_size = 0                                               # Number of saved positions
         self.k_counter = 0
 
     ### Survivor Selection
@@ -347,87 +340,40 @@ class SHADE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        list_f = list()
-        list_cr = list()
-        list_f_index = list()
-        list_cr_index = list()
-
-        list_f_new = np.ones(self.pop_size)
-        list_cr_new = np.ones(self.pop_size)
-        pop_old = deepcopy(self.pop)
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-
-        pop = []
-        for idx in range(0, self.pop_size):
-            ## Calculate adaptive parameter cr and f
-            idx_rand = np.random.randint(0, self.pop_size)
-            cr = np.random.normal(self.dyn_miu_cr[idx_rand], 0.1)
-            cr = np.clip(cr, 0, 1)
-            while True:
-                f = cauchy.rvs(self.dyn_miu_f[idx_rand], 0.1)
-                if f < 0:
-                    continue
-                elif f > 1:
-                    f = 1
-                break
-            list_cr_new[idx] = cr
-            list_f_new[idx] = f
-            p = np.random.uniform(2 / self.pop_size, 0.2)
-            top = int(self.pop_size * p)
-            x_best = pop_sorted[np.random.randint(0, top)]
-            x_r1 = self.pop[np.random.choice(list(set(range(0, self.pop_size)) - {idx}))]
-            new_pop = self.pop + self.dyn_pop_archive
-            while True:
-                x_r2 = new_pop[np.random.randint(0, len(new_pop))]
-                if np.any(x_r2[self.ID_POS] - x_r1[self.ID_POS]) and np.any(x_r2[self.ID_POS] - self.pop[idx][self.ID_POS]):
-                    break
-            x_new = self.pop[idx][self.ID_POS] + f * (x_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + f * (x_r1[self.ID_POS] - x_r2[self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-            j_rand = np.random.randint(0, self.problem.n_dims)
-            pos_new[j_rand] = x_new[j_rand]
-            pos_new = self.amend_position_faster(pos_new)
-            pop.append([pos_new, None])
-        pop = self.update_fitness_population(pop)
-
-        for i in range(0, self.pop_size):
-            if self.compare_agent(pop[i], self.pop[i]):
-                list_cr.append(list_cr_new[i])
-                list_f.append(list_f_new[i])
-                list_f_index.append(i)
-                list_cr_index.append(i)
-                self.pop[i] = deepcopy(pop[i])
-                self.dyn_pop_archive.append(deepcopy(pop[i]))
-
-        # Randomly remove solution
-        temp = len(self.dyn_pop_archive) - self.pop_size
-        if temp > 0:
-            idx_list = np.random.choice(range(0, len(self.dyn_pop_archive)), temp, replace=False)
-            archive_pop_new = []
-            for idx, solution in enumerate(self.dyn_pop_archive):
-                if idx not in idx_list:
-                    archive_pop_new.append(solution)
-            self.dyn_pop_archive = deepcopy(archive_pop_new)
+        ## Calculate adaptive parameter cr and f of all agents at once, from random cells of the memory
+        list_idx_rand = np.random.randint(0, len(self.dyn_miu_f), self.pop_size)
+        list_cr = get_clipped_normal(self.dyn_miu_cr[list_idx_rand], 0.1, self.pop_size)
+        list_f = get_truncated_cauchy(self.dyn_miu_f[list_idx_rand], 0.1, self.pop_size)
+        list_pos = self.get_position_matrix(self.pop)
+        list_fit = self.get_list_target(self.pop)
+        list_top = np.maximum((self.pop_size * np.random.uniform(2 / self.pop_size, 0.2, self.pop_size)).astype(int), 1)
+        list_ranked = get_ranked_index(list_fit, self.problem.minmax == "max")
+        list_best = list_ranked[(np.random.uniform(0, 1, self.pop_size) * list_top).astype(int)]
+        pos_new = get_current_to_pbest_trials(list_pos, list_best, list_f, list_cr, self.dyn_pop_archive[:self.dyn_archive_size])
+        pos_new = self.amend_position_faster(pos_new)
+        pop = self.update_fitness_population([[pos, None] for pos in pos_new])
+
+        ## Same rule as compare_agent(): the trial wins if it is better (or equal in a maximization problem)
+        list_fit_new = self.get_list_target(pop)
+        list_success = np.nonzero(list_fit_new < list_fit if self.problem.minmax == "min" else ~(list_fit_new < list_fit))[0]
+        ## The archive keeps the replaced parents
+        self.dyn_archive_size = add_to_archive(self.dyn_pop_archive, self.dyn_archive_size, list_pos[list_success])
+        for idx in list_success:
+            self.pop[idx] = pop[idx]
 
         # Update miu_cr and miu_f
-        if len(list_f) != 0 and len(list_cr) != 0:
+        if len(list_success) != 0:
             # Eq.13, 14, 10
-            list_fit_old = np.ones(len(list_cr_index))
-            list_fit_new = np.ones(len(list_cr_index))
-            idx_increase = 0
-            for i in range(0, self.pop_size):
-                if i in list_cr_index:
-                    list_fit_old[idx_increase] = pop_old[i][self.ID_FIT][self.ID_TAR]
-                    list_fit_new[idx_increase] = self.pop[i][self.ID_FIT][self.ID_TAR]
-                    idx_increase += 1
-            temp = sum(abs(list_fit_new - list_fit_old))
+            list_delta = np.abs(list_fit_new[list_success] - list_fit[list_success])
+            temp = np.sum(list_delta)
             if temp == 0:
-                list_weights = 1.0/len(list_fit_new) * np.ones(len(list_fit_new))
+                list_weights = 1.0 / len(list_delta) * np.ones(len(list_delta))
             else:
-                list_weights = abs(list_fit_new - list_fit_old) / temp
-            self.dyn_miu_cr[self.k_counter] = sum(list_weights * np.array(list_cr))
-            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(np.array(list_f), list_weights)
+                list_weights = list_delta / temp
+            self.dyn_miu_cr[self.k_counter] = np.sum(list_weights * list_cr[list_success])
+            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(list_f[list_success], list_weights)
             self.k_counter += 1
-            if self.k_counter >= self.pop_size:
+            if self.k_counter >= len(self.dyn_miu_f):
                 self.k_counter = 0
 
 
@@ -456,10 +402,11 @@ class L_SHADE(Optimizer):
         # Dynamic variable
         self.dyn_miu_f = miu_f * np.ones(self.pop_size)  # list the initial f,
         self.dyn_miu_cr = miu_cr * np.ones(self.pop_size)  # list the initial cr,
-        self.dyn_pop_archive = list()
+        self.dyn_pop_archive = np.zeros((self.pop_size, self.problem.n_dims))   # The positions of the archive
+        self.dyn_archive_size = 0                                               # Number of saved positions
         self.dyn_pop_size = self.pop_size
         self.k_counter = 0
-        self.n_min = int(self.pop_size / 5)
+        self.n_min = max(int(self.pop_size / 5), 4)     # DE/current-to-pbest/1 needs at least 4 agents
 
     ### Survivor Selection
     def weighted_lehmer_mean(self, list_objects, list_weights):
@@ -472,88 +419,49 @@ class L_SHADE(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        list_f = list()
-        list_cr = list()
-        list_f_index = list()
-        list_cr_index = list()
-
-        list_f_new = np.ones(self.pop_size)
-        list_cr_new = np.ones(self.pop_size)
-        pop_old = deepcopy(self.pop)
-        pop_sorted = self.get_sorted_strim_population(self.pop)
-
-        pop = []
-        for idx in range(0, self.pop_size):
-            ## Calculate adaptive parameter cr and f
-            idx_rand = np.random.randint(0, self.pop_size)
-            cr = np.random.normal(self.dyn_miu_cr[idx_rand], 0.1)
-            cr = np.clip(cr, 0, 1)
-            while True:
-                f = cauchy.rvs(self.dyn_miu_f[idx_rand], 0.1)
-                if f < 0:
-                    continue
-                elif f > 1:
-                    f = 1
-                break
-            list_cr_new[idx] = cr
-            list_f_new[idx] = f
-            p = np.random.uniform(0.15, 0.2)
-            top = int(self.dyn_pop_size * p)
-            x_best = pop_sorted[np.random.randint(0, top)]
-            x_r1 = self.pop[np.random.choice(list(set(range(0, self.dyn_pop_size)) - {idx}))]
-            new_pop = self.pop + self.dyn_pop_archive
-            while True:
-                x_r2 = new_pop[np.random.randint(0, len(new_pop))]
-                if np.any(x_r2[self.ID_POS] - x_r1[self.ID_POS]) and np.any(x_r2[self.ID_POS] - self.pop[idx][self.ID_POS]):
-                    break
-            x_new = self.pop[idx][self.ID_POS] + f * (x_best[self.ID_POS] - self.pop[idx][self.ID_POS]) + f * (x_r1[self.ID_POS] - x_r2[self.ID_POS])
-            pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < cr, x_new, self.pop[idx][self.ID_POS])
-            j_rand = np.random.randint(0, self.problem.n_dims)
-            pos_new[j_rand] = x_new[j_rand]
-            pos_new = self.amend_position_faster(pos_new)
-            pop.append([pos_new, None])
-        pop = self.update_fitness_population(pop)
-
-        for i in range(0, self.pop_size):
-            if self.compare_agent(pop[i], self.pop[i]):
-                list_cr.append(list_cr_new[i])
-                list_f.append(list_f_new[i])
-                list_f_index.append(i)
-                list_cr_index.append(i)
-                self.pop[i] = deepcopy(pop[i])
-                self.dyn_pop_archive.append(deepcopy(self.pop[i]))
-
-        # Randomly remove solution
-        temp = len(self.dyn_pop_archive) - self.pop_size
-        if temp > 0:
-            idx_list = np.random.choice(range(0, len(self.dyn_pop_archive)), temp, replace=False)
-            archive_pop_new = []
-            for idx, solution in enumerate(self.dyn_pop_archive):
-                if idx not in idx_list:
-                    archive_pop_new.append(solution)
-            self.dyn_pop_archive = deepcopy(archive_pop_new)
+        ## The population really has dyn_pop_size agents, all arrays of the epoch get smaller with it
+        pop_size = len(self.pop)
+        list_idx_rand = np.random.randint(0, len(self.dyn_miu_f), pop_size)
+        list_cr = get_clipped_normal(self.dyn_miu_cr[list_idx_rand], 0.1, pop_size)
+        list_f = get_truncated_cauchy(self.dyn_miu_f[list_idx_rand], 0.1, pop_size)
+        list_pos = self.get_position_matrix(self.pop)
+        list_fit = self.get_list_target(self.pop)
+        list_top = np.maximum((pop_size * np.random.uniform(0.15, 0.2, pop_size)).astype(int), 1)
+        list_ranked = get_ranked_index(list_fit, self.problem.minmax == "max")
+        list_best = list_ranked[(np.random.uniform(0, 1, pop_size) * list_top).astype(int)]
+        pos_new = get_current_to_pbest_trials(list_pos, list_best, list_f, list_cr, self.dyn_pop_archive[:self.dyn_archive_size])
+        pos_new = self.amend_position_faster(pos_new)
+        pop = self.update_fitness_population([[pos, None] for pos in pos_new])
+
+        ## Same rule as compare_agent(): the trial wins if it is better (or equal in a maximization problem)
+        list_fit_new = self.get_list_target(pop)
+        list_success = np.nonzero(list_fit_new < list_fit if self.problem.minmax == "min" else ~(list_fit_new < list_fit))[0]
+        ## The archive keeps the replaced parents, its capacity is the current population size
+        self.dyn_archive_size = add_to_archive(self.dyn_pop_archive, self.dyn_archive_size, list_pos[list_success], self.dyn_pop_size)
+        for idx in list_success:
+            self.pop[idx] = pop[idx]
 
         # Update miu_cr and miu_f
-        if len(list_f) != 0 and len(list_cr) != 0:
+        if len(list_success) != 0:
             # Eq.13, 14, 10
-            list_fit_old = np.ones(len(list_cr_index))
-            list_fit_new = np.ones(len(list_cr_index))
-            idx_increase = 0
-            for i in range(0, self.dyn_pop_size):
-                if i in list_cr_index:
-                    list_fit_old[idx_increase] = pop_old[i][self.ID_FIT][self.ID_TAR]
-                    list_fit_new[idx_increase] = self.pop[i][self.ID_FIT][self.ID_TAR]
-                    idx_increase += 1
-            total_fit = sum(np.abs(list_fit_new - list_fit_old))
-            list_weights = 0 if total_fit == 0 else np.abs(list_fit_new - list_fit_old) / total_fit
-            self.dyn_miu_cr[self.k_counter] = sum(list_weights * np.array(list_cr))
-            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(np.array(list_f), list_weights)
+            list_delta = np.abs(list_fit_new[list_success] - list_fit[list_success])
+            total_fit = np.sum(list_delta)
+            if total_fit == 0:
+                list_weights = 1.0 / len(list_delta) * np.ones(len(list_delta))
+            else:
+                list_weights = list_delta / total_fit
+            self.dyn_miu_cr[self.k_counter] = np.sum(list_weights * list_cr[list_success])
+            self.dyn_miu_f[self.k_counter] = self.weighted_lehmer_mean(list_f[list_success], list_weights)
             self.k_counter += 1
-            if self.k_counter >= self.dyn_pop_size:
+            if self.k_counter >= len(self.dyn_miu_f):
                 self.k_counter = 0
 
-        # Linear Population Size Reduction
-        self.dyn_pop_size = round(self.pop_size + epoch * ((self.n_min - self.pop_size) / self.epoch))
+        # Linear Population Size Reduction: the worst agents are removed, and the random ones of the archive
+        self.dyn_pop_size = round(self.pop_size + (epoch + 1) * ((self.n_min - self.pop_size) / self.epoch))
+        if self.dyn_pop_size < len(self.pop):
+            self.pop = self.get_sorted_strim_population(self.pop, self.dyn_pop_size)
+            self.dyn_archive_size = resize_archive(self.dyn_pop_archive, self.dyn_archive_size, self.dyn_pop_size)
+        self.nfe_per_epoch = self.dyn_pop_size
 
 
 class SAP_DE(Optimizer):
@@ -622,7 +530,7 @@ class SAP_DE(Optimizer):
         pop = []
         for idx in range(0, self.pop_size):
             # Choose 3 random element and different to idx
-            idxs = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
+            idxs = self.get_index_distinct_random(3, idx)
             j = np.random.randint(0, self.pop_size)
             self.F = np.random.uniform(0, 1)
 
@@ -640,7 +548,7 @@ class SAP_DE(Optimizer):
                 mr_new = self.edit_to_range(mr_new, 0, 1, np.random.random)
                 pop.append([pos_new, None, cr_new, mr_new, ps_new])
             else:
-                pop.append(deepcopy(self.pop[idx]))
+                pop.append(self.copy_agent(self.pop[idx]))
             ## Mutation
             if np.random.uniform(0, 1) < self.pop[idxs[0]][self.ID_MR]:
                 pos_new = self.pop[idx][self.ID_POS] + np.random.normal(0, self.pop[idxs[0]][self.ID_MR])
@@ -74,6 +74,21 @@ class BaseES(Optimizer):
         child = self.update_fitness_population(child)
         self.pop = self.get_sorted_strim_population(child + self.pop, self.pop_size)
 
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        size = (self.n_child, self.problem.n_dims)
+        list_pos = self.get_position_matrix(self.pop[:self.n_child])
+        list_strategy = np.array([agent[self.ID_STR] for agent in self.pop[:self.n_child]])
+        pos_new = self.amend_position_faster(list_pos + list_strategy * np.random.normal(0, 1.0, size))
+        tau = np.sqrt(2.0 * self.problem.n_dims) ** -1.0
+        tau_p = np.sqrt(2.0 * np.sqrt(self.problem.n_dims)) ** -1.0
+        strategy = np.exp(tau_p * np.random.normal(0, 1.0, size) + tau * np.random.normal(0, 1.0, size))
+        child = self.update_fitness_population([[pos_new[idx], None, strategy[idx]] for idx in range(0, self.n_child)])
+        self.pop = self.get_sorted_strim_population(child + self.pop, self.pop_size)
+
 
 class LevyES(BaseES):
     """
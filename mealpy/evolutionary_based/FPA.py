@@ -46,7 +46,7 @@ class BaseFPA(Optimizer):
                 pos_new = self.pop[idx][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * \
                           levy * (self.pop[idx][self.ID_POS] - self.g_best[self.ID_POS])
             else:
-                id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+                id1, id2 = self.get_index_distinct_random(2, idx)
                 pos_new = self.pop[idx][self.ID_POS] + np.random.uniform() * (self.pop[id1][self.ID_POS] - self.pop[id2][self.ID_POS])
             pos_new = self.amend_position_random(pos_new)
             pop.append([pos_new, None])
@@ -44,12 +44,12 @@ class BaseGA(Optimizer):
         """
         # c1, c2 = self._get_parents_kway_tournament_selection__(pop, k_way=0.2)
         list_fitness = np.array([agent[self.ID_FIT][self.ID_TAR] for agent in self.pop])
+        ### Selection, all parents at once
+        list_id_parents = self.get_index_roulette_wheel_selection(list_fitness, n_select=2 * self.pop_size).reshape((self.pop_size, 2))
         pop = []
         for i in range(0, self.pop_size):
-            ### Selection
             # c1, c2 = self._get_parents_kway_tournament_selection__(pop, k_way=0.2)
-            id_c1 = self.get_index_roulette_wheel_selection(list_fitness)
-            id_c2 = self.get_index_roulette_wheel_selection(list_fitness)
+            id_c1, id_c2 = list_id_parents[i]
 
             w1 = self.pop[id_c1][self.ID_POS]
             w2 = self.pop[id_c2][self.ID_POS]
@@ -8,8 +8,8 @@
 # ------------------------------------------------------------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 from mealpy.optimizer import Optimizer
+from mealpy.utils.genome import BitGenome
 
 
 class BaseMA(Optimizer):
@@ -22,6 +22,9 @@ class BaseMA(Optimizer):
     """
     ID_BIT = 2
 
+    ## The genome operators are created again from the parameters by the model which resumes a run
+    CHECKPOINT_EXCLUDED = Optimizer.CHECKPOINT_EXCLUDED + ("genome",)
+
     def __init__(self, problem, epoch=10000, pop_size=100, pc=0.85, pm=0.15,
                  p_local=0.5, max_local_gens=20, bits_per_param=16, **kwargs):
         """
@@ -46,12 +49,14 @@ class BaseMA(Optimizer):
         self.max_local_gens = max_local_gens
         self.bits_per_param = bits_per_param
         self.bits_total = self.problem.n_dims * self.bits_per_param
+        self.genome = BitGenome(self.problem.n_dims, self.bits_per_param, self.problem.lb, self.problem.ub)
 
     def create_solution(self):
         """
         Returns:
             The position position with 2 element: index of position/location and index of fitness wrapper
             The general format: [position, [target, [obj1, obj2, ...]], bitstring]
+            The bitstring is packed in a numpy uint8 array (8 bits per byte), see BitGenome
 
         ## To get the position, fitness wrapper, target and obj list
         ##      A[self.ID_POS]                  --> Return: position
@@ -61,66 +66,37 @@ class BaseMA(Optimizer):
         """
         position = np.random.uniform(self.problem.lb, self.problem.ub)
         fitness = self.get_fitness_position(position=position)
-        bitstring = ''.join(["1" if np.random.uniform() < 0.5 else "0" for _ in range(0, self.bits_total)])
+        bitstring = self.genome.create(1)[0]
         return [position, fitness, bitstring]
 
     def _decode(self, bitstring=None):
         """
-        Decode the random bitstring into real number
+        Decode the packed bitstrings into real numbers
         Args:
-            bitstring (str): "11000000100101000101010" - bits_per_param = 16, 32 bit for 2 variable. eg. x1 and x2
+            bitstring (nd.array): packed bitstrings (n_genomes, n_bytes), bits_per_param = 16, 32 bit for 2 variable. eg. x1 and x2
 
         Returns:
-            list of real number (vector)
+            real numbers (n_genomes, n_dims)
         """
-        vector = np.ones(self.problem.n_dims)
-        for idx in range(0, self.problem.n_dims):
-            param = bitstring[idx * self.bits_per_param: (idx + 1) * self.bits_per_param]  # Select 16 bit every time
-            vector[idx] = self.problem.lb[idx] + ((self.problem.ub[idx] - self.problem.lb[idx]) / ((2.0 ** self.bits_per_param) - 1)) * int(param, 2)
-        return vector
+        return self.genome.decode(bitstring)
 
     def _crossover(self, dad=None, mom=None):
-        if np.random.uniform() >= self.pc:
-            temp = deepcopy([dad])
-            return temp[0]
-        else:
-            child = ""
-            for idx in range(0, self.bits_total):
-                if np.random.uniform() < 0.5:
-                    child += dad[idx]
-                else:
-                    child += mom[idx]
-            return child
+        return self.genome.crossover(dad, mom, self.pc)
 
     def _point_mutation(self, bitstring=None):
-        child = ""
-        for bit in bitstring:
-            if np.random.uniform() < self.pc:
-                child += "0" if bit == "1" else "1"
-            else:
-                child += bit
-        return child
+        return self.genome.mutate(bitstring, self.pc)
 
-    def _bits_climber(self, child=None):
-        current = deepcopy(child)
+    def _bits_climber(self, pop=None):
+        ## All agents climb at the same time, the candidates of each step are evaluated in a single batch
+        current = [self.copy_agent(agent) for agent in pop]
         for idx in range(0, self.max_local_gens):
-            child = deepcopy(current)
-            bitstring_new = self._point_mutation(child[self.ID_BIT])
-            pos_new = self._decode(bitstring_new)
-            fit_new = self.get_fitness_position(pos_new)
-            current = self.get_better_solution(child, [pos_new, fit_new, bitstring_new])
+            list_bits = self._point_mutation(np.array([agent[self.ID_BIT] for agent in current]))
+            list_pos = self._decode(list_bits)
+            pop_new = [[list_pos[jdx], None, list_bits[jdx]] for jdx in range(0, len(current))]
+            pop_new = self.update_fitness_population(pop_new)
+            current = [self.get_better_solution(current[jdx], pop_new[jdx]) for jdx in range(0, len(current))]
         return current
 
-    def create_child(self, idx, pop_copy):
-        ancient = pop_copy[idx + 1] if idx % 2 == 0 else pop_copy[idx - 1]
-        if idx == self.pop_size - 1:
-            ancient = pop_copy[0]
-        bitstring_new = self._crossover(pop_copy[idx][self.ID_BIT], ancient[self.ID_BIT])
-        bitstring_new = self._point_mutation(bitstring_new)
-        pos_new = self._decode(bitstring_new)
-        fit_new = self.get_fitness_position(pos_new)
-        return [pos_new, fit_new, bitstring_new]
-
     def evolve(self, epoch):
         """
         Args:
@@ -128,21 +104,22 @@ class BaseMA(Optimizer):
         """
         nfe_epoch = self.pop_size
         ## Binary tournament
-        children = [self.get_solution_kway_tournament_selection(self.pop, k_way=2, output=1)[0] for _ in range(self.pop_size)]
-        pop = []
-        for idx in range(0, self.pop_size):
-            ancient = children[idx + 1] if idx % 2 == 0 else children[idx - 1]
-            if idx == self.pop_size - 1:
-                ancient = children[0]
-            bitstring_new = self._crossover(children[idx][self.ID_BIT], ancient[self.ID_BIT])
-            bitstring_new = self._point_mutation(bitstring_new)
-            pos_new = self._decode(bitstring_new)
-            pop.append([pos_new, None, bitstring_new])
+        list_fitness = np.array([agent[self.ID_FIT][self.ID_TAR] for agent in self.pop])
+        children = [self.pop[idx] for idx in self.get_index_kway_tournament_selection(list_fitness, k_way=2, n_select=self.pop_size)]
+        list_ancient = [idx + 1 if idx % 2 == 0 else idx - 1 for idx in range(0, self.pop_size)]
+        list_ancient[-1] = 0
+        list_bits = np.array([agent[self.ID_BIT] for agent in children])
+        list_bits = self._crossover(list_bits, list_bits[list_ancient])
+        list_bits = self._point_mutation(list_bits)
+        list_pos = self._decode(list_bits)
+        pop = [[list_pos[idx], None, list_bits[idx]] for idx in range(0, self.pop_size)]
         self.pop = self.update_fitness_population(pop)
 
         # Searching in local
-        for i in range(0, self.pop_size):
-            if np.random.rand() < self.p_local:
-                self.pop[i] = self._bits_climber(pop[i])
-                nfe_epoch += self.max_local_gens
+        list_idx = np.where(np.random.rand(self.pop_size) < self.p_local)[0]
+        if len(list_idx) > 0:
+            pop_local = self._bits_climber([self.pop[idx] for idx in list_idx])
+            for idx, agent in zip(list_idx, pop_local):
+                self.pop[idx] = agent
+            nfe_epoch += len(list_idx) * self.max_local_gens
         self.nfe_per_epoch = nfe_epoch
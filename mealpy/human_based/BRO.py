@@ -8,9 +8,8 @@
 # ------------------------------------------------------------------------------------------------------%
 
 import numpy as np
-from scipy.spatial.distance import cdist
-from copy import deepcopy
 from mealpy.optimizer import Optimizer
+from mealpy.utils.distance import NearestNeighbourIndex
 
 
 class BaseBRO(Optimizer):
@@ -20,6 +19,7 @@ class BaseBRO(Optimizer):
         Link:
             https://doi.org/10.1007/s00521-020-05004-4
     """
+    SUPPORT_PARALLEL = False
     ID_DAM = 2
 
     def __init__(self, problem, epoch=10000, pop_size=100, threshold=3, **kwargs):
@@ -60,13 +60,9 @@ class BaseBRO(Optimizer):
         damage = 0
         return [position, fitness, damage]
 
-    def find_argmin_distance(self, target_pos=None, pop=None):
-        list_pos = np.array([pop[idx][self.ID_POS] for idx in range(0, self.pop_size)])
-        target_pos = np.reshape(target_pos, (1, -1))
-        dist_list = cdist(list_pos, target_pos, 'euclidean')
-        dist_list = np.reshape(dist_list, (-1))
-        idx = np.argmin(dist_list[np.nonzero(dist_list)])
-        return idx
+    def create_neighbour_index(self):
+        ## Nearest soldiers of the whole epoch, it is updated each time a soldier moves
+        return NearestNeighbourIndex(np.array([agent[self.ID_POS] for agent in self.pop]))
 
     def evolve(self, epoch):
         """
@@ -74,9 +70,12 @@ class BaseBRO(Optimizer):
             epoch (int): The current iteration
         """
         nfe_epoch = 0
+        index = self.create_neighbour_index()
         for i in range(self.pop_size):
             # Compare ith soldier with nearest one (jth)
-            j = self.find_argmin_distance(self.pop[i][self.ID_POS], self.pop)
+            j = index.query(self.pop[i][self.ID_POS])
+            if j is None:       # All soldiers at the same position
+                continue
             if self.compare_agent(self.pop[i], self.pop[j]):
                 ## Update Winner based on global best solution
                 pos_new = self.pop[i][self.ID_POS] + np.random.uniform() * \
@@ -84,30 +83,32 @@ class BaseBRO(Optimizer):
                 fit_new = self.get_fitness_position(pos_new)
                 dam_new = self.pop[i][self.ID_DAM] - 1  ## Substract damaged hurt -1 to go next battle
                 self.pop[i] = [pos_new, fit_new, dam_new]
+                index.update(i, pos_new)
                 ## Update Loser
                 if self.pop[j][self.ID_DAM] < self.threshold:  ## If loser not dead yet, move it based on general
                     pos_new = np.random.uniform() * (np.maximum(self.pop[j][self.ID_POS], self.g_best[self.ID_POS]) -
                                                        np.minimum(self.pop[j][self.ID_POS], self.g_best[self.ID_POS])) + \
                                           np.maximum(self.pop[j][self.ID_POS], self.g_best[self.ID_POS])
                     dam_new = self.pop[j][self.ID_DAM] + 1
-
-                    self.pop[j][self.ID_FIT] = self.get_fitness_position(self.pop[j][self.ID_POS])
                 else:  ## Loser dead and respawn again
                     pos_new = np.random.uniform(self.problem.lb, self.problem.ub)
                     dam_new = 0
                 pos_new = self.amend_position_faster(pos_new)
                 fit_new = self.get_fitness_position(pos_new)
                 self.pop[j] = [pos_new, fit_new, dam_new]
+                index.update(j, pos_new)
                 nfe_epoch += 2
             else:
                 ## Update Loser by following position of Winner
-                self.pop[i] = deepcopy(self.pop[j])
+                self.pop[i] = self.pop[j]     # The old agent j is only referenced by i after j is replaced below
+                index.update(i, self.pop[j][self.ID_POS])
                 ## Update Winner by following position of General to protect the King and General
                 pos_new = self.pop[j][self.ID_POS] + np.random.uniform() * (self.g_best[self.ID_POS] - self.pop[j][self.ID_POS])
                 pos_new = self.amend_position_faster(pos_new)
                 fit_new = self.get_fitness_position(pos_new)
                 dam_new = 0
                 self.pop[j] = [pos_new, fit_new, dam_new]
+                index.update(j, pos_new)
                 nfe_epoch += 1
         self.nfe_per_epoch = nfe_epoch
         if epoch >= self.dyn_delta:  # max_epoch = 1000 -> delta = 300, 450, >500,....
@@ -144,9 +145,12 @@ class OriginalBRO(BaseBRO):
         Args:
             epoch (int): The current iteration
         """
+        index = self.create_neighbour_index()
         for i in range(self.pop_size):
             # Compare ith soldier with nearest one (jth)
-            j = self.find_argmin_distance(self.pop[i][self.ID_POS], self.pop)
+            j = index.query(self.pop[i][self.ID_POS])
+            if j is None:       # All soldiers at the same position
+                continue
             dam, vic = i, j  ## This error in the algorithm's flow in the paper, But in the matlab code, he changed.
             if self.compare_agent(self.pop[i], self.pop[j]):
                 dam, vic = j, i  ## The mistake also here in the paper.
@@ -161,6 +165,7 @@ class OriginalBRO(BaseBRO):
                 self.pop[vic][self.ID_DAM] = 0
             else:
                 self.pop[dam] = self.create_solution()
+            index.update(dam, self.pop[dam][self.ID_POS])
         if epoch >= self.dyn_delta:
             pos_list = np.array([self.pop[idx][self.ID_POS] for idx in range(0, self.pop_size)])
             pos_std = np.std(pos_list, axis=0)
@@ -53,7 +53,7 @@ class ImprovedBSO(Optimizer):
     def _find_cluster(self, pop_group):
         centers = []
         for i in range(0, self.m_clusters):
-            _, local_best = self.get_global_best_solution(pop_group[i])
+            _, local_best = self.get_global_best_solution(pop_group[i], sort=False)
             centers.append(deepcopy(local_best))
         return centers
 
@@ -67,7 +67,7 @@ class ImprovedBSO(Optimizer):
         self.pop = self.create_population(self.pop_size)
         self.pop_group = self._make_group(self.pop)
         self.centers = self._find_cluster(self.pop_group)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
 
     def evolve(self, epoch):
         """
@@ -103,7 +103,7 @@ class ImprovedBSO(Optimizer):
                               epxilon * np.random.uniform()
             pos_new = self.amend_position_random(pos_new)
             pop_group[cluster_id][location_id] = [pos_new, None]
-        pop_group = [self.update_fitness_population(group) for group in pop_group]
+        pop_group = self.update_fitness_groups(pop_group)
         for idx in range(0, self.m_clusters):
             self.pop_group[idx] = self.greedy_selection_population(self.pop_group[idx], pop_group[idx])
 
@@ -182,7 +182,7 @@ class BaseBSO(ImprovedBSO):
                               epxilon * np.random.normal(self.miu, self.xichma)
             pos_new = self.amend_position_random(pos_new)
             pop_group[cluster_id][location_id] = [pos_new, None]
-        pop_group = [self.update_fitness_population(group) for group in pop_group]
+        pop_group = self.update_fitness_groups(pop_group)
         for idx in range(0, self.m_clusters):
             self.pop_group[idx] = self.greedy_selection_population(self.pop_group[idx], pop_group[idx])
 
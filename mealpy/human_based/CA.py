@@ -40,10 +40,10 @@ class OriginalCA(Optimizer):
         self.dyn_accepted_num = int(self.accepted_rate * self.pop_size)
         # update situational knowledge (g_best here is a element inside belief space)
 
-    def create_faithful(self, lb, ub):
-        position = np.random.uniform(lb, ub)
-        fitness = self.get_fitness_position(position=position)
-        return [position, fitness]
+    def create_faithful(self, lb, ub, n_faithful=1):
+        ## The faithful agents are sampled from the belief space and evaluated in a single batch
+        list_pos = np.random.uniform(lb, ub, (n_faithful, self.problem.n_dims))
+        return self.update_fitness_population([[pos, None] for pos in list_pos])
 
     def update_belief_space(self, belief_space, pop_accepted):
         pos_list = np.array([solution[self.ID_POS] for solution in pop_accepted])
@@ -57,7 +57,7 @@ class OriginalCA(Optimizer):
             epoch (int): The current iteration
         """
         # create next generation
-        pop_child = [self.create_faithful(self.dyn_belief_space["lb"], self.dyn_belief_space["ub"]) for _ in range(0, self.pop_size)]
+        pop_child = self.create_faithful(self.dyn_belief_space["lb"], self.dyn_belief_space["ub"], self.pop_size)
 
         # select next generation
         pop_new = []
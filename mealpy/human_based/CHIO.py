@@ -41,7 +41,7 @@ class OriginalCHIO(Optimizer):
 
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
 
         self.immunity_type_list = np.random.randint(0, 3, self.pop_size)  # Randint [0, 1, 2]
         self.age_list = np.zeros(self.pop_size)  # Control the age of each position
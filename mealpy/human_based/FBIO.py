@@ -54,7 +54,7 @@ class BaseFBIO(Optimizer):
         pop_new = []
         for idx in range(0, self.pop_size):
             n_change = np.random.randint(0, self.problem.n_dims)
-            nb1, nb2 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+            nb1, nb2 = self.get_index_distinct_random(2, idx)
             # Eq.(2) in FBI Inspired Meta - Optimization
             pos_a = deepcopy(self.pop[idx][self.ID_POS])
             pos_a[n_change] = self.pop[idx][self.ID_POS][n_change] + np.random.normal() * (self.pop[idx][self.ID_POS][n_change] -
@@ -70,7 +70,7 @@ class BaseFBIO(Optimizer):
         pop_child = []
         for idx in range(0, self.pop_size):
             if np.random.rand() > prob[idx]:
-                r1, r2, r3 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
+                r1, r2, r3 = self.get_index_distinct_random(3, idx)
                 ## Remove third loop here, the condition also not good, need to remove also. No need Rnd variable
                 pos_a = deepcopy(pop_new[idx][self.ID_POS])
                 temp = self.g_best[self.ID_POS] + pop_new[r1][self.ID_POS] + np.random.uniform() * (pop_new[r2][self.ID_POS] - pop_new[r3][self.ID_POS])
@@ -98,7 +98,7 @@ class BaseFBIO(Optimizer):
         ## Step B2
         pop_child = []
         for idx in range(0, self.pop_size):
-            rr = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+            rr = self.get_index_distinct_random(idx=idx)
             if self.compare_agent(pop_new[idx], pop_new[rr]):
                 ## Eq.(7) in FBI Inspired Meta-Optimization
                 pos_b = pop_new[idx][self.ID_POS] + np.random.uniform(0, 1, self.problem.n_dims) * (pop_new[rr][self.ID_POS] - pop_new[idx][self.ID_POS]) + \
@@ -148,7 +148,7 @@ class OriginalFBIO(BaseFBIO):
         pop_new = []
         for i in range(0, self.pop_size):
             n_change = np.random.randint(0, self.problem.n_dims)
-            nb1, nb2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+            nb1, nb2 = self.get_index_distinct_random(2, i)
             # Eq.(2) in FBI Inspired Meta - Optimization
             pos_a = deepcopy(self.pop[i][self.ID_POS])
             pos_a[n_change] = self.pop[i][self.ID_POS][n_change] + (np.random.uniform() - 0.5) * 2 * (self.pop[i][self.ID_POS][n_change] -
@@ -165,7 +165,7 @@ class OriginalFBIO(BaseFBIO):
         pop_child = []
         for i in range(0, self.pop_size):
             if np.random.uniform() > prob[i]:
-                r1, r2, r3 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 3, replace=False)
+                r1, r2, r3 = self.get_index_distinct_random(3, i)
                 pos_a = deepcopy(pop_new[i][self.ID_POS])
                 Rnd = np.floor(np.random.uniform() * self.problem.n_dims) + 1
 
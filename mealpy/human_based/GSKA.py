@@ -63,7 +63,7 @@ class BaseGSKA(Optimizer):
 
             if idx < D:  # senior gaining and sharing
                 if np.random.uniform() <= self.kr:
-                    rand_idx = np.random.choice(list(set(range(0, self.pop_size)) - {previ, idx, nexti}))
+                    rand_idx = self.get_index_distinct_random(idx=[previ, idx, nexti])
                     if self.compare_agent(self.pop[rand_idx], self.pop[idx]):
                         pos_new = self.pop[idx][self.ID_POS] + np.random.uniform(0, 1, self.problem.n_dims) * \
                                   (self.pop[previ][self.ID_POS] - self.pop[nexti][self.ID_POS] +
@@ -77,9 +77,9 @@ class BaseGSKA(Optimizer):
                 if np.random.uniform() <= self.kr:
                     id1 = int(self.pb * self.pop_size)
                     id2 = id1 + int(self.pop_size - 2 * 100 * self.pb)
-                    rand_best = np.random.choice(list(set(range(0, id1)) - {idx}))
-                    rand_worst = np.random.choice(list(set(range(id2, self.pop_size)) - {idx}))
-                    rand_mid = np.random.choice(list(set(range(id1, id2)) - {idx}))
+                    rand_best = self.get_index_distinct_random(idx=idx, high=id1)
+                    rand_worst = self.get_index_distinct_random(idx=idx, low=id2)
+                    rand_mid = self.get_index_distinct_random(idx=idx, low=id1, high=id2)
                     if self.compare_agent(self.pop[rand_mid], self.pop[idx]):
                         pos_new = self.pop[idx][self.ID_POS] + np.random.uniform(0, 1, self.problem.n_dims) * \
                                   (self.pop[rand_best][self.ID_POS] - self.pop[rand_worst][self.ID_POS] +
@@ -143,7 +143,7 @@ class OriginalGSKA(Optimizer):
                 previ, nexti = idx - 1, idx + 1
 
             # The random individual is for all dimension values
-            rand_idx = np.random.choice(list(set(range(0, self.pop_size)) - {previ, idx, nexti}))
+            rand_idx = self.get_index_distinct_random(idx=[previ, idx, nexti])
             pos_new = deepcopy(self.pop[idx][self.ID_POS])
 
             for j in range(0, self.problem.n_dims):
@@ -161,9 +161,9 @@ class OriginalGSKA(Optimizer):
                     if np.random.uniform() <= self.kr:
                         id1 = int(self.pb * self.pop_size)
                         id2 = id1 + int(self.pop_size - 2 * 100 * self.pb)
-                        rand_best = np.random.choice(list(set(range(0, id1)) - {idx}))
-                        rand_worst = np.random.choice(list(set(range(id2, self.pop_size)) - {idx}))
-                        rand_mid = np.random.choice(list(set(range(id1, id2)) - {idx}))
+                        rand_best = self.get_index_distinct_random(idx=idx, high=id1)
+                        rand_worst = self.get_index_distinct_random(idx=idx, low=id2)
+                        rand_mid = self.get_index_distinct_random(idx=idx, low=id1, high=id2)
                         if self.compare_agent(self.pop[rand_mid], self.pop[idx]):
                             pos_new[j] = self.pop[idx][self.ID_POS][j] + self.kf * \
                                          (self.pop[rand_best][self.ID_POS][j] - self.pop[rand_worst][self.ID_POS][j] +
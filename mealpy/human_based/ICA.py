@@ -8,7 +8,6 @@
 # ------------------------------------------------------------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 from mealpy.optimizer import Optimizer
 
 
@@ -70,8 +69,8 @@ class BaseICA(Optimizer):
 
         # pop = Empires
         colony_count = self.pop_size - self.empire_count
-        self.pop_empires = deepcopy(self.pop[:self.empire_count])
-        self.pop_colonies = deepcopy(self.pop[self.empire_count:])
+        self.pop_empires = self.copy_population(self.pop[:self.empire_count])
+        self.pop_colonies = self.copy_population(self.pop[self.empire_count:])
 
         cost_empires_list = np.array([solution[self.ID_FIT][self.ID_TAR] for solution in self.pop_empires])
         cost_empires_list_normalized = cost_empires_list - (np.max(cost_empires_list) + np.min(cost_empires_list))
@@ -103,8 +102,8 @@ class BaseICA(Optimizer):
                           np.random.uniform(0, 1, self.problem.n_dims) * (self.pop_empires[idx][self.ID_POS] - colony[self.ID_POS])
                 pos_new = self.amend_position_faster(pos_new)
                 self.empires[idx][idx_colony][self.ID_POS] = pos_new
-            self.empires[idx] = self.update_fitness_population(self.empires[idx])
             # empires[idx], g_best = self.update_global_best_solution(empires[idx], self.ID_MIN_PROB, g_best)
+        self.empires = self.update_fitness_groups(self.empires)
 
         # Revolution
         for idx, colonies in self.empires.items():
@@ -117,15 +116,15 @@ class BaseICA(Optimizer):
                 if np.random.rand() < self.revolution_prob:
                     pos_new = self.revolution_country(colony[self.ID_POS], self.idx_list_variables, self.n_revoluted_variables)
                     self.empires[idx][idx_colony][self.ID_POS] = self.amend_position_faster(pos_new)
-            self.empires[idx] = self.update_fitness_population(self.empires[idx])
-        self.pop_empires = self.update_fitness_population(self.pop_empires)
-        _, g_best = self.update_global_best_solution(self.pop_empires)
+        ## The colonies of all empires and the imperialists are evaluated in a single batch
+        self.update_fitness_groups(list(self.empires.values()) + [self.pop_empires])
+        _, g_best = self.update_global_best_solution(self.pop_empires, sort=False)
 
         # Intra-Empire Competition
         for idx, colonies in self.empires.items():
             for idx_colony, colony in enumerate(colonies):
                 if self.compare_agent(colony, self.pop_empires[idx]):
-                    self.empires[idx][idx_colony], self.pop_empires[idx] = deepcopy(self.pop_empires[idx]), deepcopy(colony)
+                    self.empires[idx][idx_colony], self.pop_empires[idx] = self.copy_agent(self.pop_empires[idx]), self.copy_agent(colony)
 
         # Update Total Objective Values of Empires
         cost_empires_list = []
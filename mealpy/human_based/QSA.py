@@ -22,6 +22,7 @@ class BaseQSA(Optimizer):
         + Remove all third loop
         + Using g_best solution in business 3 instead of random solution
     """
+    SUPPORT_PARALLEL = False
 
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
@@ -56,7 +56,7 @@ class BaseSARO(Optimizer):
         pop_new = []
         for idx in range(self.pop_size):
             ## Social Phase
-            k = np.random.choice(list(set(range(0, 2 * self.pop_size)) - {idx}))
+            k = self.get_index_distinct_random(idx=idx, high=2 * self.pop_size)
             sd = pop_x[idx][self.ID_POS] - self.pop[k][self.ID_POS]
 
             #### Remove third loop here, also using random flight back when out of bound
@@ -79,7 +79,7 @@ class BaseSARO(Optimizer):
         pop_new = []
         for idx in range(self.pop_size):
             ## Individual phase
-            k1, k2 = np.random.choice(list(set(range(0, 2 * self.pop_size)) - {idx}), 2, replace=False)
+            k1, k2 = self.get_index_distinct_random(2, idx, high=2 * self.pop_size)
             #### Remove third loop here, and flight back strategy now be a random
             pos_new = self.g_best[self.ID_POS] + np.random.uniform() * (pop[k1][self.ID_POS] - pop[k2][self.ID_POS])
             pos_new = self.amend_position_random(pos_new)
@@ -128,7 +128,7 @@ class OriginalSARO(BaseSARO):
         pop_new = []
         for idx in range(self.pop_size):
             ## Social Phase
-            k = np.random.choice(list(set(range(0, 2 * self.pop_size)) - {idx}))
+            k = self.get_index_distinct_random(idx=idx, high=2 * self.pop_size)
             sd = pop_x[idx][self.ID_POS] - self.pop[k][self.ID_POS]
             j_rand = np.random.randint(0, self.problem.n_dims)
             r1 = np.random.uniform(-1, 1)
@@ -160,7 +160,7 @@ class OriginalSARO(BaseSARO):
         pop = deepcopy(pop_x) + deepcopy(pop_m)
         pop_new = []
         for idx in range(0, self.pop_size):
-            k, m = np.random.choice(list(set(range(0, 2 * self.pop_size)) - {idx}), 2, replace=False)
+            k, m = self.get_index_distinct_random(2, idx, high=2 * self.pop_size)
             pos_new = pop_x[idx][self.ID_POS] + np.random.uniform() * (pop[k][self.ID_POS] - pop[m][self.ID_POS])
             for j in range(0, self.problem.n_dims):
                 if pos_new[j] < self.problem.lb[j]:
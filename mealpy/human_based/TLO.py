@@ -11,6 +11,7 @@ import numpy as np
 from functools import reduce
 from copy import deepcopy
 from mealpy.optimizer import Optimizer
+from mealpy.utils.population import Population
 
 
 class BaseTLO(Optimizer):
@@ -22,6 +23,7 @@ class BaseTLO(Optimizer):
         + Remove all third loop
         + Using global best solution
     """
+    ARRAY_POPULATION = True
 
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
@@ -51,9 +53,8 @@ class BaseTLO(Optimizer):
             list_pos = np.array([item[self.ID_POS] for item in self.pop])
             DIFF_MEAN = np.random.rand(self.problem.n_dims) * (self.g_best[self.ID_POS] - TF * np.mean(list_pos, axis=0))
             temp = self.pop[idx][self.ID_POS] + DIFF_MEAN
-            pos_new = self.amend_position_faster(temp)
-            pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
+            pop_new.append(self.amend_position_faster(temp))
+        pop_new = self.update_fitness_population(Population(np.array(pop_new)))
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
         pop_child = []
@@ -66,9 +67,35 @@ class BaseTLO(Optimizer):
                 temp += np.random.rand(self.problem.n_dims) * (pop_new[idx][self.ID_POS] - pop_new[id_partner][self.ID_POS])
             else:
                 temp += np.random.rand(self.problem.n_dims) * (pop_new[id_partner][self.ID_POS] - pop_new[idx][self.ID_POS])
-            pos_new = self.amend_position_faster(temp)
-            pop_child.append([pos_new, None])
-        pop_child = self.update_fitness_population(pop_child)
+            pop_child.append(self.amend_position_faster(temp))
+        pop_child = self.update_fitness_population(Population(np.array(pop_child)))
+        self.pop = self.greedy_selection_population(pop_new, pop_child)
+
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        ## Teaching Phrase
+        list_pos = self.get_position_matrix(self.pop)
+        list_TF = np.random.randint(1, 3, (self.pop_size, 1))  # 1 or 2 (never 3)
+        DIFF_MEAN = np.random.rand(self.pop_size, self.problem.n_dims) * (self.g_best[self.ID_POS] - list_TF * np.mean(list_pos, axis=0))
+        pos_new = self.amend_position_faster(list_pos + DIFF_MEAN)
+        pop_new = self.update_fitness_population(Population(pos_new))
+        pop_new = self.greedy_selection_population(self.pop, pop_new)
+
+        ## Learning Phrase
+        list_pos = self.get_position_matrix(pop_new)
+        list_fit = self.get_list_target(pop_new)
+        # A random partner different from the agent itself
+        list_partner = np.random.randint(0, self.pop_size - 1, self.pop_size)
+        list_partner += list_partner >= np.arange(0, self.pop_size)
+        list_better = list_fit < list_fit[list_partner]
+        if self.problem.minmax != "min":
+            list_better = ~list_better
+        diff = np.where(list_better[:, None], list_pos - list_pos[list_partner], list_pos[list_partner] - list_pos)
+        pos_new = self.amend_position_faster(list_pos + np.random.rand(self.pop_size, self.problem.n_dims) * diff)
+        pop_child = self.update_fitness_population(Population(pos_new))
         self.pop = self.greedy_selection_population(pop_new, pop_child)
 
 
@@ -81,6 +108,7 @@ class OriginalTLO(BaseTLO):
     Notes:
         + Removed the third loop to make it faster
     """
+    SUPPORT_PARALLEL = False
 
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
@@ -134,6 +162,7 @@ class ITLO(BaseTLO):
     Notes:
         + Kinda similar to the paper, but the pseudo-code in the paper is not clear.
     """
+    ARRAY_POPULATION = False
 
     def __init__(self, problem, epoch=10000, pop_size=100, n_teachers=5, **kwargs):
         """
@@ -186,7 +215,7 @@ class ITLO(BaseTLO):
                     TF = student[self.ID_FIT][self.ID_TAR] / teacher[self.ID_FIT][self.ID_TAR]
                 diff_mean = np.random.rand() * (teacher[self.ID_POS] - TF * mean_team)  # Step 8
 
-                id2 = np.random.choice(list(set(range(0, self.n_teachers)) - {id_teach}))
+                id2 = self.get_index_distinct_random(idx=id_teach, high=self.n_teachers)
                 if self.compare_agent(teacher, team[id2]):
                     pos_new = (student[self.ID_POS] + diff_mean) + np.random.rand() * (team[id2][self.ID_POS] - student[self.ID_POS])
                 else:
@@ -201,7 +230,7 @@ class ITLO(BaseTLO):
             team = self.teams[id_teach]
             pop_new = []
             for id_stud, student in enumerate(team):
-                id2 = np.random.choice(list(set(range(0, self.n_students_in_team)) - {id_stud}))
+                id2 = self.get_index_distinct_random(idx=id_stud, high=self.n_students_in_team)
                 if self.compare_agent(student, team[id2]):
                     pos_new = student[self.ID_POS] + np.random.rand() * (student[self.ID_POS] - team[id2][self.ID_POS]) + \
                               np.random.rand() * (teacher[self.ID_POS] - ef * team[id2][self.ID_POS])
@@ -9,6 +9,7 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
+from mealpy.utils.population import Population
 
 
 class OriginalHC(Optimizer):
@@ -18,6 +19,7 @@ class OriginalHC(Optimizer):
         The number of neighbour solutions are equal to user defined
         The step size to calculate neighbour is randomized
     """
+    ARRAY_POPULATION = True
 
     def __init__(self, problem, epoch=10000, pop_size=100, neighbour_size=50, **kwargs):
         """
@@ -44,9 +46,19 @@ class OriginalHC(Optimizer):
         pop_neighbours = []
         for i in range(0, self.neighbour_size):
             pos_new = self.g_best[self.ID_POS] + np.random.normal(0, 1, self.problem.n_dims) * step_size
-            pos_new = self.amend_position_faster(pos_new)
-            pop_neighbours.append([pos_new, None])
-        self.pop = self.update_fitness_population(pop_neighbours)
+            pop_neighbours.append(self.amend_position_faster(pos_new))
+        self.pop = self.update_fitness_population(Population(np.array(pop_neighbours)))
+
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        self.nfe_per_epoch = self.neighbour_size
+        step_size = np.mean(self.problem.ub - self.problem.lb) * np.exp(-2 * (epoch + 1) / self.epoch)
+        pos_new = self.g_best[self.ID_POS] + np.random.normal(0, 1, (self.neighbour_size, self.problem.n_dims)) * step_size
+        pos_new = self.amend_position_faster(pos_new)
+        self.pop = self.update_fitness_population(Population(pos_new))
 
 
 class BaseHC(OriginalHC):
@@ -88,6 +100,6 @@ class BaseHC(OriginalHC):
                 pos_new = self.amend_position_faster(pos_new)
                 pop_neighbours.append([pos_new, None])
             pop_neighbours = self.update_fitness_population(pop_neighbours)
-            _, agent = self.get_global_best_solution(pop_neighbours)
+            _, agent = self.get_global_best_solution(pop_neighbours, sort=False)
             self.pop[idx] = agent
 
@@ -9,6 +9,7 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
+from mealpy.utils.population import Population
 
 
 class BaseHS(Optimizer):
@@ -18,6 +19,7 @@ class BaseHS(Optimizer):
         - Using global best in the harmony memories
         - Remove third for loop
     """
+    ARRAY_POPULATION = True
 
     def __init__(self, problem, epoch=10000, pop_size=100, n_new=50, c_r=0.95, pa_r=0.05, **kwargs):
         """
@@ -58,9 +60,30 @@ class BaseHS(Optimizer):
             # Pitch Adjustment
             x_new = pos_new + delta
             pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.pa_r, x_new, pos_new)
-            pos_new = self.amend_position_faster(pos_new)  # Check the bound
-            pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
+            pop_new.append(self.amend_position_faster(pos_new))  # Check the bound
+        pop_new = self.update_fitness_population(Population(np.array(pop_new)))
+
+        # Update Damp Fret Width
+        self.dyn_fw = self.dyn_fw * self.fw_damp
+
+        # Merge Harmony Memory and New Harmonies, Then sort them, Then truncate extra harmonies
+        self.pop = self.get_sorted_strim_population(self.pop + pop_new, self.pop_size)
+
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        size = (self.pop_size, self.problem.n_dims)
+        # Create New Harmony Position
+        pos_new = np.random.uniform(self.problem.lb, self.problem.ub, size)
+        delta = self.dyn_fw * np.random.normal(self.problem.lb, self.problem.ub, size)
+        # Use Harmony Memory
+        pos_new = np.where(np.random.uniform(0, 1, size) < self.c_r, self.g_best[self.ID_POS], pos_new)
+        # Pitch Adjustment
+        pos_new = np.where(np.random.uniform(0, 1, size) < self.pa_r, pos_new + delta, pos_new)
+        pos_new = self.amend_position_faster(pos_new)  # Check the bound
+        pop_new = self.update_fitness_population(Population(pos_new))
 
         # Update Damp Fret Width
         self.dyn_fw = self.dyn_fw * self.fw_damp
@@ -107,9 +130,8 @@ class OriginalHS(BaseHS):
                 if np.random.uniform() <= self.pa_r:
                     delta = self.dyn_fw * np.random.normal(self.problem.lb, self.problem.ub)  # Gaussian(Normal)
                     pos_new[j] = pos_new[j] + delta[j]
-            pos_new = self.amend_position_faster(pos_new)
-            pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
+            pop_new.append(self.amend_position_faster(pos_new))
+        pop_new = self.update_fitness_population(Population(np.array(pop_new)))
 
         # Update Damp Fret Width
         self.dyn_fw = self.dyn_fw * self.fw_damp
@@ -11,11 +11,23 @@ import numpy as np
 from math import gamma
 from copy import deepcopy
 from mealpy.utils.history import History
+from mealpy.utils.tracker import BestTracker
+from mealpy.utils.population import Population, AgentView, FitnessView
 from mealpy.problem import Problem
-from mealpy.utils.termination import Termination
+from mealpy.utils.termination import Termination, BudgetExhausted
+from mealpy.utils.checkpoint import Checkpoint
+from mealpy.utils.cache import FitnessCache
+from mealpy.utils.selection import get_ranked_index, get_top_k_index, get_min_max_index, get_roulette_wheel_index, get_kway_tournament_index, \
+    get_distinct_random_index, get_distinct_random_sample
 import concurrent.futures as parallel
+import threading
+import os
 import time
 
+## State of the current thread when it runs a task of the worker pool, the evaluations inside the task are counted here
+## and sent back to the main process, instead of the counter of the optimizer
+worker_state = threading.local()
+
 
 class Optimizer:
     """ This is base class of all Algorithms """
@@ -29,6 +41,23 @@ class Optimizer:
 
     EPSILON = 10E-10
 
+    ## True if the evaluations of the population go through update_fitness_population() or get_fitness_batch(), so they
+    ## run in the worker pool of the 'thread' and 'process' modes (and in one call of a vectorized objective function).
+    ## The algorithms which must evaluate their agents one after another (each evaluation decides the next position)
+    ## set it to False, the parallel modes still work with them but don't make them faster.
+    SUPPORT_PARALLEL = True
+
+    ## True if the algorithm keeps its population in a Population (the structure-of-arrays store of mealpy.utils.population)
+    ## instead of a list of agents, create_population() returns a Population when the agents have the default format
+    ## [position, fitness]. Its evolve() must keep self.pop a Population: build the new agents with Population(list_pos)
+    ## and combine them by the helpers (greedy_selection_population, get_sorted_strim_population, pop + pop_new,...).
+    ARRAY_POPULATION = False
+
+    ## The settings of a run are not saved in checkpoint, they are decided by the model which resumes it
+    CHECKPOINT_EXCLUDED = ("problem", "history", "termination", "termination_flag", "count_terminate", "checkpoint",
+                           "checkpoint_flag", "mode", "n_workers", "executor", "epoch", "verbose", "fitness_cache", "nfe_budget",
+                           "steady_state", "max_in_flight", "steady_pending", "vectorized_evolve", "tracker")
+
     def __init__(self, problem, kwargs):
         """
         Args:
@@ -46,12 +75,22 @@ class Optimizer:
                 "batch_size": int (Optional, smaller than population size)
                 "obj_weight": list weights for all your objectives (Optional, default = [1, 1, ...1])
              }
+            kwargs (dict): Optional keywords of all algorithms
+                "termination": Termination object
+                "history_mode": "none", "best-only", "stats" or "full" (default), see History class
+                "history_buffer": int, keep only the populations of the last K generations in history (Optional)
+                "history_store": MemmapPopulationStore or ChunkedPopulationStore, spill the positions of all generations to disk (Optional)
+                "checkpoint": Checkpoint object, save the state periodically to resume it later by solve(resume_from=...) (Optional)
+                "fitness_cache": FitnessCache object, skip the objective function for the positions evaluated before (Optional)
+                "vectorized_evolve": True or False, build the new positions of the whole population at once with numpy
+                    instead of one agent at a time, only for the algorithms which implement evolve_vectorized() (Optional)
         """
         super(Optimizer, self).__init__()
         self.epoch, self.pop_size, self.solution = None, None, None
-        self.mode = "sequential"
-        self.pop, self.g_best = None, None
-        self.history = History()
+        self.mode, self.n_workers, self.executor = "sequential", None, None
+        self.steady_state, self.max_in_flight, self.steady_pending, self.steady_next_idx = False, None, {}, 0
+        self.pop, self.g_best, self.tracker = None, None, None
+        self.history = History(kwargs.get("history_mode", "full"), kwargs.get("history_buffer", None), kwargs.get("history_store", None))
         if not isinstance(problem, Problem):
             problem = Problem(problem)
         self.problem = problem
@@ -65,6 +104,22 @@ class Optimizer:
             else:
                 self.termination = termination
             self.termination_flag = True
+        self.checkpoint_flag = False
+        if "checkpoint" in kwargs:
+            if not isinstance(kwargs["checkpoint"], Checkpoint):
+                print("Please create and input your Checkpoint object!")
+                exit(0)
+            self.checkpoint = kwargs["checkpoint"]
+            self.checkpoint_flag = True
+        self.fitness_cache = kwargs.get("fitness_cache", None)
+        if self.fitness_cache is not None and not isinstance(self.fitness_cache, FitnessCache):
+            print("Please create and input your FitnessCache object!")
+            exit(0)
+        self.vectorized_evolve = kwargs.get("vectorized_evolve", False)
+        if self.vectorized_evolve and self.__get_defining_class__("evolve_vectorized") is not self.__get_defining_class__("evolve"):
+            print(f"{self.__class__.__name__} doesn't support vectorized evolve.")
+            exit(0)
+        self.nfe_counter, self.nfe_budget, self.nfe_best = 0, None, None
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = False
 
@@ -73,11 +128,12 @@ class Optimizer:
             if self.termination.mode == 'TB':
                 self.count_terminate = time.time()
             elif self.termination.mode == 'ES':
-                self.count_terminate = 0
+                self.count_terminate = 0        # Number of consecutive generations the global best is not improved
             elif self.termination.mode == 'MG':
                 self.count_terminate = self.epoch
             else:                       # number of function evaluation (NFE)
-                self.count_terminate = self.pop_size        # First out of loop
+                self.count_terminate = 0        # Not used, the evaluations are counted by nfe_counter
+                self.nfe_budget = self.termination.quantity
         else:
             pass
 
@@ -86,7 +142,7 @@ class Optimizer:
         if self.sort_flag:
             self.pop, self.g_best = self.get_global_best_solution(self.pop)  # We sort the population
         else:
-            _, self.g_best = self.get_global_best_solution(self.pop)  # We don't sort the population
+            _, self.g_best = self.get_global_best_solution(self.pop, sort=False)  # We don't sort the population
 
     def before_evolve(self, epoch):
         pass
@@ -94,30 +150,120 @@ class Optimizer:
     def after_evolve(self, epoch):
         pass
 
-    def solve(self, mode='sequential'):
+    def __get_defining_class__(self, name):
+        ## The class which defines the method "name", a subclass with its own evolve() doesn't inherit the other ways
+        ## of evolving (create_candidate, evolve_vectorized) from its parent
+        return next(cls for cls in type(self).__mro__ if name in cls.__dict__)
+
+    def __getstate__(self):
+        ## The worker pool and the running tasks can't be pickled, they are only needed in the main process
+        state = self.__dict__.copy()
+        state["executor"], state["steady_pending"] = None, {}
+        return state
+
+    def start_executor(self):
+        """
+        Create the worker pool that is shared by all evaluation calls during a single run of solve()
+        """
+        if self.mode == "thread":
+            self.executor = parallel.ThreadPoolExecutor(max_workers=self.n_workers)
+        elif self.mode == "process":
+            self.executor = parallel.ProcessPoolExecutor(max_workers=self.n_workers)
+        else:
+            self.executor = None
+
+    def shutdown_executor(self):
+        ## The candidates of steady-state mode which are not started yet are useless after the run
+        for future in self.steady_pending:
+            future.cancel()
+        self.steady_pending = {}
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def solve(self, mode='sequential', n_workers=None, resume_from=None, steady_state=False, max_in_flight=None):
         """
         Args:
             mode (str): 'sequential', 'thread', 'process'
                 + 'sequential': recommended for simple and small task (< 10 seconds for calculating objective)
                 + 'thread': recommended for IO bound task, or small computing task (< 2 minutes for calculating objective)
                 + 'process': recommended for hard and big task (> 2 minutes for calculating objective)
+            n_workers (int): number of threads/processes in the worker pool, default = None (decided by concurrent.futures)
+            resume_from (str): path of a checkpoint (without extension) saved by the same algorithm, continue that run
+                instead of starting a new one
+            steady_state (bool): asynchronous steady-state evolution with 'thread' or 'process' mode, a new candidate
+                is sent to the worker pool as soon as a worker is free, only for the algorithms which implement
+                create_candidate() (BaseDE, BaseGWO, BaseWOA, BaseHHO, BaseSSO, BaseCEM)
+            max_in_flight (int): maximum number of candidates evaluated at the same time in steady-state mode,
+                default = n_workers (or the number of CPUs)
 
         Returns:
             [position, fitness value]
         """
+        if steady_state:
+            if mode not in ("thread", "process"):
+                print("Steady-state mode needs a worker pool, please use mode 'thread' or 'process'.")
+                exit(0)
+            if self.__get_defining_class__("create_candidate") is not self.__get_defining_class__("evolve"):
+                print(f"{self.__class__.__name__} doesn't support steady-state mode.")
+                exit(0)
+            if max_in_flight is not None and (type(max_in_flight) is not int or max_in_flight < 1):
+                print("The maximum number of candidates in flight should be an int number and > 0.")
+                exit(0)
+        if mode in ("thread", "process") and not self.SUPPORT_PARALLEL and self.verbose:
+            print(f"{self.__class__.__name__} evaluates its agents one after another, the '{mode}' mode doesn't make it faster.")
         self.mode = mode
+        self.n_workers = n_workers
+        self.steady_state = steady_state
+        self.max_in_flight = max_in_flight or n_workers or os.cpu_count() or 1
+        self.start_executor()
+        try:
+            return self._solve(resume_from)
+        finally:
+            self.shutdown_executor()
+
+    def _solve(self, resume_from=None):
         self.termination_start()
-        self.initialization()
-        self.history.save_initial_best(self.g_best)
+        try:
+            if resume_from is None:
+                self.nfe_counter = 0
+                self.tracker = BestTracker(self.problem.minmax, self.epoch + 1)
+                self.initialization()
+                self.save_initial_best(self.g_best)
+                epoch_start = 0
+            else:
+                epoch_start = self.load_checkpoint(resume_from)
+            self.nfe_best = None
+            if self.checkpoint_flag:
+                self.checkpoint.start()
+            self.run_epochs(epoch_start)
+        except BudgetExhausted:
+            self.termination.logging(self.verbose)
+            self.save_budget_best()
 
-        for epoch in range(0, self.epoch):
+        ## Additional information for the framework
+        self.save_optimization_process()
+        return self.solution[self.ID_POS], self.solution[self.ID_FIT][self.ID_TAR]
+
+    def run_epochs(self, epoch_start=0):
+        """
+        Args:
+            epoch_start (int): number of finished epochs, it is > 0 when the run is resumed from a checkpoint
+        """
+        g_best_fit_prev = self.g_best[self.ID_FIT][self.ID_TAR]
+        for epoch in range(epoch_start, self.epoch):
             time_epoch = time.time()
 
             ## Call before evolve function
             self.before_evolve(epoch)
 
             ## Evolve method will be called in child class
-            self.evolve(epoch)
+            if self.steady_state:
+                self.evolve_steady_state(epoch)
+            elif self.vectorized_evolve:
+                self.evolve_vectorized(epoch)
+            else:
+                self.evolve(epoch)
 
             ## Call after evolve function
             self.after_evolve(epoch)
@@ -126,11 +272,15 @@ class Optimizer:
             if self.sort_flag:
                 self.pop, self.g_best = self.update_global_best_solution(self.pop)  # We sort the population
             else:
-                _, self.g_best = self.update_global_best_solution(self.pop)  # We don't sort the population
+                _, self.g_best = self.update_global_best_solution(self.pop, sort=False)  # We don't sort the population
+            self.nfe_best = None
             ## Additional information for the framework
             time_epoch = time.time() - time_epoch
-            self.history.list_epoch_time.append(time_epoch)
-            self.history.list_population.append(deepcopy(self.pop))
+            pop_saved = None
+            if self.history.save_population:
+                pop_saved = self.copy_population(self.pop) if self.history.store is None else self.get_position_matrix(self.pop)
+            diversity = self.get_diversity(self.pop) if self.history.save_diversity else None
+            self.history.save_epoch(time_epoch, pop_saved, diversity)
             self.print_epoch(epoch + 1, time_epoch)
             if self.termination_flag:
                 if self.termination.mode == 'TB':
@@ -138,8 +288,7 @@ class Optimizer:
                         self.termination.logging(self.verbose)
                         break
                 elif self.termination.mode == 'FE':
-                    self.count_terminate += self.nfe_per_epoch
-                    if self.count_terminate >= self.termination.quantity:
+                    if self.nfe_counter >= self.termination.quantity:
                         self.termination.logging(self.verbose)
                         break
                 elif self.termination.mode == 'MG':
@@ -147,18 +296,193 @@ class Optimizer:
                         self.termination.logging(self.verbose)
                         break
                 else:                       # Early Stopping
-                    temp = self.count_terminate + self.history.get_global_repeated_times(self.ID_FIT, self.ID_TAR, self.EPSILON)
-                    if temp >= self.termination.quantity:
+                    if np.abs(g_best_fit_prev - self.g_best[self.ID_FIT][self.ID_TAR]) <= self.EPSILON:
+                        self.count_terminate += 1
+                    else:
+                        self.count_terminate = 0
+                    g_best_fit_prev = self.g_best[self.ID_FIT][self.ID_TAR]
+                    if self.count_terminate >= self.termination.quantity:
                         self.termination.logging(self.verbose)
                         break
+            if self.checkpoint_flag and self.checkpoint.is_due(epoch + 1):
+                self.save_checkpoint(epoch + 1)
 
-        ## Additional information for the framework
-        self.save_optimization_process()
-        return self.solution[self.ID_POS], self.solution[self.ID_FIT][self.ID_TAR]
+    def save_budget_best(self):
+        """
+        The FE budget is used up in the middle of an epoch, the best solution evaluated in that epoch is saved as the
+        current best of a last (partial) generation, so no paid evaluation is lost
+        """
+        if self.nfe_best is None:
+            return None
+        if self.tracker.agent is None:
+            self.save_initial_best(self.nfe_best)
+        else:
+            self.tracker.update(self.nfe_best, True, self.copy_agent)
+            if self.history.save_best:
+                self.history.list_current_best.append(self.nfe_best)
+                self.history.list_global_best.append(self.tracker.agent)
+        self.g_best = self.copy_agent(self.tracker.agent)
+
+    def save_initial_best(self, agent=None):
+        """
+        Start the records of the best solutions with the best agent of the initial population
+
+        Args:
+            agent (list): the best agent
+        """
+        self.tracker.reset(agent, self.copy_agent)
+        if self.history.save_best:
+            self.history.save_initial_best(self.tracker.agent)
 
     def evolve(self, epoch):
         pass
 
+    def evolve_vectorized(self, epoch):
+        """
+        The same update rules as evolve(), but the new positions of the whole population are built at once as a
+        (pop_size, n_dims) matrix with batched random numbers, used with the keyword "vectorized_evolve". The algorithms
+        which support it override this method, evolve() is kept as the reference version.
+
+        Args:
+            epoch (int): The current iteration
+        """
+        pass
+
+    def prepare_candidates(self, epoch):
+        """
+        Steady-state mode: compute the values shared by all candidates of an epoch, called at the start of each epoch
+
+        Args:
+            epoch (int): The current iteration
+        """
+        pass
+
+    def create_candidate(self, idx, epoch):
+        """
+        Steady-state mode: create the next candidate(s) of an agent from the current population, the algorithms which
+        support steady-state mode override this method
+
+        Args:
+            idx (int): index of the agent
+            epoch (int): The current iteration
+
+        Returns:
+            list of new positions, each of them is compared with the agent idx by greedy selection
+        """
+        pass
+
+    def merge_candidate(self, idx, agent):
+        """
+        Steady-state mode: greedy selection between an evaluated candidate and the agent idx, the global best is also
+        updated right away so the next candidates can use it
+
+        Args:
+            idx (int): index of the agent
+            agent (list): the evaluated candidate
+        """
+        if self.compare_agent(agent, self.pop[idx]):
+            self.pop[idx] = agent
+            if self.compare_agent(agent, self.g_best):
+                self.g_best = self.copy_agent(agent)
+
+    def evolve_steady_state(self, epoch):
+        """
+        Asynchronous steady-state evolution, used by solve(steady_state=True). A candidate is created and sent to the
+        worker pool as soon as a worker is free, its result is merged by greedy selection as soon as it is ready, so the
+        workers never wait for the slowest evaluation. The epoch ends after pop_size results are merged, the candidates
+        still in the pool are carried to the next epoch (except in the last one).
+
+        Args:
+            epoch (int): The current iteration
+        """
+        self.prepare_candidates(epoch)
+        last_epoch = epoch == self.epoch - 1
+        n_merged, budget_out = 0, False
+        while n_merged < self.pop_size or (budget_out and len(self.steady_pending) > 0):
+            while not budget_out and n_merged < self.pop_size and len(self.steady_pending) < self.max_in_flight and \
+                    (not last_epoch or n_merged + len(self.steady_pending) < self.pop_size):
+                idx = self.steady_next_idx
+                self.steady_next_idx = (idx + 1) % self.pop_size
+                for pos_new in self.create_candidate(idx, epoch):
+                    key = None
+                    if self.fitness_cache is not None:
+                        key = self.fitness_cache.get_key(pos_new)
+                        fit_new = self.fitness_cache.get(key)
+                        if fit_new is not None:
+                            self.merge_candidate(idx, [pos_new, fit_new])
+                            n_merged += 1
+                            continue
+                    if self.reserve_evaluations(1) == 0:
+                        budget_out = True
+                        break
+                    future = self.executor.submit(self.problem.get_fitness, pos_new)
+                    self.steady_pending[future] = (idx, pos_new, key)
+            if len(self.steady_pending) == 0:
+                break
+            list_done, _ = parallel.wait(self.steady_pending, return_when=parallel.FIRST_COMPLETED)
+            for future in list_done:
+                idx, pos_new, key = self.steady_pending.pop(future)
+                fit_new = future.result()
+                if key is not None:
+                    self.fitness_cache.put(key, fit_new)
+                self.track_evaluations([pos_new], [fit_new])
+                self.merge_candidate(idx, [pos_new, fit_new])
+                n_merged += 1
+        if budget_out:
+            raise BudgetExhausted()
+
+    def get_checkpoint_state(self):
+        """
+        Returns:
+            The state of a run: all attributes of the algorithm (population, global best, dyn_* variables,...) except
+            the problem and the settings of solve(), the history, the termination counter and the numpy random state
+        """
+        ## Functions assigned to the model are settings too, they are created again by the model which resumes the run
+        attributes = {key: value for key, value in self.__dict__.items() if key not in self.CHECKPOINT_EXCLUDED and not callable(value)}
+        termination = None
+        if self.termination_flag:
+            count = self.count_terminate
+            if self.termination.mode == "TB":
+                count = time.time() - self.count_terminate      # Save the elapsed time, not the starting time
+            termination = [self.termination.mode, count]
+        return {"optimizer": self.__class__.__name__, "attributes": attributes, "history": self.history.get_state(),
+                "tracker": self.tracker.get_state(), "termination": termination, "random_state": np.random.get_state()}
+
+    def set_checkpoint_state(self, state=None):
+        if state["optimizer"] != self.__class__.__name__:
+            print(f"The checkpoint is saved by {state['optimizer']}, it can't be resumed by {self.__class__.__name__}.")
+            exit(0)
+        self.__dict__.update(state["attributes"])
+        self.history.set_state(state["history"])
+        self.tracker = BestTracker(self.problem.minmax, self.epoch + 1)
+        self.tracker.set_state(state["tracker"])
+        if self.termination_flag and state["termination"] is not None and state["termination"][0] == self.termination.mode:
+            self.count_terminate = state["termination"][1]
+            if self.termination.mode == "TB":
+                self.count_terminate = time.time() - self.count_terminate
+        np.random.set_state(state["random_state"])
+
+    def save_checkpoint(self, epoch):
+        """
+        Args:
+            epoch (int): number of finished epochs
+        """
+        self.checkpoint.save(self.get_checkpoint_state(), epoch)
+
+    def load_checkpoint(self, filename):
+        """
+        Args:
+            filename (str): path of the checkpoint without extension
+
+        Returns:
+            The number of finished epochs of the saved run
+        """
+        state, epoch = Checkpoint.load(filename)
+        self.set_checkpoint_state(state)
+        if self.verbose:
+            print(f"> Resume from checkpoint: {filename}, finished epochs: {epoch}")
+        return epoch
+
     def create_solution(self):
         """
         Returns:
@@ -182,23 +506,32 @@ class Optimizer:
             pop_size (int): number of solutions
 
         Returns:
-            population: list of solutions/agents
+            population: list of solutions/agents, or a Population with ARRAY_POPULATION
         """
         if pop_size is None:
             pop_size = self.pop_size
-        pop = []
-        if self.mode == "thread":
-            with parallel.ThreadPoolExecutor() as executor:
-                list_executors = [executor.submit(self.create_solution) for _ in range(pop_size)]
-                # This method yield the result everytime a thread finished their job (not by order)
-                for f in parallel.as_completed(list_executors):
-                    pop.append(f.result())
-        elif self.mode == "process":
-            with parallel.ProcessPoolExecutor() as executor:
-                list_executors = [executor.submit(self.create_solution) for _ in range(pop_size)]
-                # This method yield the result everytime a cpu finished their job (not by order).
-                for f in parallel.as_completed(list_executors):
-                    pop.append(f.result())
+        if self.ARRAY_POPULATION and type(self).create_solution is Optimizer.create_solution:
+            # The positions are drawn in the same order as create_solution() does, then scored in a single batch
+            pop = Population(np.random.uniform(self.problem.lb, self.problem.ub, (pop_size, self.problem.n_dims)))
+            return self.update_fitness_population(pop)
+        if self.problem.vectorized and type(self).create_solution is Optimizer.create_solution:
+            # Agents in the default format can be created and scored in a single call of the objective function
+            list_pos = np.random.uniform(self.problem.lb, self.problem.ub, (pop_size, self.problem.n_dims))
+            list_fit = self.get_fitness_positions(list_pos)
+            pop = [[list_pos[idx], list_fit[idx]] for idx in range(0, pop_size)]
+        elif self.executor is not None:
+            # The worker pool is created once in solve() and reused here. Each task reports its number of evaluations,
+            # the FE budget is checked before sending them (one evaluation per solution)
+            n_solutions = self.reserve_evaluations(pop_size, count=False)
+            list_executors = [self.executor.submit(self.create_solution_in_worker) for _ in range(n_solutions)]
+            pop = []
+            for f in list_executors:
+                solution, n_evals = f.result()
+                self.nfe_counter += n_evals
+                pop.append(solution)
+            self.track_evaluations([agent[self.ID_POS] for agent in pop], [agent[self.ID_FIT] for agent in pop])
+            if n_solutions < pop_size:
+                raise BudgetExhausted()
         else:
             pop = [self.create_solution() for _ in range(0, pop_size)]
         return pop
@@ -207,26 +540,76 @@ class Optimizer:
         """
         Args:
             mode (str): processing mode, it can be "sequential", "thread" or "process"
-            pop (list): the population
+            pop (list, Population): the population
 
         Returns:
             population: with updated fitness value
         """
-        if self.mode == "thread":
-            with parallel.ThreadPoolExecutor() as executor:
-                list_results = executor.map(self.get_fitness_solution, pop)  # Return result not the future object
-                for idx, fit in enumerate(list_results):
-                    pop[idx][self.ID_FIT] = fit
-        elif self.mode == "process":
-            with parallel.ProcessPoolExecutor() as executor:
-                list_results = executor.map(self.get_fitness_solution, pop)  # Return result not the future object
-                for idx, fit in enumerate(list_results):
+        if isinstance(pop, Population):
+            ## The targets and objectives of the store are replaced at once
+            if self.problem.vectorized:
+                list_fit = self.get_fitness_positions(pop.list_pos) if len(pop) > 0 else []
+            elif self.executor is not None:
+                evaluate = lambda list_pos: self.get_fitness_in_budget(list_pos, lambda list_allowed: self.executor.map(self.problem.get_fitness, list_allowed))
+                list_fit = evaluate(pop.list_pos) if self.fitness_cache is None else self.get_fitness_with_cache(pop.list_pos, evaluate)
+            else:
+                list_fit = [self.get_fitness_position(pos) for pos in pop.list_pos]
+            pop.set_fitness(list_fit)
+            return pop
+        if self.problem.vectorized:
+            if len(pop) > 0:
+                list_pos = np.array([agent[self.ID_POS] for agent in pop])
+                list_fit = self.get_fitness_positions(list_pos)
+                for idx, fit in enumerate(list_fit):
                     pop[idx][self.ID_FIT] = fit
+        elif self.executor is not None:
+            # The evaluations are counted here in the main process, only the problem is sent to the workers
+            evaluate = lambda list_pos: self.get_fitness_in_budget(list_pos, lambda list_allowed: self.executor.map(self.problem.get_fitness, list_allowed))
+            if self.fitness_cache is None:
+                list_results = evaluate([agent[self.ID_POS] for agent in pop])
+            else:
+                # The cache lives in the main process, only the missing positions are sent to the workers
+                list_results = self.get_fitness_with_cache([agent[self.ID_POS] for agent in pop], evaluate)
+            for idx, fit in enumerate(list_results):
+                pop[idx][self.ID_FIT] = fit
         else:
             for idx, agent in enumerate(pop):
                 pop[idx][self.ID_FIT] = self.get_fitness_solution(agent)
         return pop
 
+    def get_fitness_batch(self, list_pos=None):
+        """
+        Evaluate many positions in a single dispatch, the same path as update_fitness_population(): one call of the
+        vectorized objective function, the worker pool in 'thread' and 'process' modes, or one by one in 'sequential' mode
+
+        Args:
+            list_pos (list, nd.array): the positions
+
+        Returns:
+            list of [target, [obj1, obj2, ...]]
+        """
+        if len(list_pos) == 0:
+            return []
+        pop = self.update_fitness_population([[pos, None] for pos in list_pos])
+        return [agent[self.ID_FIT] for agent in pop]
+
+    def update_fitness_groups(self, groups=None):
+        """
+        Evaluate the agents of many groups (clusters, rivers, empires,...) in a single batch: they are flattened into one
+        list, sent to update_fitness_population() in one dispatch (one barrier in thread/process mode, one call of the
+        vectorized objective function) and the fitness values are written back to the agents of each group
+
+        Args:
+            groups (list, dict): list (or dict) of groups, each group is a list of agents
+
+        Returns:
+            groups: with updated fitness value
+        """
+        list_groups = groups.values() if isinstance(groups, dict) else groups
+        pop_flat = [agent for group in list_groups for agent in group]
+        self.update_fitness_population(pop_flat)
+        return groups
+
     def get_fitness_position(self, position=None):
         """
         Args:
@@ -235,11 +618,140 @@ class Optimizer:
         Returns:
             [target, [obj1, obj2, ...]]
         """
-        objs = self.problem.obj_func(position)
-        if not self.problem.obj_is_list:
-            objs = [objs]
-        fit = np.dot(objs, self.problem.obj_weight)
-        return [fit, objs]
+        if getattr(worker_state, "active", False):
+            # Inside a task of the worker pool, the main process counts the evaluations and keeps the cache
+            worker_state.n_evals += 1
+            if self.problem.vectorized:
+                return self.compute_fitness_positions(np.reshape(position, (1, -1)))[0]
+            return self.compute_fitness_position(position)
+        if self.problem.vectorized:
+            return self.get_fitness_positions(np.reshape(position, (1, -1)))[0]
+        key = None
+        if self.fitness_cache is not None:
+            key = self.fitness_cache.get_key(position)
+            fit = self.fitness_cache.get(key)
+            if fit is not None:
+                return fit
+        if self.reserve_evaluations(1) == 0:
+            raise BudgetExhausted()
+        fit = self.compute_fitness_position(position)
+        self.track_evaluations([position], [fit])
+        if key is not None:
+            self.fitness_cache.put(key, fit)
+        return fit
+
+    def compute_fitness_position(self, position=None):
+        """
+        Call the objective function, the fitness cache is not used here
+
+        Args:
+            position (nd.array): 1-D numpy array
+
+        Returns:
+            [target, [obj1, obj2, ...]]
+        """
+        return self.problem.get_fitness(position)
+
+    def get_fitness_positions(self, list_pos=None):
+        """
+        Scoring many positions with a single call of the vectorized objective function
+
+        Args:
+            list_pos (nd.array): 2-D numpy array with shape (n, n_dims)
+
+        Returns:
+            list of [target, [obj1, obj2, ...]]
+        """
+        evaluate = lambda list_pos: self.get_fitness_in_budget(list_pos, lambda list_allowed: self.compute_fitness_positions(np.array(list_allowed)))
+        if self.fitness_cache is not None:
+            return self.get_fitness_with_cache(list_pos, evaluate)
+        return evaluate(list_pos)
+
+    def compute_fitness_positions(self, list_pos=None):
+        """
+        Call the vectorized objective function, the fitness cache is not used here
+
+        Args:
+            list_pos (nd.array): 2-D numpy array with shape (n, n_dims)
+
+        Returns:
+            list of [target, [obj1, obj2, ...]]
+        """
+        return self.problem.get_fitness_vectorized(list_pos)
+
+    def reserve_evaluations(self, n_evals=1, count=True):
+        """
+        Args:
+            n_evals (int): number of evaluations of the objective function the caller wants to make
+            count (bool): add them to nfe_counter now, or later by the caller
+
+        Returns:
+            The number of evaluations allowed by the FE budget (<= n_evals)
+        """
+        if self.nfe_budget is not None:
+            n_evals = min(n_evals, max(self.nfe_budget - self.nfe_counter, 0))
+        if count:
+            self.nfe_counter += n_evals
+        return n_evals
+
+    def track_evaluations(self, list_pos=None, list_fit=None):
+        ## With an FE budget, the run can stop in the middle of an epoch, so the best evaluated solution of the epoch is kept
+        if self.nfe_budget is None:
+            return None
+        for pos, fit in zip(list_pos, list_fit):
+            if self.nfe_best is None or self.compare_agent([pos, fit], self.nfe_best):
+                self.nfe_best = [np.array(pos, dtype=float), fit]
+
+    def get_fitness_in_budget(self, list_pos=None, evaluate=None):
+        """
+        Count the evaluations and stop the run when the FE budget is used up: if the budget is not enough for all
+        positions, only the first ones are evaluated, then BudgetExhausted is raised
+
+        Args:
+            list_pos (list, nd.array): the positions
+            evaluate (callable): evaluate(list of positions) --> list of [target, [obj1, obj2, ...]]
+
+        Returns:
+            list of [target, [obj1, obj2, ...]]
+        """
+        n_allowed = self.reserve_evaluations(len(list_pos))
+        list_fit = list(evaluate(list_pos[:n_allowed])) if n_allowed > 0 else []
+        self.track_evaluations(list_pos[:n_allowed], list_fit)
+        if n_allowed < len(list_pos):
+            raise BudgetExhausted()
+        return list_fit
+
+    def create_solution_in_worker(self):
+        """
+        Run create_solution() in a task of the worker pool
+
+        Returns:
+            The solution, number of evaluations it needed
+        """
+        worker_state.active, worker_state.n_evals = True, 0
+        try:
+            return self.create_solution(), worker_state.n_evals
+        finally:
+            worker_state.active = False
+
+    def get_fitness_with_cache(self, list_pos=None, evaluate=None):
+        """
+        Args:
+            list_pos (list, nd.array): the positions
+            evaluate (callable): evaluate(list of positions) --> list of [target, [obj1, obj2, ...]], only called with
+                the positions which are not in the fitness cache
+
+        Returns:
+            list of [target, [obj1, obj2, ...]]
+        """
+        list_fit, missing = self.fitness_cache.lookup(list_pos)
+        if len(missing) > 0:
+            list_new = evaluate([list_pos[list_idx[0]] for list_idx in missing.values()])
+            for (key, list_idx), fit in zip(missing.items(), list_new):
+                self.fitness_cache.put(key, fit)
+                for idx in list_idx:
+                    list_fit[idx] = [fit[self.ID_TAR], fit[self.ID_OBJ]]
+        return list_fit
 
     def get_fitness_solution(self, solution=None):
         """
@@ -251,21 +763,83 @@ class Optimizer:
         """
         return self.get_fitness_position(solution[self.ID_POS])
 
-    def get_global_best_solution(self, pop: list):
+    def copy_agent(self, agent=None):
+        """
+        A faster replacement of deepcopy() for an agent [position, [target, [obj1, obj2, ...]], ...]. Only the list structure
+        and numpy arrays are copied, immutable values (target, scalar fields) are shared.
+
+        Args:
+            agent (list): A solution
+
+        Returns:
+            An independent copy of the agent
+        """
+        if isinstance(agent, np.ndarray):
+            return agent.copy() if agent.dtype != object else deepcopy(agent)
+        if isinstance(agent, (list, tuple, AgentView, FitnessView)):
+            return [self.copy_agent(item) for item in agent]
+        if agent is None or isinstance(agent, (int, float, complex, str, np.generic)):
+            return agent
+        return deepcopy(agent)
+
+    def copy_population(self, pop=None):
+        """
+        Args:
+            pop (list, Population): The population
+
+        Returns:
+            An independent copy of the population
+        """
+        if isinstance(pop, Population):
+            return deepcopy(pop)
+        return [self.copy_agent(agent) for agent in pop]
+
+    def get_position_matrix(self, pop=None):
+        """
+        Args:
+            pop (list, Population): The population
+
+        Returns:
+            2-D numpy array (pop_size, n_dims), a copy of the positions of all agents
+        """
+        if isinstance(pop, Population):
+            return pop.list_pos.copy()
+        return np.array([agent[self.ID_POS] for agent in pop])
+
+    def get_list_target(self, pop=None):
+        """
+        Returns:
+            1-D numpy array, the target of each agent
+        """
+        if isinstance(pop, Population):
+            return pop.list_tar
+        return np.array([agent[self.ID_FIT][self.ID_TAR] for agent in pop], dtype=float)
+
+    def get_global_best_solution(self, pop: list, sort=True):
         """
         Sort population and return the sorted population and the best solution
 
         Args:
             pop (list): The population of pop_size individuals
+            sort (bool): False if you don't need the sorted population, the best solution is found in O(n) and
+                the population is returned as it is
 
         Returns:
             Sorted population and global best solution
         """
-        sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR])  # Already returned a new sorted list
+        if not sort:
+            list_fit = self.get_list_target(pop)
+            if self.problem.minmax == "min":
+                return pop, self.copy_agent(pop[int(np.argmin(list_fit))])
+            return pop, self.copy_agent(pop[len(pop) - 1 - int(np.argmax(list_fit[::-1]))])     # The last one, as the sorted population
+        if isinstance(pop, Population):
+            sorted_pop = pop.sort("min")
+        else:
+            sorted_pop = [pop[idx] for idx in get_ranked_index(self.get_list_target(pop))]  # Already returned a new sorted list
         if self.problem.minmax == "min":
-            return sorted_pop, deepcopy(sorted_pop[0])
+            return sorted_pop, self.copy_agent(sorted_pop[0])
         else:
-            return sorted_pop, deepcopy(sorted_pop[-1])
+            return sorted_pop, self.copy_agent(sorted_pop[-1])
 
     def get_better_solution(self, agent1: list, agent2: list):
         """
@@ -278,12 +852,12 @@ class Optimizer:
         """
         if self.problem.minmax == "min":
             if agent1[self.ID_FIT][self.ID_TAR] < agent2[self.ID_FIT][self.ID_TAR]:
-                return deepcopy(agent1)
-            return deepcopy(agent2)
+                return self.copy_agent(agent1)
+            return self.copy_agent(agent2)
         else:
             if agent1[self.ID_FIT][self.ID_TAR] < agent2[self.ID_FIT][self.ID_TAR]:
-                return deepcopy(agent2)
-            return deepcopy(agent1)
+                return self.copy_agent(agent2)
+            return self.copy_agent(agent1)
 
     def compare_agent(self, agent_a: list, agent_b: list):
         """
@@ -303,30 +877,37 @@ class Optimizer:
                 return False
             return True
 
-    def get_special_solutions(self, pop=None, best=3, worst=3):
+    def get_special_solutions(self, pop=None, best=3, worst=3, sort=True):
         """
         Args:
             pop (list): The population
             best (int): Top k1 best solutions, default k1=3, it can be None
             worst (int): Top k2 worst solutions, default k2=3, it can be None
+            sort (bool): False if you don't need the sorted population, the best and worst solutions are selected by
+                partition in O(n) and the population is returned as it is
 
         Returns:
-            sorted_population, k1 best solutions and k2 worst solutions
+            sorted_population, k1 best solutions (from the best one) and k2 worst solutions (from the worst one)
         """
-        if self.problem.minmax == "min":
-            pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR])
+        if best is None and worst is None:
+            exit(0)
+        list_fit = self.get_list_target(pop)
+        reverse = self.problem.minmax != "min"
+        if sort:
+            sorted_idx = get_ranked_index(list_fit, reverse)
+            pop = pop[sorted_idx] if isinstance(pop, Population) else [pop[idx] for idx in sorted_idx]
+            best_idx = None if best is None else np.arange(min(best, len(pop)))
+            worst_idx = None if worst is None else np.arange(len(pop) - 1, max(len(pop) - 1 - worst, -1), -1)
         else:
-            pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR], reverse=True)
-        if best is None:
-            if worst is None:
-                exit(0)
-            else:
-                return pop, None, deepcopy(pop[:-worst])
+            best_idx = None if best is None else get_top_k_index(list_fit, best, reverse)
+            worst_idx = None if worst is None else get_top_k_index(list_fit, worst, not reverse)
+        if isinstance(pop, Population):
+            list_best = None if best_idx is None else pop[best_idx].to_agents()
+            list_worst = None if worst_idx is None else pop[worst_idx].to_agents()
         else:
-            if worst is None:
-                return pop, deepcopy(pop[:best]), None
-            else:
-                return pop, deepcopy(pop[:best]), deepcopy(pop[:-worst])
+            list_best = None if best_idx is None else self.copy_population([pop[idx] for idx in best_idx])
+            list_worst = None if worst_idx is None else self.copy_population([pop[idx] for idx in worst_idx])
+        return pop, list_best, list_worst
 
     def get_special_fitness(self, pop=None):
         """
@@ -336,42 +917,52 @@ class Optimizer:
         Returns:
             Total fitness, best fitness, worst fitness
         """
-        total_fitness = np.sum([agent[self.ID_FIT][self.ID_TAR] for agent in pop])
+        if isinstance(pop, Population):
+            best_idx, worst_idx = pop.get_best_index(self.problem.minmax), pop.get_worst_index(self.problem.minmax)
+            return np.sum(pop.list_tar), pop.list_tar[best_idx], pop.list_tar[worst_idx]
+        list_fit = self.get_list_target(pop)
+        id_min, id_max = get_min_max_index(list_fit)
         if self.problem.minmax == "min":
-            pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR])
-        else:
-            pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR], reverse=True)
-        return total_fitness, pop[0][self.ID_FIT][self.ID_TAR], pop[-1][self.ID_FIT][self.ID_TAR]
+            return np.sum(list_fit), pop[id_min][self.ID_FIT][self.ID_TAR], pop[id_max][self.ID_FIT][self.ID_TAR]
+        return np.sum(list_fit), pop[id_max][self.ID_FIT][self.ID_TAR], pop[id_min][self.ID_FIT][self.ID_TAR]
 
-    def update_global_best_solution(self, pop=None, save=True):
+    def update_global_best_solution(self, pop=None, save=True, sort=True):
         """
-        Update the global best solution saved in variable named: self.history_list_g_best
+        Update the global best solution in the best tracker (and the history if its mode is not "none"). The best agent
+        is only copied when the global best is improved (and to be recorded in the history).
+
         Args:
             pop (list): The population of pop_size individuals
             save (bool): True if you want to add new current global best and False if you just want update the current one.
+            sort (bool): False if you don't need the sorted population, the best agent is found in O(n) and the
+                population is returned as it is
 
         Returns:
             Sorted population and the global best solution
         """
-        if self.problem.minmax == "min":
-            sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR])
-        else:
-            sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR], reverse=True)
-        current_best = sorted_pop[0]
-        # self.history_list_c_best.append(current_best)
-        # better = self.get_better_solution(current_best, self.history_list_g_best[-1])
-        # self.history_list_g_best.append(better)
-        if save:
-            self.history.list_current_best.append(current_best)
-            better = self.get_better_solution(current_best, self.history.list_global_best[-1])
-            self.history.list_global_best.append(better)
-            return deepcopy(sorted_pop), deepcopy(better)
+        list_fit = self.get_list_target(pop)
+        if sort:
+            sorted_idx = get_ranked_index(list_fit, self.problem.minmax != "min")
+            sorted_pop = pop[sorted_idx] if isinstance(pop, Population) else [pop[idx] for idx in sorted_idx]
+            id_best = 0
         else:
-            local_better = self.get_better_solution(current_best, self.history.list_current_best[-1])
-            self.history.list_current_best[-1] = local_better
-            global_better = self.get_better_solution(current_best, self.history.list_global_best[-1])
-            self.history.list_global_best[-1] = global_better
-            return deepcopy(sorted_pop), deepcopy(global_better)
+            sorted_pop = pop
+            id_best = int(np.argmin(list_fit)) if self.problem.minmax == "min" else int(np.argmax(list_fit))
+        ## The sorted population shares its agents with the input one, an agent of a Population is a view of the store
+        ## which is changed by the next generation, so it is copied
+        current_best = sorted_pop[id_best]
+        if isinstance(current_best, AgentView):
+            current_best = self.copy_agent(current_best)
+        is_current = self.tracker.update(current_best, save, self.copy_agent)
+        if self.history.save_best:
+            if save:
+                self.history.list_current_best.append(self.copy_agent(current_best))
+                self.history.list_global_best.append(self.tracker.agent)
+            else:
+                if is_current:
+                    self.history.list_current_best[-1] = self.copy_agent(current_best)
+                self.history.list_global_best[-1] = self.tracker.agent
+        return sorted_pop, self.copy_agent(self.tracker.agent)
 
     def print_epoch(self, epoch, runtime):
         """
@@ -381,8 +972,8 @@ class Optimizer:
             runtime (float): the runtime for current iteration
         """
         if self.verbose:
-            print(f"> Epoch: {epoch}, Current best: {self.history.list_current_best[-1][self.ID_FIT][self.ID_TAR]}, "
-                  f"Global best: {self.history.list_global_best[-1][self.ID_FIT][self.ID_TAR]}, Runtime: {runtime:.5f} seconds")
+            print(f"> Epoch: {epoch}, Current best: {self.tracker.current_target}, "
+                  f"Global best: {self.tracker.target}, Runtime: {runtime:.5f} seconds")
 
     def save_optimization_process(self):
         """
@@ -406,43 +997,70 @@ class Optimizer:
         # self.history_list_explore = 100 * (self.history_list_div / div_max)
         # self.history_list_exploit = 100 - self.history_list_explore
 
-        self.history.epoch = len(self.history.list_global_best)
-        self.history.list_global_best_fit = [agent[self.ID_FIT][self.ID_TAR] for agent in self.history.list_global_best]
-        self.history.list_current_best_fit = [agent[self.ID_FIT][self.ID_TAR] for agent in self.history.list_current_best]
-
-        # Draw the exploration and exploitation line with this data
-        self.history.list_diversity = np.ones(self.history.epoch)
-        for idx, pop in enumerate(self.history.list_population):
-            pos_matrix = np.array([agent[self.ID_POS] for agent in pop])
-            div = np.mean(abs((np.median(pos_matrix, axis=0) - pos_matrix)), axis=0)
-            self.history.list_diversity[idx] = np.mean(div, axis=0)
-        div_max = np.max(self.history.list_diversity)
-        self.history.list_exploration = 100 * (self.history.list_diversity / div_max)
-        self.history.list_exploitation = 100 - self.history.list_exploration
-        self.solution = self.history.list_global_best[-1]
+        self.history.epoch = self.tracker.n_records
+        self.history.list_global_best_fit = self.tracker.list_global_fit.copy()
+        self.history.list_current_best_fit = self.tracker.list_current_fit.copy()
+        if not self.history.save_best:
+            ## Only the latest best solutions are kept, they are copied once at the end of the run
+            self.history.list_global_best = [self.tracker.agent]
+            self.history.list_current_best = [self.copy_agent(self.tracker.current_agent)]
+
+        # Draw the exploration and exploitation line with this data (the diversity is computed in each generation)
+        if self.history.list_diversity is not None:
+            self.history.list_diversity = np.array(self.history.list_diversity)
+            div_max = np.max(self.history.list_diversity)
+            self.history.list_exploration = 100 * (self.history.list_diversity / div_max)
+            self.history.list_exploitation = 100 - self.history.list_exploration
+        self.history.flush()
+        self.solution = self.tracker.agent
+
+    def get_diversity(self, pop=None):
+        """
+        Args:
+            pop (list, Population): The population
+
+        Returns:
+            The diversity of population: mean absolute distance to the median position
+        """
+        if isinstance(pop, Population):
+            return pop.get_diversity()
+        pos_matrix = self.get_position_matrix(pop)
+        return np.mean(np.abs(np.median(pos_matrix, axis=0) - pos_matrix))
 
     ## Crossover techniques
-    def get_index_roulette_wheel_selection(self, list_fitness: np.array):
+    def get_index_roulette_wheel_selection(self, list_fitness: np.array, n_select=None):
         """
         This method can handle min/max problem, and negative or positive fitness value.
         Args:
             list_fitness (nd.array): 1-D numpy array
+            n_select (int): number of selected solutions, default = None (a single one)
 
         Returns:
-            Index of selected solution
+            Index of selected solution, or 1-D numpy array of n_select indices
         """
+        list_fitness = np.asarray(list_fitness, dtype=float)
         scaled_fitness = (list_fitness - np.min(list_fitness)) / (np.ptp(list_fitness) + self.EPSILON)
         if self.problem.minmax == "min":
             final_fitness = 1.0 - scaled_fitness
         else:
             final_fitness = scaled_fitness
-        total_sum = sum(final_fitness)
-        r = np.random.uniform(low=0, high=total_sum)
-        for idx, f in enumerate(final_fitness):
-            r = r + f
-            if r > total_sum:
-                return idx
-        return np.random.choice(range(0, len(list_fitness)))
+        if n_select is None:
+            return int(get_roulette_wheel_index(final_fitness, 1)[0])
+        return get_roulette_wheel_index(final_fitness, n_select)
+
+    def get_index_kway_tournament_selection(self, list_fitness: np.array, k_way=0.2, n_select=None):
+        """
+        Args:
+            list_fitness (nd.array): 1-D numpy array
+            k_way (int, float): number of solutions in a tournament, or a fraction of the population if in range (0, 1)
+            n_select (int): number of tournaments, default = None (a single one)
+
+        Returns:
+            Index of the winner, or 1-D numpy array of the n_select winners
+        """
+        if n_select is None:
+            return int(get_kway_tournament_index(list_fitness, k_way, 1, self.problem.minmax)[0])
+        return get_kway_tournament_index(list_fitness, k_way, n_select, self.problem.minmax)
 
     def get_solution_kway_tournament_selection(self, pop: list, k_way=0.2, output=2):
         if 0 < k_way < 1:
@@ -456,6 +1074,38 @@ class Optimizer:
         else:
             return list_parents[-output:]
 
+    def get_index_distinct_random(self, k=None, idx=None, low=0, high=None):
+        """
+        A faster replacement of np.random.choice(list(set(range(low, high)) - {idx}), k, replace=False)
+
+        Args:
+            k (int): number of distinct indices, default = None (a single index)
+            idx (int, list): the excluded index (or indices), default = None
+            low (int): the first index, default = 0
+            high (int): the last index + 1, default = pop_size
+
+        Returns:
+            1-D numpy array of k distinct random indices in range [low, high) without idx, or a single index if k is None
+        """
+        high = self.pop_size if high is None else high
+        exclude = () if idx is None else np.ravel(idx).tolist()
+        list_idx = get_distinct_random_sample(low, high, 1 if k is None else k, exclude)
+        return list_idx[0] if k is None else np.array(list_idx)
+
+    def get_index_distinct_random_matrix(self, k=3, n_total=None):
+        """
+        Distinct random indices of the whole population at once, the row i doesn't contain i (the donors of DE,...)
+
+        Args:
+            k (int): number of distinct indices of each agent
+            n_total (int): number of agents, default = pop_size
+
+        Returns:
+            2-D int array (n_total, k)
+        """
+        n_total = self.pop_size if n_total is None else n_total
+        return get_distinct_random_index(n_total, k, np.arange(n_total))
+
     def get_levy_flight_step(self, beta=1.0, multiplier=0.001, case=0):
         """
         Parameters
@@ -557,12 +1207,16 @@ class Optimizer:
         Returns:
             The global best and the global worst solution
         """
-        # Already returned a new sorted list
-        sorted_pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR])
+        if isinstance(pop, Population):
+            best_idx, worst_idx = pop.get_best_index(self.problem.minmax), pop.get_worst_index(self.problem.minmax)
+            return self.copy_agent(pop[best_idx]), self.copy_agent(pop[worst_idx])
+        list_fit = self.get_list_target(pop)
+        id_min = int(np.argmin(list_fit))
+        id_max = len(pop) - 1 - int(np.argmax(list_fit[::-1]))     # The last one, as the sorted population
         if self.problem.minmax == "min":
-            return deepcopy(sorted_pop[0]), deepcopy(sorted_pop[-1])
+            return self.copy_agent(pop[id_min]), self.copy_agent(pop[id_max])
         else:
-            return deepcopy(sorted_pop[-1]), deepcopy(sorted_pop[0])
+            return self.copy_agent(pop[id_max]), self.copy_agent(pop[id_min])
 
     ### Survivor Selection
     def greedy_selection_population(self, pop_old=None, pop_new=None):
@@ -574,6 +1228,11 @@ class Optimizer:
         Returns:
             The new population with better solutions
         """
+        if isinstance(pop_old, Population) or isinstance(pop_new, Population):
+            ## A list of evaluated agents is moved into a store, the selection is done on the arrays
+            pop_old = pop_old if isinstance(pop_old, Population) else Population.from_agents(pop_old)
+            pop_new = pop_new if isinstance(pop_new, Population) else Population.from_agents(pop_new)
+            return pop_old.greedy_selection(pop_new, self.problem.minmax)
         len_old, len_new = len(pop_old), len(pop_new)
         if len_old != len_new:
             print("Pop old and Pop new should be the same length!")
@@ -590,15 +1249,16 @@ class Optimizer:
         Args:
             pop (list): The population
             pop_size (int): The number of population
+            reverse (bool): From the worst agent if True
 
         Returns:
-            The sorted population with pop_size size
+            The sorted population with pop_size size, from the best agent
         """
-        if self.problem.minmax == "min":
-            pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR], reverse=reverse)
-        else:
-            pop = sorted(pop, key=lambda agent: agent[self.ID_FIT][self.ID_TAR], reverse=reverse)
-        return pop[:pop_size]
+        ## Only the kept agents are sorted: O(n + pop_size.log(pop_size)) instead of sorting the whole merged population
+        sorted_idx = get_top_k_index(self.get_list_target(pop), pop_size, reverse != (self.problem.minmax != "min"))
+        if isinstance(pop, Population):
+            return pop[sorted_idx]
+        return [pop[idx] for idx in sorted_idx]
 
     def create_opposition_position(self, agent=None, g_best=None):
         """
@@ -643,7 +1303,7 @@ class Optimizer:
         ## Mutation scheme
         pop_new = []
         for i in range(0, pop_len):
-            agent = deepcopy(pop_s1[i])
+            agent = self.copy_agent(pop_s1[i])
             pos_new = pop_s1[i][self.ID_POS] * (1 + np.random.normal(0, 1, self.problem.n_dims))
             agent[self.ID_POS] = self.amend_position_faster(pos_new)
             pop_new.append(agent)
@@ -655,7 +1315,7 @@ class Optimizer:
         pos_s1_mean = np.mean(pos_s1_list, axis=0)
         pop_new = []
         for i in range(0, pop_len):
-            agent = deepcopy(pop_s2[i])
+            agent = self.copy_agent(pop_s2[i])
             pos_new = (g_best[self.ID_POS] - pos_s1_mean) - np.random.random() * \
                       (self.problem.lb + np.random.random() * (self.problem.ub - self.problem.lb))
             agent[self.ID_POS] = self.amend_position_faster(pos_new)
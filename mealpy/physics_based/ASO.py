@@ -130,7 +130,7 @@ class BaseASO(Optimizer):
         pop_new = self.update_fitness_population(pop_new)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
-        _, current_best = self.get_global_best_solution(pop_new)
+        _, current_best = self.get_global_best_solution(pop_new, sort=False)
         if self.compare_agent(self.g_best, current_best):
             pop_new[np.random.randint(0, self.pop_size)] = deepcopy(self.g_best)
         self.pop = pop_new
@@ -91,7 +91,7 @@ class OriginalArchOA(Optimizer):
             # Exploration phase
             if tf <= 0.5:
                 # Update acceleration using Eq. 10 and normalize acceleration using Eq. 12
-                id_rand = np.random.choice(list(set(range(0, self.pop_size)) - {i}))
+                id_rand = self.get_index_distinct_random(idx=i)
                 new_acc = (self.pop[id_rand][self.ID_DEN] + self.pop[id_rand][self.ID_VOL] * self.pop[id_rand][self.ID_ACC]) / (new_den * new_vol)
             else:
                 new_acc = (self.g_best[self.ID_DEN] + self.g_best[self.ID_VOL] * self.g_best[self.ID_ACC]) / (new_den * new_vol)
@@ -108,7 +108,7 @@ class OriginalArchOA(Optimizer):
         for idx in range(0, self.pop_size):
             solution = deepcopy(self.pop[idx])
             if tf <= 0.5:  # update position using Eq. 13
-                id_rand = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+                id_rand = self.get_index_distinct_random(idx=idx)
                 pos_new = self.pop[idx][self.ID_POS] + self.c1 * np.random.uniform() * \
                           self.pop[idx][self.ID_ACC] * ddf * (self.pop[id_rand][self.ID_POS] - self.pop[idx][self.ID_POS])
             else:
@@ -91,6 +91,7 @@ class OriginalEFO(BaseEFO):
 
         https://www.mathworks.com/matlabcentral/fileexchange/73352-equilibrium-optimizer-eo
     """
+    SUPPORT_PARALLEL = False
 
     def __init__(self, problem, epoch=10000, pop_size=100, r_rate=0.3, ps_rate=0.85, p_field=0.1, n_field=0.45, **kwargs):
         """
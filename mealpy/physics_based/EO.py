@@ -51,7 +51,7 @@ class BaseEO(Optimizer):
             epoch (int): The current iteration
         """
         # ---------------- Memory saving-------------------  make equilibrium pool
-        _, c_eq_list, _ = self.get_special_solutions(self.pop, best=4)
+        _, c_eq_list, _ = self.get_special_solutions(self.pop, best=4, sort=False)
         c_pool = self.make_equilibrium_pool(c_eq_list)
         # Eq. 9
         t = (1 - epoch / self.epoch) ** (self.a2 * epoch / self.epoch)
@@ -98,7 +98,7 @@ class ModifiedEO(BaseEO):
             epoch (int): The current iteration
         """
         # ---------------- Memory saving-------------------  make equilibrium pool
-        _, c_eq_list, _ = self.get_special_solutions(self.pop, best=4)
+        _, c_eq_list, _ = self.get_special_solutions(self.pop, best=4, sort=False)
         c_pool = self.make_equilibrium_pool(c_eq_list)
 
         # Eq. 9
@@ -121,7 +121,7 @@ class ModifiedEO(BaseEO):
         pop_new = self.update_fitness_population(pop_new)
 
         ## Sort the updated population based on fitness
-        _, pop_s1, _ = self.get_special_solutions(pop_new, best=self.pop_len)
+        _, pop_s1, _ = self.get_special_solutions(pop_new, best=self.pop_len, sort=False)
 
         ## Mutation scheme
         pop_s2_new = []
@@ -176,7 +176,7 @@ class AdaptiveEO(BaseEO):
             epoch (int): The current iteration
         """
         # ---------------- Memory saving-------------------  make equilibrium pool
-        _, c_eq_list, _ = self.get_special_solutions(self.pop, best=4)
+        _, c_eq_list, _ = self.get_special_solutions(self.pop, best=4, sort=False)
         c_pool = self.make_equilibrium_pool(c_eq_list)
 
         # Eq. 9
@@ -67,14 +67,14 @@ class BaseHGSO(Optimizer):
 
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
         self.pop_group = self._create_group(self.pop)
         self.p_best = self._get_best_solution_in_team(self.pop_group)  # multiple element
 
     def _get_best_solution_in_team(self, group=None):
         list_best = []
         for i in range(len(group)):
-            _, best_agent = self.get_global_best_solution(group[i])
+            _, best_agent = self.get_global_best_solution(group[i], sort=False)
             list_best.append(best_agent)
         return list_best
 
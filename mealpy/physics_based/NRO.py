@@ -93,7 +93,7 @@ class BaseNRO(Optimizer):
         for i in range(self.pop_size):
             X_ion = deepcopy(pop_new[i][self.ID_POS])
             if (ranked_pop[i] * 1.0 / self.pop_size) < np.random.random():
-                i1, i2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+                i1, i2 = self.get_index_distinct_random(2, i)
                 for j in range(self.problem.n_dims):
                     #### Levy flight strategy is described as Eq. 18
                     if pop_new[i2][self.ID_POS][j] == pop_new[i][self.ID_POS][j]:
@@ -106,7 +106,7 @@ class BaseNRO(Optimizer):
                             X_ion[j] = pop_new[i1][self.ID_POS][j] - np.random.uniform() * (pop_new[i2][self.ID_POS][j] - pop_new[i][self.ID_POS][j])
 
             else:  #### Levy flight strategy is described as Eq. 21
-                _, _, worst = self.get_special_solutions(pop_new, worst=1)
+                _, _, worst = self.get_special_solutions(pop_new, worst=1, sort=False)
                 X_worst = worst[0]
                 for j in range(self.problem.n_dims):
                     ##### Based on Eq. 21
@@ -129,7 +129,7 @@ class BaseNRO(Optimizer):
         pop_new = []
         ranked_pop = np.argsort([pop_child[i][self.ID_FIT][self.ID_TAR] for i in range(self.pop_size)])
         for i in range(self.pop_size):
-            i1, i2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+            i1, i2 = self.get_index_distinct_random(2, i)
 
             #### Generate fusion nucleus
             if (ranked_pop[i] * 1.0 / self.pop_size) < np.random.random():
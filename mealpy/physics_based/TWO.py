@@ -51,7 +51,7 @@ class BaseTWO(Optimizer):
         return [solution, fitness, weight]
 
     def _update_weight(self, teams):
-        _, best, worst = self.get_special_solutions(teams, best=1, worst=1)
+        _, best, worst = self.get_special_solutions(teams, best=1, worst=1, sort=False)
         best_fit = best[0][self.ID_FIT][self.ID_TAR]
         worst_fit = worst[0][self.ID_FIT][self.ID_TAR]
         if best_fit == worst_fit:
@@ -64,7 +64,7 @@ class BaseTWO(Optimizer):
 
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
         self.pop = self._update_weight(self.pop)
 
     def evolve(self, epoch):
@@ -124,7 +124,7 @@ class OppoTWO(BaseTWO):
         pop_oppo = self.update_fitness_population(pop_oppo)
         self.pop = pop_temp + pop_oppo
         self.pop = self._update_weight(self.pop)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
 
     def evolve(self, epoch):
         """
@@ -155,15 +155,17 @@ class OppoTWO(BaseTWO):
             pop_new[i][self.ID_POS] = pos_new
         pop_new = self.update_fitness_population(pop_new)
 
-        ## Opposition-based here
+        ## Opposition-based here, the opposite positions are evaluated in a batch
+        list_idx, list_pos = [], []
         for i in range(self.pop_size):
             if self.compare_agent(self.pop[i], pop_new[i]):
                 self.pop[i] = deepcopy(pop_new[i])
             else:
-                C_op = self.create_opposition_position(self.pop[i][self.ID_POS], self.g_best[self.ID_POS])
-                fit_op = self.get_fitness_position(C_op)
-                if self.compare_agent(self.pop[i], [C_op, fit_op]):
-                    self.pop[i] = [C_op, fit_op, 0.0]
+                list_idx.append(i)
+                list_pos.append(self.create_opposition_position(self.pop[i][self.ID_POS], self.g_best[self.ID_POS]))
+        for i, C_op, fit_op in zip(list_idx, list_pos, self.get_fitness_batch(list_pos)):
+            if self.compare_agent(self.pop[i], [C_op, fit_op]):
+                self.pop[i] = [C_op, fit_op, 0.0]
         self.pop = self._update_weight(self.pop)
 
 
@@ -215,16 +217,18 @@ class LevyTWO(BaseTWO):
         self.pop = self.greedy_selection_population(self.pop, pop_new)
         self.pop = self._update_weight(pop_new)
 
-        ### Apply levy-flight here
+        ### Apply levy-flight here, the new positions are evaluated in a batch
+        list_idx, list_pos = [], []
         for i in range(self.pop_size):
             if self.compare_agent(self.pop[i], pop_new[i]):
                 self.pop[i] = deepcopy(pop_new[i])
             else:
                 levy_step = self.get_levy_flight_step(beta=1.0, multiplier=0.001, case=-1)
                 pos_new = pop_new[i][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * levy_step
-                pos_new = self.amend_position_faster(pos_new)
-                fit_new = self.get_fitness_position(pos_new)
-                self.pop[i] = [pos_new, fit_new, 0.0]
+                list_idx.append(i)
+                list_pos.append(self.amend_position_faster(pos_new))
+        for i, pos_new, fit_new in zip(list_idx, list_pos, self.get_fitness_batch(list_pos)):
+            self.pop[i] = [pos_new, fit_new, 0.0]
         self.pop = self._update_weight(pop_new)
 
 
@@ -286,18 +290,23 @@ class ImprovedTWO(OppoTWO, LevyTWO):
         self.pop = self.greedy_selection_population(self.pop, pop_new)
         self.pop = self._update_weight(pop_new)
 
+        ## The opposite positions are evaluated in a batch, then the levy-flight positions of the agents they didn't improve
+        list_idx, list_pos = [], []
         for i in range(self.pop_size):
             if self.compare_agent(self.pop[i], pop_new[i]):
                 self.pop[i] = deepcopy(pop_new[i])
             else:
-                C_op = self.create_opposition_position(self.pop[i][self.ID_POS], self.g_best[self.ID_POS])
-                fit_op = self.get_fitness_position(C_op)
-                if self.compare_agent([C_op, fit_op], self.pop[i]):
-                    self.pop[i] = [C_op, fit_op, 0.0]
-                else:
-                    levy_step = self.get_levy_flight_step(beta=1.0, multiplier=0.001, case=-1)
-                    pos_new = pop_new[i][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * levy_step
-                    pos_new = self.amend_position_faster(pos_new)
-                    fit_new = self.get_fitness_position(pos_new)
-                    self.pop[i] = [pos_new, fit_new, 0.0]
+                list_idx.append(i)
+                list_pos.append(self.create_opposition_position(self.pop[i][self.ID_POS], self.g_best[self.ID_POS]))
+        list_idx_levy, list_pos_levy = [], []
+        for i, C_op, fit_op in zip(list_idx, list_pos, self.get_fitness_batch(list_pos)):
+            if self.compare_agent([C_op, fit_op], self.pop[i]):
+                self.pop[i] = [C_op, fit_op, 0.0]
+            else:
+                levy_step = self.get_levy_flight_step(beta=1.0, multiplier=0.001, case=-1)
+                pos_new = pop_new[i][self.ID_POS] + 1.0 / np.sqrt(epoch + 1) * np.sign(np.random.random() - 0.5) * levy_step
+                list_idx_levy.append(i)
+                list_pos_levy.append(self.amend_position_faster(pos_new))
+        for i, pos_new, fit_new in zip(list_idx_levy, list_pos_levy, self.get_fitness_batch(list_pos_levy)):
+            self.pop[i] = [pos_new, fit_new, 0.0]
         self.pop = self._update_weight(pop_new)
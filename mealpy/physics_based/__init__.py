@@ -7,3 +7,6 @@
 #       Github:     https://github.com/thieu1995                                                  %
 #-------------------------------------------------------------------------------------------------------%
 
+from mealpy.utils.lazy import get_lazy_attributes
+
+__getattr__, __dir__ = get_lazy_attributes(__name__, __path__, globals())
@@ -38,11 +38,7 @@ class BaseCEM(Optimizer):
         self.means = np.random.uniform(self.problem.lb, self.problem.ub)
         self.stdevs = np.abs(self.problem.ub - self.problem.lb)
 
-    def evolve(self, epoch):
-        """
-        Args:
-            epoch (int): The current iteration
-        """
+    def update_distribution(self):
         ## Selected the best samples and update means and stdevs
         pop_best = self.pop[:self.n_best]
         pos_list = np.array([item[self.ID_POS] for item in pop_best])
@@ -53,6 +49,19 @@ class BaseCEM(Optimizer):
         self.means = self.alpha * self.means + (1.0 - self.alpha) * means_new
         self.stdevs = np.abs(self.alpha * self.stdevs + (1.0 - self.alpha) * stdevs_new)
 
+    def prepare_candidates(self, epoch):
+        self.update_distribution()
+
+    def create_candidate(self, idx, epoch):
+        return [self.amend_position_faster(np.random.normal(self.means, self.stdevs))]
+
+    def evolve(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        self.update_distribution()
+
         ## Create new population for next generation
         pop_new = []
         for idx in range(0, self.pop_size):
@@ -61,3 +70,13 @@ class BaseCEM(Optimizer):
         pop_new = self.update_fitness_population(pop_new)
         self.pop = self.greedy_selection_population(self.pop, pop_new)
 
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        self.update_distribution()
+        pos_new = np.random.normal(self.means, self.stdevs, (self.pop_size, self.problem.n_dims))
+        pos_new = self.amend_position_faster(pos_new)
+        pop_new = self.update_fitness_population([[pos, None] for pos in pos_new])
+        self.pop = self.greedy_selection_population(self.pop, pop_new)
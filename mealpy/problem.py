@@ -16,6 +16,7 @@ class Problem:
 
     DEFAULT_BATCH_IDEA = False
     DEFAULT_BATCH_SIZE = 10
+    DEFAULT_VECTORIZED = False
     DEFAULT_LB = -1
     DEFAULT_UB = 1
 
@@ -35,11 +36,16 @@ class Problem:
                 "batch_idea": True or False (Optional)
                 "batch_size": int (Optional, smaller than population size)
                 "obj_weight": list weights for all your objectives (Optional, default = [1, 1, ...1])
+                "vectorized": True or False (Optional, default = False)
              }
+
+            With "vectorized": True, your obj_func receives a 2-D matrix of positions (n, n_dims) and it has to return
+            an array (n,) for a single objective or (n, n_objs) for multiple objectives.
         """
         self.minmax = "min"
         self.batch_size = 10
         self.batch_idea = False
+        self.vectorized = False
         self.verbose = True
         self.n_objs = 1
         self.obj_weight = None
@@ -128,6 +134,12 @@ class Problem:
                 self.batch_size = self.DEFAULT_BATCH_SIZE
         else:
             self.batch_idea = self.DEFAULT_BATCH_IDEA
+        if "vectorized" in kwargs:
+            vectorized = kwargs["vectorized"]
+            if type(vectorized) == bool:
+                self.vectorized = vectorized
+            else:
+                self.vectorized = self.DEFAULT_VECTORIZED
 
     def __check_objective_function__(self, kwargs):
         if "obj_func" in kwargs:
@@ -137,6 +149,9 @@ class Problem:
             else:
                 print("Please check your function. It needs to return value!")
                 exit(0)
+        if self.vectorized:
+            self.__check_vectorized_objective_function__(kwargs)
+            return None
         tested_solution = np.random.uniform(self.lb, self.ub)
         try:
             result = self.obj_func(tested_solution)
@@ -144,6 +159,24 @@ class Problem:
             print(f"Error: {err}\n")
             print("Please check your defined objective function!")
             exit(0)
+        self.__check_objective_result__(result, kwargs)
+
+    def __check_vectorized_objective_function__(self, kwargs):
+        tested_solutions = np.random.uniform(self.lb, self.ub, (2, self.n_dims))
+        try:
+            result = np.asarray(self.obj_func(tested_solutions))
+        except Exception as err:
+            print(f"Error: {err}\n")
+            print("Please check your defined vectorized objective function!")
+            exit(0)
+        if result.ndim in (1, 2) and len(result) == len(tested_solutions):
+            self.__check_objective_result__(result[0], kwargs)      # Check the objective values of the first position
+        else:
+            print(f"Please check your vectorized objective function. It needs to return an array with shape (n,) or (n, n_objs), "
+                  f"but it returns shape {result.shape} for the input shape {tested_solutions.shape}.")
+            exit(0)
+
+    def __check_objective_result__(self, result, kwargs):
         if isinstance(result, list) or isinstance(result, np.ndarray):
             self.n_objs = len(result)
             self.obj_is_list = True
@@ -178,3 +211,34 @@ class Problem:
             else:
                 print("Please check your objective function. It needs to return value!")
                 exit(0)
+
+    def get_fitness(self, position=None):
+        """
+        Call the objective function. The worker pool of the optimizer uses this method of the problem, so only the
+        problem is sent to the workers, not the optimizer with its population and history
+
+        Args:
+            position (nd.array): 1-D numpy array
+
+        Returns:
+            [target, [obj1, obj2, ...]]
+        """
+        objs = self.obj_func(position)
+        if not self.obj_is_list:
+            objs = [objs]
+        fit = np.dot(objs, self.obj_weight)
+        return [fit, objs]
+
+    def get_fitness_vectorized(self, list_pos=None):
+        """
+        Call the vectorized objective function
+
+        Args:
+            list_pos (nd.array): 2-D numpy array with shape (n, n_dims)
+
+        Returns:
+            list of [target, [obj1, obj2, ...]]
+        """
+        list_objs = np.reshape(self.obj_func(list_pos), (len(list_pos), self.n_objs))
+        list_fit = np.dot(list_objs, self.obj_weight)
+        return [[list_fit[idx], list_objs[idx]] for idx in range(0, len(list_pos))]
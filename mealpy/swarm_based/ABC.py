@@ -58,7 +58,7 @@ class BaseABC(Optimizer):
             new_bee[t1] = np.maximum(self.problem.lb[t1], np.minimum(self.problem.ub[t1], new_bee[t1]))
             pop_neigh.append([new_bee, None])
         pop_neigh = self.update_fitness_population(pop_neigh)
-        _, current_best = self.get_global_best_solution(pop_neigh)
+        _, current_best = self.get_global_best_solution(pop_neigh, sort=False)
         return current_best
 
     def evolve(self, epoch):
@@ -9,6 +9,7 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
+from mealpy.utils.selection import get_roulette_wheel_index
 
 
 class BaseACOR(Optimizer):
@@ -65,15 +66,14 @@ class BaseACOR(Optimizer):
             matrix_sigma.append(temp)
         matrix_sigma = np.array(matrix_sigma)
 
-        # Generate Samples
+        # Generate Samples, the Gaussian kernel of each dimension of each sample is selected with the probabilities matrix_p
+        list_idx = get_roulette_wheel_index(matrix_p, self.sample_count * self.problem.n_dims).reshape((self.sample_count, -1))
+        list_dims = np.arange(self.problem.n_dims)
+        list_child = matrix_pos[list_idx, list_dims] + \
+                     np.random.normal(size=(self.sample_count, self.problem.n_dims)) * matrix_sigma[list_idx, list_dims]  # (1)
         pop_new = []
         for idx in range(0, self.sample_count):
-            # Generate Samples
-            child = np.zeros(self.problem.n_dims)
-            for j in range(0, self.problem.n_dims):
-                idx = self.get_index_roulette_wheel_selection(matrix_p)
-                child[j] = pop[idx][self.ID_POS][j] + np.random.normal() * matrix_sigma[idx, j]  # (1)
-            pos_new = self.amend_position_faster(child)  # (2)
+            pos_new = self.amend_position_faster(list_child[idx])  # (2)
             pop_new.append([pos_new, None])
         pop_new = self.update_fitness_population(pop_new)
         self.pop = pop + pop_new
@@ -21,6 +21,8 @@ class OriginalALO(Optimizer):
         http://dx.doi.org/10.1016/j.advengsoft.2015.01.010
     """
 
+    WALK_STEPS = 1000       # Maximum length of the random walks
+
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
         Args:
@@ -36,7 +38,20 @@ class OriginalALO(Optimizer):
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = True
 
-    def _random_walk_around_antlion__(self, solution, current_epoch):
+    def _random_walk_around_antlion__(self, list_solutions, current_epoch):
+        """
+        Random walks of many ants at the same time. Only the value of each walk at the current step is needed, so the
+        walks are not built with the full length epoch: when epoch > WALK_STEPS, a walk of WALK_STEPS steps is used and
+        the current step is scaled to it. The normalized value (X[t] - min(X)) / (max(X) - min(X)) depends only on the
+        shape of the walk, so its distribution is kept (it is exact when epoch <= WALK_STEPS).
+
+        Args:
+            list_solutions (nd.array): 2-D numpy array (n_ants, n_dims), the antlion of each ant
+            current_epoch (int): The current iteration
+
+        Returns:
+            2-D numpy array (n_ants, n_dims), the positions of the ants at the current step of their walks
+        """
         I = 1  # I is the ratio in Equations (2.10) and (2.11)
         if current_epoch > self.epoch / 10:
             I = 1 + 100 * (current_epoch / self.epoch)
@@ -53,27 +68,26 @@ class OriginalALO(Optimizer):
         lb = self.problem.lb / I  # Equation (2.10) in the paper
         ub = self.problem.ub / I  # Equation (2.10) in the paper
 
-        # Move the interval of [lb ub] around the antlion [lb+anlion ub+antlion]
-        if np.random.rand() < 0.5:
-            lb = lb + solution # Equation(2.8) in the paper
-        else:
-            lb = -lb + solution
-        if np.random.rand() < 0.5:
-            ub = ub + solution  # Equation(2.9) in the paper
-        else:
-            ub = -ub + solution
-
-        # This function creates n random walks and normalize according to lb and ub vectors,
-        temp = []
-        for k in range(0, self.problem.n_dims):
-            X = np.cumsum(2 * (np.random.rand(self.epoch, 1) > 0.5) - 1)
-            a = np.min(X)
-            b = np.max(X)
-            c = lb[k]       # [a b] - -->[c d]
-            d = ub[k]
-            X_norm = ((X - a)* (d - c)) / (b - a) + c    # Equation(2.7) in the paper
-            temp.append(X_norm)
-        return np.array(temp)
+        # Move the interval of [lb ub] around the antlion [lb+anlion ub+antlion]. Eq 2.8, 2.9
+        n_ants = len(list_solutions)
+        lb = np.where(np.random.rand(n_ants, 1) < 0.5, lb, -lb) + list_solutions
+        ub = np.where(np.random.rand(n_ants, 1) < 0.5, ub, -ub) + list_solutions
+
+        # This function creates n random walks and normalize according to lb and ub vectors, Equation(2.7) in the paper
+        n_steps = min(self.epoch, self.WALK_STEPS)
+        id_step = current_epoch if n_steps == self.epoch else max(int((current_epoch + 1) * n_steps / self.epoch) - 1, 0)
+        X_norm = np.empty((n_ants * self.problem.n_dims))
+        n_walks = max(2**20 // n_steps, 1)          # Number of walks built at once, to limit the memory
+        for idx in range(0, len(X_norm), n_walks):
+            size = min(n_walks, len(X_norm) - idx)
+            # Each step is +1 or -1 with the same probability, taken from the bits of random bytes (8 steps per byte)
+            bits = np.unpackbits(np.frombuffer(np.random.bytes(size * ((n_steps + 7) // 8)), dtype=np.uint8))
+            X = np.cumsum(2 * np.reshape(bits, (size, -1))[:, :n_steps].astype(np.int32) - 1, axis=1)
+            a = np.min(X, axis=1)
+            b = np.max(X, axis=1)
+            X_norm[idx:idx+size] = (X[:, id_step] - a) / (b - a)
+        X_norm = np.reshape(X_norm, (n_ants, self.problem.n_dims))
+        return X_norm * (ub - lb) + lb
 
     def evolve(self, epoch):
         """
@@ -81,23 +95,20 @@ class OriginalALO(Optimizer):
             epoch (int): The current iteration
         """
         list_fitness = np.array([item[self.ID_FIT][self.ID_TAR] for item in self.pop])
-        # This for loop simulate random walks
+        # Select ant lions based on their fitness (the better anlion the higher chance of catching ant)
+        list_idx = self.get_index_roulette_wheel_selection(list_fitness, n_select=self.pop_size)
+
+        # This simulates the random walks of all ants at once
+        # RA is the random walk around the selected antlion by rolette wheel
+        RA = self._random_walk_around_antlion__(np.array([self.pop[idx][self.ID_POS] for idx in list_idx]), epoch)
+        # RE is the random walk around the elite (best antlion so far)
+        RE = self._random_walk_around_antlion__(np.repeat([self.g_best[self.ID_POS]], self.pop_size, axis=0), epoch)
+        list_temp = (RA + RE) / 2  # Equation(2.13) in the paper
 
         pop_new = []
         for idx in range(0, self.pop_size):
-            # Select ant lions based on their fitness (the better anlion the higher chance of catching ant)
-            rolette_index = self.get_index_roulette_wheel_selection(list_fitness)
-
-            # RA is the random walk around the selected antlion by rolette wheel
-            RA = self._random_walk_around_antlion__(self.pop[rolette_index][self.ID_POS], epoch)
-
-            # RE is the random walk around the elite (best antlion so far)
-            RE = self._random_walk_around_antlion__(self.g_best[self.ID_POS], epoch)
-
-            temp = (RA[:, epoch] + RE[:, epoch]) / 2  # Equation(2.13) in the paper
-
             # Bound checking (bring back the antlions of ants inside search space if they go beyonds the boundaries
-            pos_new = self.amend_position_faster(temp)
+            pos_new = self.amend_position_faster(list_temp[idx])
             pop_new.append([pos_new, None])
         pop_new = self.update_fitness_population(pop_new)
 
@@ -128,36 +139,3 @@ class BaseALO(OriginalALO):
         super().__init__(problem, epoch, pop_size, **kwargs)
         self.nfe_per_epoch = self.pop_size
         self.sort_flag = True
-
-    def _random_walk_around_antlion__(self, solution, current_epoch):
-        I = 1  # I is the ratio in Equations (2.10) and (2.11)
-        if current_epoch > self.epoch / 10:
-            I = 1 + 100 * (current_epoch / self.epoch)
-        if current_epoch > self.epoch  / 2:
-            I = 1 + 1000 * (current_epoch / self.epoch)
-        if current_epoch > self.epoch  * (3 / 4):
-            I = 1 + 10000 * (current_epoch / self.epoch)
-        if current_epoch > self.epoch  * 0.9:
-            I = 1 + 100000 * (current_epoch / self.epoch)
-        if current_epoch > self.epoch  * 0.95:
-            I = 1 + 1000000 * (current_epoch / self.epoch)
-
-        # Dicrease boundaries to converge towards antlion
-        lb = self.problem.lb / I  # Equation (2.10) in the paper
-        ub = self.problem.ub / I  # Equation (2.10) in the paper
-
-        # Move the interval of [lb ub] around the antlion [lb+anlion ub+antlion]. Eq 2.8, 2.9
-        lb = lb + solution if np.random.rand() < 0.5 else -lb + solution
-        ub = ub + solution if np.random.rand() < 0.5 else -ub + solution
-
-        # This function creates n random walks and normalize according to lb and ub vectors,
-        ## Using matrix and vector for better performance
-        X = np.array([np.cumsum(2 * (np.random.rand(self.epoch, 1) > 0.5) - 1) for _ in range(0, self.problem.n_dims)])
-        a = np.min(X, axis=1)
-        b = np.max(X, axis=1)
-        temp1 = np.reshape((ub - lb) / (b - a), (self.problem.n_dims, 1))
-        temp0 = X - np.reshape(a, (self.problem.n_dims, 1))
-        X_norm = temp0 * temp1 + np.reshape(lb, (self.problem.n_dims, 1))
-        return X_norm
-
-
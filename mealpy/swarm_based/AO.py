@@ -72,7 +72,7 @@ class OriginalAO(Optimizer):
                     pos_new = self.g_best[self.ID_POS] * (1 - (epoch + 1) / self.epoch) + \
                               np.random.rand() * (x_mean - self.g_best[self.ID_POS])
                 else:
-                    idx = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+                    idx = self.get_index_distinct_random(idx=idx)
                     pos_new = self.g_best[self.ID_POS] * self.get_simple_levy_step() + \
                               self.pop[idx][self.ID_POS] + np.random.rand() * (y - x)  # Eq. 5
             else:
@@ -87,7 +87,7 @@ class BaseBES(Optimizer):
 
         pop_child = []
         for idx in range(0, self.pop_size):
-            idx_rand = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+            idx_rand = self.get_index_distinct_random(idx=idx)
             pos_new = pop_new[idx][self.ID_POS] + y_list[idx] * (pop_new[idx][self.ID_POS] - pop_new[idx_rand][self.ID_POS]) + \
                       x_list[idx] * (pop_new[idx][self.ID_POS] - pos_mean)
             pos_new = self.amend_position_faster(pos_new)
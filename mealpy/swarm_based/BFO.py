@@ -10,6 +10,7 @@
 import numpy as np
 from copy import deepcopy
 from mealpy.optimizer import Optimizer
+from mealpy.utils.distance import get_distance_sums
 
 
 class OriginalBFO(Optimizer):
@@ -22,6 +23,7 @@ class OriginalBFO(Optimizer):
             + The Nc parameter will also decreased to reduce the computation time.
             + Cost in this version equal to Fitness value in the paper.
     """
+    SUPPORT_PARALLEL = False
     ID_POS = 0
     ID_FIT = 1
     ID_COST = 2
@@ -68,20 +70,17 @@ class OriginalBFO(Optimizer):
         sum_nutrients = 0.0
         return [position, fitness, cost, interaction, sum_nutrients]
 
-    def _compute_cell_interaction(self, cell, cells, d, w):
-        sum_inter = 0.0
-        for other in cells:
-            diff = self.problem.n_dims * ((cell[self.ID_POS] - other[self.ID_POS]) ** 2).mean(axis=None)
-            sum_inter += d * np.exp(w * diff)
-        return sum_inter
+    def _compute_cell_interaction(self, cell, list_pos, d, w):
+        ## d * exp(w * ||cell - other||^2) summed over all cells, list_pos is the position matrix of the cells
+        return get_distance_sums(cell[self.ID_POS], list_pos, lambda dist: d * np.exp(w * dist ** 2))[0]
 
-    def _attract_repel(self, idx, cells):
-        attract = self._compute_cell_interaction(cells[idx], cells, -self.d_attr, -self.w_attr)
-        repel = self._compute_cell_interaction(cells[idx], cells, self.h_rep, -self.w_rep)
+    def _attract_repel(self, idx, cells, list_pos):
+        attract = self._compute_cell_interaction(cells[idx], list_pos, -self.d_attr, -self.w_attr)
+        repel = self._compute_cell_interaction(cells[idx], list_pos, self.h_rep, -self.w_rep)
         return attract + repel
 
-    def _evaluate(self, idx, cells):
-        cells[idx][self.ID_INTER] = self._attract_repel(idx, cells)
+    def _evaluate(self, idx, cells, list_pos):
+        cells[idx][self.ID_INTER] = self._attract_repel(idx, cells, list_pos)
         cells[idx][self.ID_COST] = cells[idx][self.ID_FIT][self.ID_TAR] + cells[idx][self.ID_INTER]
         return cells
 
@@ -98,9 +97,10 @@ class OriginalBFO(Optimizer):
         """
         nfe_epoch = 0
         for j in range(0, self.chem_steps):
+            list_pos = self.get_position_matrix(self.pop)      # Updated when a cell moves
             for idx in range(0, self.pop_size):
                 sum_nutrients = 0.0
-                self.pop = self._evaluate(idx, self.pop)
+                self.pop = self._evaluate(idx, self.pop, list_pos)
                 sum_nutrients += self.pop[idx][self.ID_COST]
 
                 for m in range(0, self.swim_length):
@@ -113,6 +113,7 @@ class OriginalBFO(Optimizer):
                     if self.compare_agent([pos_new, fit_new], self.pop[idx]):
                         self.pop[idx][self.ID_POS] = pos_new
                         self.pop[idx][self.ID_FIT] = fit_new
+                        list_pos[idx] = pos_new
                         break
                     sum_nutrients += self.pop[idx][self.ID_COST]
                 self.pop[idx][self.ID_SUM_NUTRIENTS] = sum_nutrients
@@ -135,6 +136,7 @@ class ABFO(Optimizer):
         + This is the best improvement version of BFO
         + The population will remain the same length as initialization due to add and remove operators
     """
+    SUPPORT_PARALLEL = False
     ID_NUT = 2
     ID_LOC_POS = 3
     ID_LOC_FIT = 4
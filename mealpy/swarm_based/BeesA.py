@@ -77,7 +77,7 @@ class BaseBeesA(Optimizer):
                     pos_new = self.perform_dance(self.pop[idx][self.ID_POS], self.dyn_radius)
                     pop_child.append([pos_new, None])
                 pop_child = self.update_fitness_population(pop_child)
-                _, local_best = self.get_global_best_solution(pop_child)
+                _, local_best = self.get_global_best_solution(pop_child, sort=False)
                 if self.compare_agent(local_best, self.pop[idx]):
                     pop_new[idx] = local_best
             elif self.n_elite_bees <= idx < self.n_selected_bees:
@@ -88,7 +88,7 @@ class BaseBeesA(Optimizer):
                     pos_new = self.perform_dance(self.pop[idx][self.ID_POS], self.dyn_radius)
                     pop_child.append([pos_new, None])
                 pop_child = self.update_fitness_population(pop_child)
-                _, local_best = self.get_global_best_solution(pop_child)
+                _, local_best = self.get_global_best_solution(pop_child, sort=False)
                 if self.compare_agent(local_best, self.pop[idx]):
                     pop_new[idx] = local_best
             else:
@@ -177,7 +177,7 @@ class ProbBeesA(Optimizer):
                     pos_new = self.perform_dance(self.pop[idx][self.ID_POS], self.dyn_radius)
                     pop_child.append([pos_new, None])
                 pop_child = self.update_fitness_population(pop_child)
-                _, local_best = self.get_global_best_solution(pop_child)
+                _, local_best = self.get_global_best_solution(pop_child, sort=False)
                 if self.compare_agent(local_best, self.pop[idx]):
                     self.pop[idx] = local_best
             else:
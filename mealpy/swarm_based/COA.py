@@ -58,14 +58,15 @@ class BaseCOA(Optimizer):
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
         self.pop_group = self._create_pop_group(self.pop)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
 
     def evolve(self, epoch):
         """
         Args:
             epoch (int): The current iteration
         """
-        # Execute the operations inside each pack
+        # Execute the operations inside each pack, the new coyotes of all packs are evaluated in a batch
+        list_pop_new = []
         for p in range(self.n_packs):
             # Get the coyotes that belong to each pack
 
@@ -78,7 +79,7 @@ class BaseCOA(Optimizer):
             #  Update coyotes' social condition
             pop_new = []
             for i in range(self.n_coyotes):
-                rc1, rc2 = np.random.choice(list(set(range(0, self.n_coyotes)) - {i}), 2, replace=False)
+                rc1, rc2 = self.get_index_distinct_random(2, i, high=self.n_coyotes)
 
                 # Try to update the social condition according to the alpha and the pack tendency(Eq. 12)
                 pos_new = self.pop_group[p][i][self.ID_POS] + np.random.rand() * \
@@ -87,10 +88,14 @@ class BaseCOA(Optimizer):
                 # Keep the coyotes in the search space (optimization problem constraint)
                 pos_new = self.amend_position_faster(pos_new)
                 pop_new.append([pos_new, None, self.pop_group[p][i][self.ID_AGE]])
-            # Evaluate the new social condition (Eq. 13)
-            pop_new = self.update_fitness_population(pop_new)
+            list_pop_new.append(pop_new)
+        # Evaluate the new social condition (Eq. 13)
+        list_pop_new = self.update_fitness_groups(list_pop_new)
+
+        list_pup = []
+        for p in range(self.n_packs):
             # Adaptation (Eq. 14)
-            self.pop_group[p] = self.greedy_selection_population(self.pop_group[p], pop_new)
+            self.pop_group[p] = self.greedy_selection_population(self.pop_group[p], list_pop_new[p])
 
             # Birth of a new coyote from random parents (Eq. 7 and Alg. 1)
             id_dad, id_mom = np.random.choice(list(range(0, self.n_coyotes)), 2, replace=False)
@@ -100,9 +105,10 @@ class BaseCOA(Optimizer):
                            self.pop_group[p][id_dad][self.ID_POS], self.pop_group[p][id_mom][self.ID_POS])
             # Eventual noise
             pos_new = np.random.normal(0, 1) * pup
-            pos_new = self.amend_position_faster(pos_new)
-            fit_new = self.get_fitness_position(pos_new)
+            list_pup.append(self.amend_position_faster(pos_new))
+        list_fit = self.get_fitness_batch(list_pup)
 
+        for p, pos_new, fit_new in zip(range(self.n_packs), list_pup, list_fit):
             # Verify if the pup will survive
             packs, local_best = self.get_global_best_solution(self.pop_group[p])
             # Find index of element has fitness larger than new child
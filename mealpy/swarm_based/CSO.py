@@ -97,12 +97,12 @@ class BaseCSO(Optimizer):
         candidate_cats = self.update_fitness_population(candidate_cats)
 
         if self.selected_strategy == 0:                # Best fitness-self
-            _, cat = self.get_global_best_solution(candidate_cats)
+            _, cat = self.get_global_best_solution(candidate_cats, sort=False)
         elif self.selected_strategy == 1:              # Tournament
             k_way = 4
             idx = np.random.choice(range(0, self.smp), k_way, replace=False)
             cats_k_way = [candidate_cats[_] for _ in idx]
-            _, cat = self.get_global_best_solution(cats_k_way)
+            _, cat = self.get_global_best_solution(cats_k_way, sort=False)
         elif self.selected_strategy == 2:              ### Roul-wheel selection
             list_fitness = [candidate_cats[u][self.ID_FIT][self.ID_TAR] for u in range(0, len(candidate_cats))]
             idx = self.get_index_roulette_wheel_selection(list_fitness)
@@ -53,7 +53,7 @@ class BaseDO(Optimizer):
 
         # Initial population
         self.pop = self.create_population(self.pop_size)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
         self.pop_delta = self.create_population(self.pop_size)
 
     def evolve(self, epoch):
@@ -61,7 +61,7 @@ class BaseDO(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1)
+        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1, sort=False)
         self.g_best, self.g_worst = best[0], worst[0]
 
         r = (self.problem.ub - self.problem.lb) / 4 + ((self.problem.ub - self.problem.lb) * (2 * (epoch + 1) / self.epoch))
@@ -53,7 +53,7 @@ class BaseEHO(Optimizer):
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
         self.pop_group = self._create_pop_group(self.pop)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
 
     def evolve(self, epoch):
         """
@@ -8,8 +8,8 @@
 # ------------------------------------------------------------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 from mealpy.optimizer import Optimizer
+from mealpy.utils.distance import get_pairwise_distances
 
 
 class BaseFireflyA(Optimizer):
@@ -21,6 +21,8 @@ class BaseFireflyA(Optimizer):
             https://www.researchgate.net/publication/259472546_Firefly_Algorithm_for_Optimization_Problem
     """
 
+    DENSE_DIMS = 32         # Up to this number of dimensions, the dense random matrix of the attraction is built
+
     def __init__(self, problem, epoch=10000, pop_size=100,
                  gamma=0.001, beta_base=2, alpha=0.2, alpha_damp=0.99, delta=0.05, exponent=2, **kwargs):
         """
@@ -52,6 +54,27 @@ class BaseFireflyA(Optimizer):
         ## Dynamic variable
         self.dyn_alpha = alpha   # Initial Value of Mutation Coefficient
 
+    def _random_matmul__(self, list_diff=None):
+        """
+        The product of each row of list_diff with a random matrix (n_dims, n_dims) of U(0, 1), Eq. of the attraction.
+        With many dimensions, each element of the product is a sum of n_dims independent terms, so it is drawn from the
+        normal distribution with the same mean (sum(diff) / 2) and variance (sum(diff^2) / 12) instead of building the
+        random matrix, O(n_dims) instead of O(n_dims^2) random numbers for each move.
+
+        Args:
+            list_diff (nd.array): 2-D numpy array (n_moves, n_dims)
+
+        Returns:
+            2-D numpy array (n_moves, n_dims)
+        """
+        n_moves = len(list_diff)
+        if self.problem.n_dims <= self.DENSE_DIMS:
+            matrices = np.random.uniform(0, 1, (n_moves, self.problem.n_dims, self.problem.n_dims))
+            return np.einsum("ij,ijk->ik", list_diff, matrices)
+        mean = 0.5 * np.sum(list_diff, axis=1, keepdims=True)
+        std = np.sqrt(np.sum(list_diff ** 2, axis=1, keepdims=True) / 12.0)
+        return mean + std * np.random.normal(0, 1, (n_moves, self.problem.n_dims))
+
     def evolve(self, epoch):
         """
         Args:
@@ -60,26 +83,30 @@ class BaseFireflyA(Optimizer):
         # Maximum Distance
         dmax = np.sqrt(self.problem.n_dims)
 
+        ## A firefly only moves towards the fireflies after it, which don't move before it in this epoch,
+        ## so all distances are computed once
+        list_pos = self.get_position_matrix(self.pop[:self.pop_size])
+        list_fit = np.array([agent[self.ID_FIT][self.ID_TAR] for agent in self.pop[:self.pop_size]])
+        list_dist = get_pairwise_distances(list_pos) / dmax
         for idx in range(0, self.pop_size):
-            agent = deepcopy(self.pop[idx])
-            pop_child = []
-            for j in range(idx+1, self.pop_size):
-                # Move Towards Better Solutions
-                if self.compare_agent(self.pop[j], agent):
-                    # Calculate Radius and Attraction Level
-                    rij = np.linalg.norm(agent[self.ID_POS] - self.pop[j][self.ID_POS]) / dmax
-                    beta = self.beta_base * np.exp(-self.gamma * rij ** self.exponent)
-                    # Mutation Vector
-                    mutation_vector = self.delta * np.random.uniform(0, 1, self.problem.n_dims)
-                    temp = np.matmul((self.pop[j][self.ID_POS] - agent[self.ID_POS]),
-                                     np.random.uniform(0, 1, (self.problem.n_dims, self.problem.n_dims)))
-                    pos_new = agent[self.ID_POS] + self.dyn_alpha * mutation_vector + beta * temp
-                    pos_new = self.amend_position_faster(pos_new)
-                    pop_child.append([pos_new, None])
-            if len(pop_child) < 2:
+            agent = self.copy_agent(self.pop[idx])
+            # Move Towards Better Solutions
+            if self.problem.minmax == "min":
+                list_better = idx + 1 + np.where(list_fit[idx+1:] < list_fit[idx])[0]
+            else:
+                list_better = idx + 1 + np.where(~(list_fit[idx+1:] < list_fit[idx]))[0]
+            if len(list_better) < 2:
                 continue
-            pop_child = self.update_fitness_population(pop_child)
-            _, local_best = self.get_global_best_solution(pop_child)
+            # Calculate Radius and Attraction Level
+            rij = list_dist[idx, list_better]
+            beta = self.beta_base * np.exp(-self.gamma * rij ** self.exponent)
+            # Mutation Vector
+            mutation_vector = self.delta * np.random.uniform(0, 1, (len(list_better), self.problem.n_dims))
+            temp = self._random_matmul__(list_pos[list_better] - agent[self.ID_POS])
+            pos_new = agent[self.ID_POS] + self.dyn_alpha * mutation_vector + beta[:, None] * temp
+            pos_new = self.amend_position_faster(pos_new)
+            pop_child = self.update_fitness_population([[pos, None] for pos in pos_new])
+            _, local_best = self.get_global_best_solution(pop_child, sort=False)
             # Compare to Previous Solution
             if self.compare_agent(local_best, agent):
                 self.pop[idx] = local_best
@@ -9,6 +9,7 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
+from mealpy.utils.distance import get_weighted_differences
 
 
 class BaseGOA(Optimizer):
@@ -53,20 +54,14 @@ class BaseGOA(Optimizer):
         # Eq.(2.8) in the paper
         c = self.c_minmax[1] - epoch * ((self.c_minmax[1] - self.c_minmax[0]) / self.epoch)
 
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            S_i_total = np.zeros(self.problem.n_dims)
-            for j in range(0, self.pop_size):
-                dist = np.sqrt(np.sum((self.pop[idx][self.ID_POS] - self.pop[j][self.ID_POS]) ** 2))
-                r_ij_vector = (self.pop[idx][self.ID_POS] - self.pop[j][self.ID_POS]) / (dist + self.EPSILON)  # xj - xi / dij in Eq.(2.7)
-                xj_xi = 2 + np.remainder(dist, 2)  # |xjd - xid| in Eq. (2.7)
-                ## The first part inside the big bracket in Eq. (2.7)   16 955 230 764    212 047 193 643
-                ran = (c / 2) * (self.problem.ub - self.problem.lb)
-                s_ij = ran * self._s_function__(xj_xi) * r_ij_vector
-                S_i_total += s_ij
-            x_new = c * np.random.normal() * S_i_total + self.g_best[self.ID_POS]  # Eq. (2.7) in the paper
-            pos_new = self.amend_position_faster(x_new)
-            pop_new.append([pos_new, None])
+        ## Eq.(2.7): S_i = sum_j ran * s(|xj - xi|) * (xi - xj) / dij, all pairs at once in blocks
+        ## |xjd - xid| in Eq. (2.7) is replaced by 2 + dij mod 2 (the distance is mapped into [2, 4])
+        list_pos = self.get_position_matrix(self.pop)
+        list_s = get_weighted_differences(list_pos, None, lambda dist: self._s_function__(2 + np.remainder(dist, 2)) / (dist + self.EPSILON))
+        ran = (c / 2) * (self.problem.ub - self.problem.lb)
+        pos_new = c * np.random.normal(size=self.pop_size)[:, None] * (ran * list_s) + self.g_best[self.ID_POS]  # Eq. (2.7) in the paper
+        pos_new = self.amend_position_faster(pos_new)
+        pop_new = [[pos, None] for pos in pos_new]
         pop_new = self.update_fitness_population(pop_new)
         self.pop = self.greedy_selection_population(self.pop, pop_new)
 
@@ -9,6 +9,7 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
+from mealpy.utils.population import Population
 
 
 class BaseGWO(Optimizer):
@@ -20,6 +21,7 @@ class BaseGWO(Optimizer):
             In this algorithms: Prey means the best position
             https://www.mathworks.com/matlabcentral/fileexchange/44974-grey-wolf-optimizer-gwo?s_tid=FX_rc3_behav
     """
+    ARRAY_POPULATION = True
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
 
@@ -36,6 +38,30 @@ class BaseGWO(Optimizer):
         self.epoch = epoch
         self.pop_size = pop_size
 
+    def get_new_position(self, idx, a, list_best):
+        """
+        Args:
+            idx (int): index of the agent
+            a (float): the coefficient linearly decreased from 2 to 0
+            list_best (list): alpha, beta and delta wolves
+
+        Returns:
+            The new position of agent idx
+        """
+        A1, A2, A3 = a * (2 * np.random.uniform() - 1), a * (2 * np.random.uniform() - 1), a * (2 * np.random.uniform() - 1)
+        C1, C2, C3 = 2 * np.random.uniform(), 2 * np.random.uniform(), 2 * np.random.uniform()
+        X1 = list_best[0][self.ID_POS] - A1 * np.abs(C1 * list_best[0][self.ID_POS] - self.pop[idx][self.ID_POS])
+        X2 = list_best[1][self.ID_POS] - A2 * np.abs(C2 * list_best[1][self.ID_POS] - self.pop[idx][self.ID_POS])
+        X3 = list_best[2][self.ID_POS] - A3 * np.abs(C3 * list_best[2][self.ID_POS] - self.pop[idx][self.ID_POS])
+        pos_new = (X1 + X2 + X3) / 3.0
+        return self.amend_position_faster(pos_new)
+
+    def create_candidate(self, idx, epoch):
+        ## The leaders are taken from the current population, which changes after each merged candidate
+        a = 2 - 2 * epoch / (self.epoch - 1)
+        _, list_best, _ = self.get_special_solutions(self.pop, best=3, sort=False)
+        return [self.get_new_position(idx, a, list_best)]
+
     def evolve(self, epoch):
         """
         Args:
@@ -43,21 +69,31 @@ class BaseGWO(Optimizer):
         """
         # linearly decreased from 2 to 0
         a = 2 - 2 * epoch / (self.epoch - 1)
-        _, list_best, _ = self.get_special_solutions(self.pop, best=3)
+        _, list_best, _ = self.get_special_solutions(self.pop, best=3, sort=False)
 
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            A1, A2, A3 = a * (2 * np.random.uniform() - 1), a * (2 * np.random.uniform() - 1), a * (2 * np.random.uniform() - 1)
-            C1, C2, C3 = 2 * np.random.uniform(), 2 * np.random.uniform(), 2 * np.random.uniform()
-            X1 = list_best[0][self.ID_POS] - A1 * np.abs(C1 * list_best[0][self.ID_POS] - self.pop[idx][self.ID_POS])
-            X2 = list_best[1][self.ID_POS] - A2 * np.abs(C2 * list_best[1][self.ID_POS] - self.pop[idx][self.ID_POS])
-            X3 = list_best[2][self.ID_POS] - A3 * np.abs(C3 * list_best[2][self.ID_POS] - self.pop[idx][self.ID_POS])
-            pos_new = (X1 + X2 + X3) / 3.0
-            pos_new = self.amend_position_faster(pos_new)
-            pop_new.append([pos_new, None])
+        pop_new = Population(np.array([self.get_new_position(idx, a, list_best) for idx in range(0, self.pop_size)]))
         pop_new = self.update_fitness_population(pop_new)
         self.pop = self.greedy_selection_population(self.pop, pop_new)
 
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        # linearly decreased from 2 to 0
+        a = 2 - 2 * epoch / (self.epoch - 1)
+        _, list_best, _ = self.get_special_solutions(self.pop, best=3, sort=False)
+        list_pos = self.get_position_matrix(self.pop)
+        list_A = a * (2 * np.random.uniform(size=(self.pop_size, 3)) - 1)
+        list_C = 2 * np.random.uniform(size=(self.pop_size, 3))
+        pos_new = np.zeros((self.pop_size, self.problem.n_dims))
+        for k in range(0, 3):
+            leader = list_best[k][self.ID_POS]
+            pos_new += leader - list_A[:, k:k+1] * np.abs(list_C[:, k:k+1] * leader - list_pos)
+        pos_new = self.amend_position_faster(pos_new / 3.0)
+        pop_new = self.update_fitness_population(Population(pos_new))
+        self.pop = self.greedy_selection_population(self.pop, pop_new)
+
 
 class RW_GWO(Optimizer):
     """
@@ -93,7 +129,7 @@ class RW_GWO(Optimizer):
         # linearly decreased from 2 to 0
         a = 2 - 2 * epoch / (self.epoch - 1)
 
-        _, leaders, _ = self.get_special_solutions(self.pop, best=3)
+        _, leaders, _ = self.get_special_solutions(self.pop, best=3, sort=False)
         ## Random walk here
         leaders_new = []
         for i in range(0, len(leaders)):
@@ -43,7 +43,7 @@ class BaseJA(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1)
+        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1, sort=False)
         g_best, g_worst = best[0], worst[0]
         pop_new = []
         for idx in range(0, self.pop_size):
@@ -78,7 +78,7 @@ class OriginalJA(BaseJA):
         Args:
             epoch (int): The current iteration
         """
-        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1)
+        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1, sort=False)
         g_best, g_worst = best[0], worst[0]
         pop_new = []
         for idx in range(0, self.pop_size):
@@ -118,7 +118,7 @@ class LevyJA(BaseJA):
         Args:
             epoch (int): The current iteration
         """
-        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1)
+        _, best, worst = self.get_special_solutions(self.pop, best=1, worst=1, sort=False)
         g_best, g_worst = best[0], worst[0]
         pop_new = []
         for idx in range(0, self.pop_size):
@@ -77,7 +77,7 @@ class BaseMRFO(Optimizer):
             pop_new.append([pos_new, None])
         pop_new = self.update_fitness_population(pop_new)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
-        _, g_best = self.update_global_best_solution(pop_new, save=False)
+        _, g_best = self.update_global_best_solution(pop_new, save=False, sort=False)
         pop_child = []
         for idx in range(0, self.pop_size):
             # Somersault foraging   (Eq. 8)
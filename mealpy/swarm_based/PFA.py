@@ -47,8 +47,7 @@ class BasePFA(Optimizer):
         ## Update the position of pathfinder and check the bound
         temp = self.pop[0][self.ID_POS] + 2 * np.random.uniform() * (self.g_best[self.ID_POS] - self.pop[0][self.ID_POS]) + A
         temp = self.amend_position_faster(temp)
-        fit = self.get_fitness_position(temp)
-        pop_new = [[temp, fit], ]
+        pop_new = [[temp, None], ]          # Evaluated in the batch of the members
 
         ## Update positions of members, check the bound and calculate new fitness
         for idx in range(1, self.pop_size):
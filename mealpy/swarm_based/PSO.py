@@ -8,7 +8,6 @@
 #-------------------------------------------------------------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 from mealpy.optimizer import Optimizer
 
 
@@ -61,8 +60,8 @@ class BasePSO(Optimizer):
         position = np.random.uniform(self.problem.lb, self.problem.ub)
         fitness = self.get_fitness_position(position=position)
         velocity = np.random.uniform(self.v_min, self.v_max)
-        local_pos = deepcopy(position)
-        local_fit = deepcopy(fitness)
+        local_pos = position.copy()
+        local_fit = self.copy_agent(fitness)
         return [position, fitness, velocity, local_pos, local_fit]
 
     def evolve(self, epoch):
@@ -74,7 +73,8 @@ class BasePSO(Optimizer):
         w = (self.epoch - epoch) / self.epoch * (self.w_max - self.w_min) + self.w_min
         pop_new = []
         for idx in range(0, self.pop_size):
-            agent = deepcopy(self.pop[idx])
+            # Shallow copy is enough: position, velocity and fitness of the new agent are replaced, never updated in-place
+            agent = self.pop[idx].copy()
             v_new = w * self.pop[idx][self.ID_VEC] + self.c1 * np.random.rand() * \
                     (self.pop[idx][self.ID_LOP] - self.pop[idx][self.ID_POS]) + \
                     self.c2 * np.random.rand() * (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
@@ -88,10 +88,41 @@ class BasePSO(Optimizer):
 
         for idx in range(0, self.pop_size):
             if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
+                self.pop[idx] = pop_new[idx]
                 if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_FIT])
+                    self.pop[idx][self.ID_LOP] = pop_new[idx][self.ID_POS]
+                    self.pop[idx][self.ID_LOF] = pop_new[idx][self.ID_FIT]
+
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        # Update weight after each move count  (weight down)
+        w = (self.epoch - epoch) / self.epoch * (self.w_max - self.w_min) + self.w_min
+        list_pos = self.get_position_matrix(self.pop)
+        list_vec = np.array([agent[self.ID_VEC] for agent in self.pop])
+        list_lop = np.array([agent[self.ID_LOP] for agent in self.pop])
+        v_new = w * list_vec + self.c1 * np.random.rand(self.pop_size, 1) * (list_lop - list_pos) + \
+                self.c2 * np.random.rand(self.pop_size, 1) * (self.g_best[self.ID_POS] - list_pos)
+        x_new = list_pos + v_new  # Xi(new) = Xi(old) + Vi(new) * deltaT (deltaT = 1)
+        # Each particle out of bound gets its own random location
+        pos_new = np.where(np.logical_and(self.problem.lb <= x_new, x_new <= self.problem.ub), x_new,
+                           np.random.uniform(self.problem.lb, self.problem.ub, x_new.shape))
+        pop_new = []
+        for idx in range(0, self.pop_size):
+            agent = self.pop[idx].copy()
+            agent[self.ID_POS] = pos_new[idx]
+            agent[self.ID_VEC] = v_new[idx]
+            pop_new.append(agent)
+        pop_new = self.update_fitness_population(pop_new)
+
+        for idx in range(0, self.pop_size):
+            if self.compare_agent(pop_new[idx], self.pop[idx]):
+                self.pop[idx] = pop_new[idx]
+                if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
+                    self.pop[idx][self.ID_LOP] = pop_new[idx][self.ID_POS]
+                    self.pop[idx][self.ID_LOF] = pop_new[idx][self.ID_FIT]
 
 
 class PPSO(Optimizer):
@@ -130,8 +161,8 @@ class PPSO(Optimizer):
         position = np.random.uniform(self.problem.lb, self.problem.ub)
         fitness = self.get_fitness_position(position=position)
         velocity = np.random.uniform(self.v_min, self.v_max)
-        local_pos = deepcopy(position)
-        local_fit = deepcopy(fitness)
+        local_pos = position.copy()
+        local_fit = self.copy_agent(fitness)
         return [position, fitness, velocity, local_pos, local_fit]
 
     def evolve(self, epoch):
@@ -141,7 +172,7 @@ class PPSO(Optimizer):
         """
         pop_new = []
         for i in range(0, self.pop_size):
-            agent = deepcopy(self.pop[i])
+            agent = self.pop[i].copy()
             aa = 2 * (np.sin(self.dyn_delta_list[i]))
             bb = 2 * (np.cos(self.dyn_delta_list[i]))
             ee = np.abs(np.cos(self.dyn_delta_list[i])) ** aa
@@ -149,7 +180,7 @@ class PPSO(Optimizer):
 
             v_new = ee * (self.pop[i][self.ID_LOP] - self.pop[i][self.ID_POS]) + tt * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
             v_new = np.minimum(np.maximum(v_new, -self.v_max), self.v_max)
-            agent[self.ID_VEC] = deepcopy(v_new)
+            agent[self.ID_VEC] = v_new
 
             x_temp = self.pop[i][self.ID_POS] + v_new
             x_temp = np.minimum(np.maximum(x_temp, self.problem.lb), self.problem.ub)
@@ -164,10 +195,10 @@ class PPSO(Optimizer):
         # Update current position, current velocity and compare with past position, past fitness (local best)
         for idx in range(0, self.pop_size):
             if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
+                self.pop[idx] = pop_new[idx]
                 if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_FIT])
+                    self.pop[idx][self.ID_LOP] = pop_new[idx][self.ID_POS]
+                    self.pop[idx][self.ID_LOF] = pop_new[idx][self.ID_FIT]
 
 
 class HPSO_TVAC(PPSO):
@@ -205,7 +236,7 @@ class HPSO_TVAC(PPSO):
         c_it = ((self.cf - self.ci) * ((epoch + 1) / self.epoch)) + self.ci
         pop_new = []
         for i in range(0, self.pop_size):
-            agent = deepcopy(self.pop[i])
+            agent = self.pop[i].copy()
             idx_k = np.random.randint(0, self.pop_size)
             w = np.random.normal()
             while (np.abs(w - 1.0) < 0.01):
@@ -235,10 +266,10 @@ class HPSO_TVAC(PPSO):
         # Update current position, current velocity and compare with past position, past fitness (local best)
         for idx in range(0, self.pop_size):
             if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
+                self.pop[idx] = pop_new[idx]
                 if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_FIT])
+                    self.pop[idx][self.ID_LOP] = pop_new[idx][self.ID_POS]
+                    self.pop[idx][self.ID_LOF] = pop_new[idx][self.ID_FIT]
 
 
 class C_PSO(BasePSO):
@@ -276,8 +307,8 @@ class C_PSO(BasePSO):
         self.N_CLS = int(self.pop_size / 5)  # Number of chaotic local searches
 
         # Dynamic variable
-        self.dyn_lb = deepcopy(self.problem.lb)
-        self.dyn_ub = deepcopy(self.problem.ub)
+        self.dyn_lb = self.problem.lb.copy()
+        self.dyn_ub = self.problem.ub.copy()
 
     def __get_weights__(self, fit, fit_avg, fit_min):
         temp1 = self.w_min + (self.w_max - self.w_min) * (fit - fit_min) / (fit_avg - fit_min)
@@ -298,7 +329,7 @@ class C_PSO(BasePSO):
         fit_min = np.min(list_fits)
         pop_new = []
         for i in range(self.pop_size):
-            agent = deepcopy(self.pop[i])
+            agent = self.pop[i].copy()
             w = self.__get_weights__(self.pop[i][self.ID_FIT][self.ID_TAR], fit_avg, fit_min)
             v_new = w * self.pop[i][self.ID_VEC] + self.c1 * np.random.rand() * (self.pop[i][self.ID_LOP] - self.pop[i][self.ID_POS]) + \
                     self.c2 * np.random.rand() * (self.g_best[self.ID_POS] - self.pop[i][self.ID_POS])
@@ -315,10 +346,10 @@ class C_PSO(BasePSO):
         # Update current position, current velocity and compare with past position, past fitness (local best)
         for idx in range(0, self.pop_size):
             if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
+                self.pop[idx] = pop_new[idx]
                 if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_FIT])
+                    self.pop[idx][self.ID_LOP] = pop_new[idx][self.ID_POS]
+                    self.pop[idx][self.ID_LOF] = pop_new[idx][self.ID_FIT]
 
         ## Implement chaostic local search for the best solution
         g_best = self.g_best
@@ -386,8 +417,8 @@ class CL_PSO(Optimizer):
         position = np.random.uniform(self.problem.lb, self.problem.ub)
         fitness = self.get_fitness_position(position=position)
         velocity = np.random.uniform(self.v_min, self.v_max)
-        local_pos = deepcopy(position)
-        local_fit = deepcopy(fitness)
+        local_pos = position.copy()
+        local_fit = self.copy_agent(fitness)
         return [position, fitness, velocity, local_pos, local_fit]
 
     def evolve(self, epoch):
@@ -398,20 +429,20 @@ class CL_PSO(Optimizer):
         wk = self.w_max * (epoch / self.epoch) * (self.w_max - self.w_min)
         pop_new = []
         for i in range(0, self.pop_size):
-            agent = deepcopy(self.pop[i])
+            agent = self.pop[i].copy()
             if self.flags[i] >= self.max_flag:
                 self.flags[i] = 0
                 agent = self.create_solution()
 
             pci = 0.05 + 0.45 * (np.exp(10 * (i + 1) / self.pop_size) - 1) / (np.exp(10) - 1)
 
-            vec_new = deepcopy(self.pop[i][self.ID_VEC])
+            vec_new = self.pop[i][self.ID_VEC].copy()
             for j in range(0, self.problem.n_dims):
                 if np.random.rand() > pci:
                     vj = wk * self.pop[i][self.ID_VEC][j] + self.c_local * np.random.rand() * \
                          (self.pop[i][self.ID_LOP][j] - self.pop[i][self.ID_POS][j])
                 else:
-                    id1, id2 = np.random.choice(list(set(range(0, self.pop_size)) - {i}), 2, replace=False)
+                    id1, id2 = self.get_index_distinct_random(2, i)
                     if self.compare_agent(self.pop[id1], self.pop[id2]):
                         vj = wk * self.pop[i][self.ID_VEC][j] + self.c_local * np.random.rand() *\
                              (self.pop[id1][self.ID_LOP][j] - self.pop[i][self.ID_POS][j])
@@ -430,10 +461,10 @@ class CL_PSO(Optimizer):
         # Update current position, current velocity and compare with past position, past fitness (local best)
         for idx in range(0, self.pop_size):
             if self.compare_agent(pop_new[idx], self.pop[idx]):
-                self.pop[idx] = deepcopy(pop_new[idx])
+                self.pop[idx] = pop_new[idx]
                 if self.compare_agent(pop_new[idx], [None, self.pop[idx][self.ID_LOF]]):
-                    self.pop[idx][self.ID_LOP] = deepcopy(pop_new[idx][self.ID_POS])
-                    self.pop[idx][self.ID_LOF] = deepcopy(pop_new[idx][self.ID_FIT])
+                    self.pop[idx][self.ID_LOP] = pop_new[idx][self.ID_POS]
+                    self.pop[idx][self.ID_LOF] = pop_new[idx][self.ID_FIT]
                     self.flags[idx] = 0
                 else:
                     self.flags[idx] += 1
@@ -45,8 +45,8 @@ class BaseSFO(Optimizer):
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
         self.s_pop = self.create_population(self.s_size)
-        _, self.g_best = self.get_global_best_solution(self.pop)        # pop = sailfish
-        _, self.s_gbest = self.get_global_best_solution(self.s_pop)     # s_pop = sardines
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)        # pop = sailfish
+        _, self.s_gbest = self.get_global_best_solution(self.s_pop, sort=False)     # s_pop = sardines
 
     def evolve(self, epoch):
         """
@@ -108,7 +108,7 @@ class BaseSFO(Optimizer):
             self.s_pop = self.s_pop + [self.create_solution()]
         else:
             self.s_pop = self.s_pop + self.create_population(self.s_size - len(self.s_pop))
-        _, self.s_gbest = self.get_global_best_solution(self.s_pop)
+        _, self.s_gbest = self.get_global_best_solution(self.s_pop, sort=False)
         self.nfe_per_epoch = nfe_epoch
 
 
@@ -143,8 +143,8 @@ class ImprovedSFO(Optimizer):
     def initialization(self):
         self.pop = self.create_population(self.pop_size)
         self.s_pop = self.create_population(self.s_size)
-        _, self.g_best = self.get_global_best_solution(self.pop)
-        _, self.s_gbest = self.get_global_best_solution(self.s_pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
+        _, self.s_gbest = self.get_global_best_solution(self.s_pop, sort=False)
 
     def evolve(self, epoch):
         """
@@ -194,5 +194,5 @@ class ImprovedSFO(Optimizer):
                 #### Especially when sardine pop size >> sailfish pop size
 
         self.s_pop = self.s_pop + self.create_population(self.s_size - len(self.s_pop))
-        _, self.s_gbest = self.get_global_best_solution(self.s_pop)
+        _, self.s_gbest = self.get_global_best_solution(self.s_pop, sort=False)
         self.nfe_per_epoch = nfe_epoch
@@ -46,29 +46,38 @@ class BaseSHO(Optimizer):
             epoch (int): The current iteration
         """
         nfe_epoch = 0
-        pop_new = []
+        h = 5 - (epoch + 1.0) * (5 / self.epoch)
+        list_B, list_E, list_encircle = [], [], []
         for idx in range(0, self.pop_size):
-            h = 5 - (epoch + 1.0) * (5 / self.epoch)
             rd1 = np.random.uniform(0, 1, self.problem.n_dims)
             rd2 = np.random.uniform(0, 1, self.problem.n_dims)
-            B = 2 * rd1
-            E = 2 * h * rd2 - h
+            list_B.append(2 * rd1)
+            list_E.append(2 * h * rd2 - h)
+            list_encircle.append(np.random.rand() < 0.5)
+
+        ## The tries of the hunting agents are made round by round, the tries of a round are evaluated in a batch.
+        ## An agent stops trying as soon as its new position is not better than the global best.
+        list_N = np.zeros(self.pop_size, dtype=int)
+        list_active = [idx for idx in range(0, self.pop_size) if not list_encircle[idx]]
+        for i in range(0, self.N_tried):
+            if len(list_active) == 0:
+                break
+            list_pos = [self.amend_position_faster(self.g_best[self.ID_POS] + np.random.uniform(self.M[0], self.M[1]) *
+                                                   np.random.uniform(self.problem.lb, self.problem.ub)) for _ in list_active]
+            list_fit = self.get_fitness_batch(list_pos)
+            nfe_epoch += len(list_pos)
+            list_N[list_active] += 1
+            list_active = [idx for idx, pos_new, fit_new in zip(list_active, list_pos, list_fit)
+                           if not self.compare_agent(self.g_best, [pos_new, fit_new])]
 
-            if np.random.rand() < 0.5:
+        pop_new = []
+        for idx in range(0, self.pop_size):
+            B, E = list_B[idx], list_E[idx]
+            if list_encircle[idx]:
                 D_h = np.abs(np.dot(B, self.g_best[self.ID_POS]) - self.pop[idx][self.ID_POS])
                 pos_new = self.g_best[self.ID_POS] - np.dot(E, D_h)
             else:
-                N = 0
-                for i in range(0, self.N_tried):
-                    pos_new = self.g_best[self.ID_POS] + np.random.uniform(self.M[0], self.M[1]) * \
-                              np.random.uniform(self.problem.lb, self.problem.ub)
-                    pos_new = self.amend_position_faster(pos_new)
-                    fit_new = self.get_fitness_position(pos_new)
-                    if self.compare_agent(self.g_best, [pos_new, fit_new]):
-                        N += 1
-                        nfe_epoch += 1
-                        break
-                    N += 1
+                N = list_N[idx]
                 circle_list = []
                 idx_list = np.random.choice(range(0, self.pop_size), N, replace=False)
                 for j in range(0, N):
@@ -57,7 +57,7 @@ class BaseSLO(Optimizer):
                     pos_new = self.g_best[self.ID_POS] - c * np.abs(2 * np.random.rand() *
                                                                     self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
                 else:
-                    ri = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))  # random index
+                    ri = self.get_index_distinct_random(idx=idx)  # random index
                     pos_new = self.pop[ri][self.ID_POS] - c * np.abs(2 * np.random.rand() *
                                                                 self.pop[ri][self.ID_POS] - self.pop[idx][self.ID_POS])
             else:
@@ -206,7 +206,7 @@ class ISLO(ModifiedSLO):
         v2 = np.sin(2 * np.pi * (1 - t0))
         SP_leader = np.abs(v1 * (1 + v2) / v2)
 
-        pop_new = []
+        pop_new, list_pos_both = [], []
         for idx in range(0, self.pop_size):
             agent = deepcopy(self.pop[idx])
             if SP_leader < 0.5:
@@ -220,19 +220,25 @@ class ISLO(ModifiedSLO):
                     # Create a new solution by equation below
                     # Then create an opposition solution of above solution
                     # Compare both of them and keep the good one (Searching at both direction)
+                    # (both directions of all agents are evaluated in a batch after this loop)
                     pos_new = self.g_best[self.ID_POS] + c * np.random.normal(0, 1, self.problem.n_dims) * \
                               (self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-                    fit_new = self.get_fitness_position(self.amend_position_faster(pos_new))
                     pos_new_oppo = self.problem.lb + self.problem.ub - self.g_best[self.ID_POS] + \
                                    np.random.rand() * (self.g_best[self.ID_POS] - pos_new)
-                    fit_new_oppo = self.get_fitness_position(self.amend_position_faster(pos_new_oppo))
-                    if self.compare_agent([pos_new_oppo, fit_new_oppo], [pos_new, fit_new]):
-                        pos_new = pos_new_oppo
+                    list_pos_both.append((idx, pos_new, pos_new_oppo))
+                    pop_new.append(agent)
+                    continue
             else:  # Exploitation
                 pos_new = self.g_best[self.ID_POS] + np.cos(2 * np.pi * np.random.uniform(-1, 1)) * \
                           np.abs(self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
             agent[self.ID_POS] = self.amend_position_random(pos_new)
             pop_new.append(agent)
+        if len(list_pos_both) > 0:
+            list_fit = self.get_fitness_batch([self.amend_position_faster(pos) for item in list_pos_both for pos in item[1:]])
+            for jdx, (idx, pos_new, pos_new_oppo) in enumerate(list_pos_both):
+                if self.compare_agent([pos_new_oppo, list_fit[2 * jdx + 1]], [pos_new, list_fit[2 * jdx]]):
+                    pos_new = pos_new_oppo
+                pop_new[idx][self.ID_POS] = self.amend_position_random(pos_new)
         pop_new = self.update_fitness_population(pop_new)
 
         for idx in range(0, self.pop_size):
@@ -64,7 +64,7 @@ class BaseSSA(Optimizer):
                     x_new = self.pop[idx][self.ID_POS] + np.random.normal() * np.ones(self.problem.n_dims)
             else:
                 # Using equation (4) update the sparrow’s location;
-                _, x_p, worst = self.get_special_solutions(self.pop, best=1, worst=1)
+                _, x_p, worst = self.get_special_solutions(self.pop, best=1, worst=1, sort=False)
                 g_best = x_p[0], g_worst = worst[0]
                 if idx > int(self.pop_size / 2):
                     x_new = np.random.normal() * np.exp((g_worst[self.ID_POS] - self.pop[idx][self.ID_POS]) / (idx + 1) ** 2)
@@ -132,7 +132,7 @@ class OriginalSSA(BaseSSA):
                     x_new = self.pop[idx][self.ID_POS] + np.random.normal() * np.ones(self.problem.n_dims)
             else:
                 # Using equation (4) update the sparrow’s location;
-                _, x_p, worst = self.get_special_solutions(self.pop, best=1, worst=1)
+                _, x_p, worst = self.get_special_solutions(self.pop, best=1, worst=1, sort=False)
                 g_best, g_worst = x_p[0], worst[0]
                 if idx > int(self.pop_size / 2):
                     x_new = np.random.normal() * np.exp((g_worst[self.ID_POS] - self.pop[idx][self.ID_POS]) / (idx + 1) ** 2)
@@ -9,6 +9,7 @@
 
 import numpy as np
 from mealpy.optimizer import Optimizer
+from mealpy.utils.population import Population
 
 
 class BaseSSO(Optimizer):
@@ -17,6 +18,7 @@ class BaseSSO(Optimizer):
     Link:
         https://doi.org/10.1016/j.advengsoft.2017.07.002
     """
+    ARRAY_POPULATION = True
 
     def __init__(self, problem, epoch=10000, pop_size=100, **kwargs):
         """
@@ -33,6 +35,32 @@ class BaseSSO(Optimizer):
         self.epoch = epoch
         self.pop_size = pop_size
 
+    def get_new_position(self, idx, c1):
+        """
+        Args:
+            idx (int): index of the agent
+            c1 (float): the coefficient of Eq. (3.2)
+
+        Returns:
+            The new position of agent idx
+        """
+        if idx < self.pop_size / 2:
+            c2_list = np.random.random(self.problem.n_dims)
+            c3_list = np.random.random(self.problem.n_dims)
+            pos_new_1 = self.g_best[self.ID_POS] + c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
+            pos_new_2 = self.g_best[self.ID_POS] - c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
+            pos_new = np.where(c3_list < 0.5, pos_new_1, pos_new_2)
+        else:
+            # Eq. (3.4) in the paper
+            pos_new = (self.pop[idx][self.ID_POS] + self.pop[idx - 1][self.ID_POS]) / 2
+
+        # Check if salps go out of the search space and bring it back then re-calculate its fitness value
+        return self.amend_position_faster(pos_new)
+
+    def create_candidate(self, idx, epoch):
+        c1 = 2 * np.exp(-((4 * (epoch + 1) / self.epoch) ** 2))
+        return [self.get_new_position(idx, c1)]
+
     def evolve(self, epoch):
         """
         Args:
@@ -40,20 +68,26 @@ class BaseSSO(Optimizer):
         """
         ## Eq. (3.2) in the paper
         c1 = 2 * np.exp(-((4 * (epoch + 1) / self.epoch) ** 2))
-        pop_new = []
-        for idx in range(0, self.pop_size):
-            if idx < self.pop_size / 2:
-                c2_list = np.random.random(self.problem.n_dims)
-                c3_list = np.random.random(self.problem.n_dims)
-                pos_new_1 = self.g_best[self.ID_POS] + c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
-                pos_new_2 = self.g_best[self.ID_POS] - c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
-                pos_new = np.where(c3_list < 0.5, pos_new_1, pos_new_2)
-            else:
-                # Eq. (3.4) in the paper
-                pos_new = (self.pop[idx][self.ID_POS] + self.pop[idx - 1][self.ID_POS]) / 2
-
-            # Check if salps go out of the search space and bring it back then re-calculate its fitness value
-            pos_new = self.amend_position_faster(pos_new)
-            pop_new.append([pos_new, None])
+        pop_new = Population(np.array([self.get_new_position(idx, c1) for idx in range(0, self.pop_size)]))
         pop_new = self.update_fitness_population(pop_new)
         self.pop = self.greedy_selection_population(self.pop, pop_new)
+
+    def evolve_vectorized(self, epoch):
+        """
+        Args:
+            epoch (int): The current iteration
+        """
+        ## Eq. (3.2) in the paper
+        c1 = 2 * np.exp(-((4 * (epoch + 1) / self.epoch) ** 2))
+        list_pos = self.get_position_matrix(self.pop)
+        n_leaders = (self.pop_size + 1) // 2        # The agents with idx < pop_size / 2
+        c2_list = np.random.random((n_leaders, self.problem.n_dims))
+        c3_list = np.random.random((n_leaders, self.problem.n_dims))
+        pos_new_1 = self.g_best[self.ID_POS] + c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
+        pos_new_2 = self.g_best[self.ID_POS] - c1 * ((self.problem.ub - self.problem.lb) * c2_list + self.problem.lb)
+        pos_leaders = np.where(c3_list < 0.5, pos_new_1, pos_new_2)
+        # Eq. (3.4) in the paper
+        pos_followers = (list_pos[n_leaders:] + list_pos[n_leaders-1:-1]) / 2
+        pos_new = self.amend_position_faster(np.concatenate((pos_leaders, pos_followers), axis=0))
+        pop_new = self.update_fitness_population(Population(pos_new))
+        self.pop = self.greedy_selection_population(self.pop, pop_new)
@@ -8,7 +8,6 @@
 #-------------------------------------------------------------------------------------------------------%
 
 import numpy as np
-from copy import deepcopy
 from scipy.spatial.distance import cdist
 from mealpy.optimizer import Optimizer
 
@@ -75,7 +74,7 @@ class BaseSSpiderA(Optimizer):
         position = np.random.uniform(self.problem.lb, self.problem.ub)
         fitness = self.get_fitness_position(position)
         intensity = np.log(1. / (abs(fitness[self.ID_TAR]) + self.EPSILON) + 1)
-        target_position = deepcopy(position)
+        target_position = position.copy()
         previous_movement_vector = np.zeros(self.problem.n_dims)
         dimension_mask = np.zeros(self.problem.n_dims)
         return [position, fitness, intensity, target_position, previous_movement_vector, dimension_mask]
@@ -96,7 +95,7 @@ class BaseSSpiderA(Optimizer):
 
         pop_new = []
         for idx in range(0, self.pop_size):
-            agent = deepcopy(self.pop[idx])
+            agent = self.pop[idx].copy()        # Fields of the new agent are replaced, never updated in-place
             if self.pop[id_best_intennsity][self.ID_INT] > self.pop[idx][self.ID_INT]:
                 agent[self.ID_TARGET_POS] = self.pop[id_best_intennsity][self.ID_TARGET_POS]
             if np.random.uniform() > self.p_c:  ## changing mask
@@ -10,6 +10,7 @@
 import numpy as np
 from copy import deepcopy
 from mealpy.optimizer import Optimizer
+from mealpy.utils.distance import get_pairwise_distances, get_distances_to
 
 
 class BaseSSpiderO(Optimizer):
@@ -65,25 +66,24 @@ class BaseSSpiderO(Optimizer):
         self.pop_females = self.create_population(self.n_f)
         pop = deepcopy(self.pop_females) + deepcopy(self.pop_males)
         self.pop = self._recalculate_weights(pop)
-        _, self.g_best = self.get_global_best_solution(self.pop)
+        _, self.g_best = self.get_global_best_solution(self.pop, sort=False)
 
     def _move_females(self, epoch=None):
         scale_distance = np.sum(self.problem.ub - self.problem.lb)
         pop = self.pop_females + self.pop_males
+        all_pos = np.array([it[self.ID_POS] for it in pop])
+        all_wei = np.array([it[self.ID_WEI] for it in pop])
+        ## All distances are computed once, the column of a female is updated after she moves (the females move one by one)
+        all_dist = get_pairwise_distances(all_pos[:self.n_f], all_pos) / scale_distance
         # Start looking for any stronger vibration
         for i in range(0, self.n_f):    # Move the females
             ## Find the position s
-            id_min = None
-            dist_min = 2**16
-            for j in range(0, self.pop_size):
-                if self.pop_females[i][self.ID_WEI] < pop[j][self.ID_WEI]:
-                    dt = np.linalg.norm(pop[j][self.ID_POS] - self.pop_females[i][self.ID_POS]) / scale_distance
-                    if dt < dist_min and dt != 0:
-                        dist_min = dt
-                        id_min = j
+            list_idx = np.where((self.pop_females[i][self.ID_WEI] < all_wei) & (all_dist[i] != 0))[0]
             x_s = np.zeros(self.problem.n_dims)
             vibs = 0
-            if id_min is not None:
+            if len(list_idx) > 0:
+                id_min = list_idx[np.argmin(all_dist[i, list_idx])]
+                dist_min = all_dist[i, id_min]
                 vibs = 2*(pop[id_min][self.ID_WEI]*np.exp(-(np.random.uniform()*dist_min**2)))  # Vib for the shortest
                 x_s = pop[id_min][self.ID_POS]
 
@@ -103,6 +103,7 @@ class BaseSSpiderO(Optimizer):
                        vibb * (self.g_best[self.ID_POS] - self.pop_females[i][self.ID_POS]) * gamma + random
             pos_new = self.amend_position_random(pos_new)
             self.pop_females[i][self.ID_POS] = pos_new
+            all_dist[i+1:, i] = get_distances_to(all_pos[i+1:self.n_f], pos_new) / scale_distance
         self.pop_females = self.update_fitness_population(self.pop_females)
         self.nfe_epoch += self.n_f
 
@@ -117,23 +118,21 @@ class BaseSSpiderO(Optimizer):
             mean = np.mean(all_pos, axis=0)
         else:
             mean = np.sum(all_wei * all_pos, axis=0) / total_wei
+        ## The females don't move here, so the distances between males and females are computed once
+        female_wei = all_wei[:self.n_f, 0]
+        all_dist = get_pairwise_distances(all_pos[self.n_f:], all_pos[:self.n_f]) / scale_distance
         for i in range(0, self.n_m):
             delta = 2 * np.random.uniform(0, 1, self.problem.n_dims) - 0.5
             random = 2 * self.p_m[epoch] * (np.random.uniform(0, 1, self.problem.n_dims) - 0.5)
 
             if self.pop_males[i][self.ID_WEI] >= my_median:         # Spider above the median
                 # Start looking for a female with stronger vibration
-                id_min = None
-                dist_min = 99999999
-                for j in range(0, self.n_f):
-                    if self.pop_females[j][self.ID_WEI] > self.pop_males[i][self.ID_WEI]:
-                        dt = np.linalg.norm(self.pop_females[j][self.ID_POS] - self.pop_males[i][self.ID_POS]) / scale_distance
-                        if dt < dist_min and dt != 0:
-                            dist_min = dt
-                            id_min = j
+                list_idx = np.where((female_wei > self.pop_males[i][self.ID_WEI]) & (all_dist[i] != 0))[0]
                 x_s = np.zeros(self.problem.n_dims)
                 vibs = 0
-                if id_min != None:
+                if len(list_idx) > 0:
+                    id_min = list_idx[np.argmin(all_dist[i, list_idx])]
+                    dist_min = all_dist[i, id_min]
                     # Vib for the shortest
                     vibs = 2 * (self.pop_females[id_min][self.ID_WEI] * np.exp(-(np.random.uniform() * dist_min ** 2)))
                     x_s = self.pop_females[id_min][self.ID_POS]
@@ -189,11 +188,11 @@ class BaseSSpiderO(Optimizer):
         # Start looking if there's a good female near
         list_child = []
         couples = []
-        for i in range(0, len(pop_males_new)):
-            for j in range(0, self.n_f):
-                dist = np.linalg.norm(pop_males_new[i][self.ID_POS] - self.pop_females[j][self.ID_POS])
-                if dist < r:
-                    couples.append([pop_males_new[i], self.pop_females[j]])
+        if len(pop_males_new) > 0:
+            all_dist = get_pairwise_distances(np.array([it[self.ID_POS] for it in pop_males_new]),
+                                              np.array([it[self.ID_POS] for it in self.pop_females]))
+            for i, j in zip(*np.nonzero(all_dist < r)):
+                couples.append([pop_males_new[i], self.pop_females[j]])
         if couples:
             n_child = len(couples)
             for k in range(n_child):
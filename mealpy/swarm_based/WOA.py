@@ -34,6 +34,40 @@ class BaseWOA(Optimizer):
         self.epoch = epoch
         self.pop_size = pop_size
 
+    def get_new_position(self, idx, a):
+        """
+        Args:
+            idx (int): index of the agent
+            a (float): the coefficient linearly decreased from 2 to 0
+
+        Returns:
+            The new position of agent idx
+        """
+        r = np.random.rand()
+        A = 2 * a * r - a
+        C = 2 * r
+        l = np.random.uniform(-1, 1)
+        p = 0.5
+        b = 1
+        if np.random.uniform() < p:
+            if np.abs(A) < 1:
+                D = np.abs(C * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
+                pos_new = self.g_best[self.ID_POS] - A * D
+            else:
+                # x_rand = pop[np.random.np.random.randint(self.pop_size)]         # select random 1 position in pop
+                # Only the position of the random whale is used, so its fitness is not calculated
+                x_rand = np.random.uniform(self.problem.lb, self.problem.ub)
+                D = np.abs(C * x_rand - self.pop[idx][self.ID_POS])
+                pos_new = x_rand - A * D
+        else:
+            D1 = np.abs(self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
+            pos_new = self.g_best[self.ID_POS] + np.exp(b * l) * np.cos(2 * np.pi * l) * D1
+        return self.amend_position_faster(pos_new)
+
+    def create_candidate(self, idx, epoch):
+        a = 2 - 2 * epoch / (self.epoch - 1)
+        return [self.get_new_position(idx, a)]
+
     def evolve(self, epoch):
         """
         Args:
@@ -42,25 +76,7 @@ class BaseWOA(Optimizer):
         a = 2 - 2 * epoch / (self.epoch - 1)  # linearly decreased from 2 to 0
         pop_new = []
         for idx in range(0, self.pop_size):
-            r = np.random.rand()
-            A = 2 * a * r - a
-            C = 2 * r
-            l = np.random.uniform(-1, 1)
-            p = 0.5
-            b = 1
-            if np.random.uniform() < p:
-                if np.abs(A) < 1:
-                    D = np.abs(C * self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-                    pos_new = self.g_best[self.ID_POS] - A * D
-                else:
-                    # x_rand = pop[np.random.np.random.randint(self.pop_size)]         # select random 1 position in pop
-                    x_rand = self.create_solution()
-                    D = np.abs(C * x_rand[self.ID_POS] - self.pop[idx][self.ID_POS])
-                    pos_new = x_rand[self.ID_POS] - A * D
-            else:
-                D1 = np.abs(self.g_best[self.ID_POS] - self.pop[idx][self.ID_POS])
-                pos_new = self.g_best[self.ID_POS] + np.exp(b * l) * np.cos(2 * np.pi * l) * D1
-            pos_new = self.amend_position_faster(pos_new)
+            pos_new = self.get_new_position(idx, a)
             pop_new.append([pos_new, None])
         pop_new = self.update_fitness_population(pop_new)
         self.pop = self.greedy_selection_population(self.pop, pop_new)
@@ -128,7 +144,7 @@ class HI_WOA(Optimizer):
         nfe_epoch += self.pop_size
 
         ## Feedback Mechanism
-        _, current_best = self.get_global_best_solution(pop_new)
+        _, current_best = self.get_global_best_solution(pop_new, sort=False)
         if current_best[self.ID_FIT][self.ID_TAR] == self.g_best[self.ID_FIT][self.ID_TAR]:
             self.dyn_feedback_count += 1
         else:
@@ -43,9 +43,7 @@ class OriginalAEO(Optimizer):
         # Eq. 2, 3, 1
         a = (1.0 - epoch / self.epoch) * np.random.uniform()
         x1 = (1 - a) * self.pop[-1][self.ID_POS] + a * np.random.uniform(self.problem.lb, self.problem.ub)
-        pos_new = self.amend_position_faster(x1)
-        fit_new = self.get_fitness_position(x1)
-        self.pop[-1] = [pos_new, fit_new]
+        agent_producer = [self.amend_position_faster(x1), None]     # Evaluated in the batch of the consumers
 
         ## Consumption - Update the whole population left
         pop_new = []
@@ -74,12 +72,12 @@ class OriginalAEO(Optimizer):
                                                     + (1 - r2) * (self.pop[idx][self.ID_POS] - self.pop[j][self.ID_POS]))
             pos_new = self.amend_position_faster(x_t1)
             pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
-        pop_new.append(deepcopy(self.pop[-1]))
+        pop_new = self.update_fitness_population(pop_new + [agent_producer])
+        self.pop[-1] = deepcopy(agent_producer)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
         ## find current best used in decomposition
-        _, best = self.get_global_best_solution(pop_new)
+        _, best = self.get_global_best_solution(pop_new, sort=False)
 
         ## Decomposition
         ### Eq. 10, 11, 12, 9
@@ -121,9 +119,7 @@ class ImprovedAEO(OriginalAEO):
         # Eq. 2, 3, 1
         a = (1.0 - epoch / self.epoch) * np.random.uniform()
         x1 = (1 - a) * self.pop[-1][self.ID_POS] + a * np.random.uniform(self.problem.lb, self.problem.ub)
-        pos_new = self.amend_position_faster(x1)
-        fit_new = self.get_fitness_position(x1)
-        self.pop[-1] = [pos_new, fit_new]
+        agent_producer = [self.amend_position_faster(x1), None]     # Evaluated in the batch of the consumers
 
         ## Consumption - Update the whole population left
         pop_new = []
@@ -152,12 +148,12 @@ class ImprovedAEO(OriginalAEO):
                                                          + (1 - r2) * (self.pop[idx][self.ID_POS] - self.pop[j][self.ID_POS]))
             pos_new = self.amend_position_faster(x_t1)
             pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
-        pop_new.append(deepcopy(self.pop[-1]))
+        pop_new = self.update_fitness_population(pop_new + [agent_producer])
+        self.pop[-1] = deepcopy(agent_producer)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
         ## find current best used in decomposition
-        _, best = self.get_global_best_solution(pop_new)
+        _, best = self.get_global_best_solution(pop_new, sort=False)
 
         ## Decomposition
         ### Eq. 10, 11, 12, 9
@@ -214,9 +210,7 @@ class EnhancedAEO(Optimizer):
         # Eq. 13
         a = 2 * (1 - (epoch + 1) / self.epoch)
         x1 = (1 - a) * self.pop[-1][self.ID_POS] + a * np.random.uniform(self.problem.lb, self.problem.ub)
-        pos_new = self.amend_position_faster(x1)
-        fit_new = self.get_fitness_position(x1)
-        self.pop[-1] = [pos_new, fit_new]
+        agent_producer = [self.amend_position_faster(x1), None]     # Evaluated in the batch of the consumers
 
         ## Consumption - Update the whole population left
         pop_new = []
@@ -257,12 +251,12 @@ class EnhancedAEO(Optimizer):
                                                     (1 - r5) * (self.pop[idx][self.ID_POS] - self.pop[j][self.ID_POS]))
             pos_new = self.amend_position_faster(x_t1)
             pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
-        pop_new.append(deepcopy(self.pop[-1]))
+        pop_new = self.update_fitness_population(pop_new + [agent_producer])
+        self.pop[-1] = deepcopy(agent_producer)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
         ## find current best used in decomposition
-        _, best = self.get_global_best_solution(pop_new)
+        _, best = self.get_global_best_solution(pop_new, sort=False)
 
         ## Decomposition
         ### Eq. 10, 11, 12, 9
@@ -275,7 +269,7 @@ class EnhancedAEO(Optimizer):
             # x_new = best[self.ID_POS] + d * (e * best[self.ID_POS] - h * agent_i[self.ID_POS])
             if np.random.random() < 0.5:
                 beta = 1 - (1 - 0) * ((epoch + 1) / self.epoch)  # Eq. 21
-                r_idx = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+                r_idx = self.get_index_distinct_random(idx=idx)
                 x_r = pop_new[r_idx][self.ID_POS]
                 # x_r = pop[np.random.randint(0, self.pop_size-1)][self.ID_POS]
                 if np.random.random() < 0.5:
@@ -323,9 +317,7 @@ class ModifiedAEO(Optimizer):
         H = 2 * (1 - (epoch + 1) / self.epoch)
         a = (1 - (epoch + 1) / self.epoch) * np.random.random()
         x1 = (1 - a) * self.pop[-1][self.ID_POS] + a * np.random.uniform(self.problem.lb, self.problem.ub)
-        pos_new = self.amend_position_faster(x1)
-        fit_new = self.get_fitness_position(pos_new)
-        self.pop[-1] = [pos_new, fit_new]
+        agent_producer = [self.amend_position_faster(x1), None]     # Evaluated in the batch of the consumers
 
         ## Consumption - Update the whole population left
         pop_new = []
@@ -352,12 +344,12 @@ class ModifiedAEO(Optimizer):
                                                            (1 - r5) * (self.pop[idx][self.ID_POS] - self.pop[j][self.ID_POS]))
             pos_new = self.amend_position_faster(pos_new)
             pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
-        pop_new.append(deepcopy(self.pop[-1]))
+        pop_new = self.update_fitness_population(pop_new + [agent_producer])
+        self.pop[-1] = deepcopy(agent_producer)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
         ## find current best used in decomposition
-        _, best = self.get_global_best_solution(pop_new)
+        _, best = self.get_global_best_solution(pop_new, sort=False)
 
         ## Decomposition
         ### Eq. 10, 11, 12, 9
@@ -370,7 +362,7 @@ class ModifiedAEO(Optimizer):
             # x_new = best[self.ID_POS] + d * (e * best[self.ID_POS] - h * agent_i[self.ID_POS])
             if np.random.random() < 0.5:
                 beta = 1 - (1 - 0) * ((epoch + 1) / self.epoch)  # Eq. 21
-                r_idx = np.random.choice(list(set(range(0, self.pop_size)) - {idx}))
+                r_idx = self.get_index_distinct_random(idx=idx)
                 x_r = pop_new[r_idx][self.ID_POS]
                 # x_r = pop[np.random.randint(0, self.pop_size-1)][self.ID_POS]
                 if np.random.random() < 0.5:
@@ -417,9 +409,7 @@ class AdaptiveAEO(Optimizer):
         wf = 2 * (1 - (epoch + 1) / self.epoch)  # Weight factor
         a = (1.0 - epoch / self.epoch) * np.random.random()
         x1 = (1 - a) * self.pop[-1][self.ID_POS] + a * np.random.uniform(self.problem.lb, self.problem.ub)
-        pos_new = self.amend_position_faster(x1)
-        fit_new = self.get_fitness_position(x1)
-        self.pop[-1] = [pos_new, fit_new]
+        agent_producer = [self.amend_position_faster(x1), None]     # Evaluated in the batch of the consumers
 
         ## Consumption - Update the whole population left
         pop_new = []
@@ -449,12 +439,12 @@ class AdaptiveAEO(Optimizer):
                           (1.0 / np.sqrt(epoch + 1)) * np.sign(np.random.random() - 0.5) * (self.pop[idx][self.ID_POS] - self.g_best[self.ID_POS])
             pos_new = self.amend_position_faster(pos_new)
             pop_new.append([pos_new, None])
-        pop_new = self.update_fitness_population(pop_new)
-        pop_new.append(deepcopy(self.pop[-1]))
+        pop_new = self.update_fitness_population(pop_new + [agent_producer])
+        self.pop[-1] = deepcopy(agent_producer)
         pop_new = self.greedy_selection_population(self.pop, pop_new)
 
         ## find current best used in decomposition
-        _, best = self.get_global_best_solution(pop_new)
+        _, best = self.get_global_best_solution(pop_new, sort=False)
 
         ## Decomposition
         ### Eq. 10, 11, 12, 9   idx, pop, g_best, local_best
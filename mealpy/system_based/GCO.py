@@ -58,7 +58,7 @@ class BaseGCO(Optimizer):
                 self.dyn_list_cell_counter[idx] = 1
 
             # Mutate process
-            r1, r2 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 2, replace=False)
+            r1, r2 = self.get_index_distinct_random(2, idx)
             pos_new = self.g_best[self.ID_POS] + self.wf * (self.pop[r2][self.ID_POS] - self.pop[r1][self.ID_POS])
             pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, pos_new, self.pop[idx][self.ID_POS])
             pos_new = self.amend_position_faster(pos_new)
@@ -111,7 +111,7 @@ class OriginalGCO(BaseGCO):
                 self.dyn_list_cell_counter[idx] = 1
 
             # Mutate process
-            r1, r2, r3 = np.random.choice(list(set(range(0, self.pop_size)) - {idx}), 3, replace=False)
+            r1, r2, r3 = self.get_index_distinct_random(3, idx)
             pos_new = self.pop[r1][self.ID_POS] + self.wf * (self.pop[r2][self.ID_POS] - self.pop[r3][self.ID_POS])
             pos_new = np.where(np.random.uniform(0, 1, self.problem.n_dims) < self.cr, pos_new, self.pop[idx][self.ID_POS])
             pos_new = self.amend_position_faster(pos_new)
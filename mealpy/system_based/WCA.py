@@ -78,26 +78,31 @@ class BaseWCA(Optimizer):
         Args:
             epoch (int): The current iteration
         """
-        # Update stream and river
+        # Update stream, the new streams of all rivers are evaluated in a single batch
+        streams_new, list_r = {}, {}
         for idx, stream_list in self.streams.items():
-            # Update stream
-            stream_new = []
+            streams_new[idx] = []
             for idx_stream, stream in enumerate(stream_list):
                 pos_new = stream[self.ID_POS] + np.random.uniform() * self.C * (self.pop_best[idx][self.ID_POS] - stream[self.ID_POS])
                 pos_new = self.amend_position_faster(pos_new)
-                stream_new.append([pos_new, None])
-            stream_new = self.update_fitness_population(stream_new)
+                streams_new[idx].append([pos_new, None])
+            list_r[idx] = np.random.uniform()       # Random factor of the river, drawn in the same order as before
+        streams_new = self.update_fitness_groups(streams_new)
+
+        # Update river, all new rivers are evaluated in a single batch
+        rivers_new = []
+        for idx, stream_new in streams_new.items():
             stream_new, stream_best = self.get_global_best_solution(stream_new)
             self.streams[idx] = stream_new
             if self.compare_agent(stream_best, self.pop_best[idx]):
                 self.pop_best[idx] = deepcopy(stream_best)
-
-            # Update river
-            pos_new = self.pop_best[idx][self.ID_POS] + np.random.uniform() * self.C * (self.g_best[self.ID_POS] - self.pop_best[idx][self.ID_POS])
+            pos_new = self.pop_best[idx][self.ID_POS] + list_r[idx] * self.C * (self.g_best[self.ID_POS] - self.pop_best[idx][self.ID_POS])
             pos_new = self.amend_position_faster(pos_new)
-            fit_new = self.get_fitness_position(pos_new)
-            if self.compare_agent([pos_new, fit_new], self.pop_best[idx]):
-                self.pop_best[idx] = [pos_new, fit_new]
+            rivers_new.append([pos_new, None])
+        rivers_new = self.update_fitness_population(rivers_new)
+        for idx, river in zip(streams_new.keys(), rivers_new):
+            if self.compare_agent(river, self.pop_best[idx]):
+                self.pop_best[idx] = river
 
         # Evaporation
         for i in range(1, self.nsr):
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+import numpy as np
+from mealpy.utils.selection import get_distinct_random_index
+
+## Parameter adaptation and external archive of the adaptive DE (JADE, SHADE, L_SHADE), for the whole population at
+## once. The archive is a preallocated position matrix (capacity, n_dims) and its number of saved rows, so it is saved
+## in the checkpoint as the other numpy attributes.
+
+
+def get_truncated_cauchy(loc=0.5, scale=0.1, size=1):
+    """
+    The mutation factors F of the adaptive DE: Cauchy(loc, scale), regenerated if F <= 0 and truncated to 1 if F > 1
+
+    Args:
+        loc (float, nd.array): the location (a single value or one value per sample)
+        scale (float): the scale
+        size (int): number of samples
+
+    Returns:
+        1-D numpy array (size,) in range (0, 1]
+    """
+    loc = np.broadcast_to(np.asarray(loc, dtype=float), (size,))
+    list_f = loc + scale * np.random.standard_cauchy(size)
+    invalid = np.nonzero(list_f <= 0)[0]
+    while len(invalid) > 0:
+        list_f[invalid] = loc[invalid] + scale * np.random.standard_cauchy(len(invalid))
+        invalid = invalid[list_f[invalid] <= 0]
+    return np.minimum(list_f, 1.0)
+
+
+def get_clipped_normal(loc=0.5, scale=0.1, size=1):
+    """
+    The crossover rates CR of the adaptive DE: Normal(loc, scale) clipped to [0, 1]
+
+    Args:
+        loc (float, nd.array): the mean (a single value or one value per sample)
+        scale (float): the standard deviation
+        size (int): number of samples
+
+    Returns:
+        1-D numpy array (size,) in range [0, 1]
+    """
+    return np.clip(np.random.normal(loc, scale, size), 0, 1)
+
+
+def add_to_archive(archive=None, n_archive=0, list_pos=None, capacity=None):
+    """
+    Add the positions to the archive, a random saved position is replaced by each new one when the archive is full
+
+    Args:
+        archive (nd.array): 2-D numpy array (max_capacity, n_dims), updated in-place
+        n_archive (int): number of saved positions
+        list_pos (nd.array): 2-D numpy array (n_new, n_dims), the new positions
+        capacity (int): the current capacity of the archive, default = len(archive)
+
+    Returns:
+        the new number of saved positions
+    """
+    capacity = len(archive) if capacity is None else capacity
+    n_free = max(capacity - n_archive, 0)
+    n_added = min(n_free, len(list_pos))
+    archive[n_archive:n_archive + n_added] = list_pos[:n_added]
+    n_archive += n_added
+    if len(list_pos) > n_added and n_archive > 0:
+        archive[np.random.randint(0, n_archive, len(list_pos) - n_added)] = list_pos[n_added:]
+    return n_archive
+
+
+def resize_archive(archive=None, n_archive=0, capacity=None):
+    """
+    Randomly remove the saved positions until the archive has at most capacity positions
+
+    Returns:
+        the new number of saved positions
+    """
+    if n_archive > capacity:
+        archive[:capacity] = archive[np.random.permutation(n_archive)[:capacity]]
+        n_archive = capacity
+    return n_archive
+
+
+def get_current_to_pbest_trials(list_pos=None, list_best=None, list_f=None, list_cr=None, archive=None):
+    """
+    DE/current-to-pbest/1/bin with the external archive, for the whole population at once:
+        x_new = x_i + F_i * (x_pbest - x_i) + F_i * (x_r1 - x_r2), then binomial crossover with CR_i
+    where r1 != i is from the population, r2 != i and r2 != r1 is from the population and the archive.
+
+    Args:
+        list_pos (nd.array): 2-D numpy array (pop_size, n_dims), the current positions
+        list_best (nd.array): 1-D int array (pop_size,), the index of the pbest agent of each agent
+        list_f (nd.array): 1-D numpy array (pop_size,), the mutation factors
+        list_cr (nd.array): 1-D numpy array (pop_size,), the crossover rates
+        archive (nd.array): 2-D numpy array (n_archive, n_dims), the saved positions of the archive
+
+    Returns:
+        2-D numpy array (pop_size, n_dims), the trial positions (not amended)
+    """
+    pop_size, n_dims = list_pos.shape
+    list_idx = np.arange(pop_size)
+    id_r1 = get_distinct_random_index(pop_size, 1, list_idx)[:, 0]
+    list_union = list_pos if archive is None or len(archive) == 0 else np.concatenate((list_pos, archive), axis=0)
+    id_r2 = get_distinct_random_index(len(list_union), 1, np.stack((list_idx, id_r1), axis=1))[:, 0]
+    list_f = list_f[:, None]
+    x_new = list_pos + list_f * (list_pos[list_best] - list_pos) + list_f * (list_pos[id_r1] - list_union[id_r2])
+    mask = np.random.uniform(0, 1, (pop_size, n_dims)) < list_cr[:, None]
+    mask[list_idx, np.random.randint(0, n_dims, pop_size)] = True
+    return np.where(mask, x_new, list_pos)
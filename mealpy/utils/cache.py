@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+
+import numpy as np
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """
+    Remember the fitness of evaluated positions, so a position seen before never reaches the objective function again.
+    When the cache is full, the least recently used position is removed.
+
+    The key of a position can be rounded (decimals) or projected by your own function (key_func), for example a discrete
+    problem which maps many float vectors to the same solution:
+        cache = FitnessCache(max_size=50000, key_func=lambda position: position > 0.5)
+        model = BaseGA(problem, epoch=1000, pop_size=50, fitness_cache=cache)
+        model.solve()
+        print(cache.n_hits, cache.n_misses, cache.hit_rate)
+
+    Notes:
+        Only use the cache with a deterministic objective function (the same position always gives the same fitness)
+    """
+
+    def __init__(self, max_size=10000, decimals=None, key_func=None):
+        """
+        Args:
+            max_size (int): maximum number of positions in the cache
+            decimals (int): round the position to this number of decimals before making the key, default = None (exact)
+            key_func (callable): project the position before making the key, default = None
+        """
+        if type(max_size) is not int or max_size < 1:
+            print("The maximum size of fitness cache should be an int number and > 0.")
+            exit(0)
+        if decimals is not None and type(decimals) is not int:
+            print("The number of decimals of fitness cache should be an int number.")
+            exit(0)
+        if key_func is not None and not callable(key_func):
+            print("The key function of fitness cache should be callable.")
+            exit(0)
+        self.max_size = max_size
+        self.decimals = decimals
+        self.key_func = key_func
+        self.data = OrderedDict()
+        self.n_hits, self.n_misses = 0, 0
+
+    def __getstate__(self):
+        ## Workers in process mode don't use the cache, so the entries are not sent to them
+        state = self.__dict__.copy()
+        state["data"] = OrderedDict()
+        return state
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def hit_rate(self):
+        n_lookups = self.n_hits + self.n_misses
+        return self.n_hits / n_lookups if n_lookups > 0 else 0.0
+
+    def clear(self):
+        self.data.clear()
+        self.n_hits, self.n_misses = 0, 0
+
+    def get_key(self, position=None):
+        if self.key_func is not None:
+            position = self.key_func(position)
+        position = np.asarray(position, dtype=float)
+        if self.decimals is not None:
+            position = np.round(position, self.decimals)
+        return (position + 0.0).tobytes()       # + 0.0 turns -0.0 into 0.0, they have different bytes
+
+    def get(self, key=None):
+        """
+        Returns:
+            [target, [obj1, obj2, ...]] if the key is in the cache, otherwise None
+        """
+        if key not in self.data:
+            self.n_misses += 1
+            return None
+        self.n_hits += 1
+        self.data.move_to_end(key)
+        target, objs = self.data[key]
+        return [target, objs]
+
+    def put(self, key=None, fitness=None):
+        self.data[key] = (fitness[0], fitness[1])
+        self.data.move_to_end(key)
+        if len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+    def lookup(self, list_pos=None):
+        """
+        Args:
+            list_pos (list, nd.array): the positions
+
+        Returns:
+            list of fitness (None for the missing positions), dict {key: list of indices} of the missing positions,
+            a position repeated in list_pos is counted as missing only once
+        """
+        list_fit, missing = [], {}
+        for idx, pos in enumerate(list_pos):
+            key = self.get_key(pos)
+            if key in missing:
+                self.n_hits += 1
+                missing[key].append(idx)
+                list_fit.append(None)
+                continue
+            fit = self.get(key)
+            if fit is None:
+                missing[key] = [idx]
+            list_fit.append(fit)
+        return list_fit, missing
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+
+import numpy as np
+from collections import deque
+from pathlib import Path
+from mealpy.utils.population import Population
+import json
+import time
+import os
+
+
+class Checkpoint:
+    """
+    Save the state of an optimizer periodically, so a long run can be continued after a crash by:
+        model.solve(resume_from="checkpoint/model")
+
+    A checkpoint has 2 files: "filename.json" (metadata and the structure of the state) and "filename.xxxxx.npz"
+    (all numpy arrays of the state, xxxxx is the epoch), no pickle is used.
+
+    Examples:
+        checkpoint = Checkpoint("checkpoint/model", every_epochs=10)            # Save after each 10 epochs
+        checkpoint = Checkpoint("checkpoint/model", every_seconds=600)          # Save after each 10 minutes
+        model = BaseGA(problem, epoch=1000, pop_size=50, checkpoint=checkpoint)
+    """
+
+    VERSION = 1
+
+    def __init__(self, filename="checkpoint", every_epochs=None, every_seconds=None):
+        """
+        Args:
+            filename (str): path of the checkpoint without extension
+            every_epochs (int): save the checkpoint after each every_epochs epochs
+            every_seconds (int, float): save the checkpoint when every_seconds seconds passed from the last saving
+        """
+        if every_epochs is None and every_seconds is None:
+            print("Please enter the frequency of checkpoint: every_epochs or every_seconds.")
+            exit(0)
+        if every_epochs is not None and (type(every_epochs) is not int or every_epochs < 1):
+            print("The number of epochs between checkpoints should be an int number and > 0.")
+            exit(0)
+        if every_seconds is not None and (type(every_seconds) not in (int, float) or every_seconds <= 0):
+            print("The number of seconds between checkpoints should be a number and > 0.")
+            exit(0)
+        self.filename = str(filename)
+        self.every_epochs = every_epochs
+        self.every_seconds = every_seconds
+        self.time_saved = None
+
+    def start(self):
+        self.time_saved = time.time()
+
+    def is_due(self, epoch):
+        """
+        Args:
+            epoch (int): number of finished epochs
+
+        Returns:
+            True if the checkpoint should be saved after this epoch
+        """
+        if self.every_epochs is not None and epoch % self.every_epochs == 0:
+            return True
+        if self.every_seconds is not None and time.time() - self.time_saved >= self.every_seconds:
+            return True
+        return False
+
+    def save(self, state=None, epoch=None):
+        """
+        Args:
+            state (dict): the state to save, it can contain numbers, strings, lists, tuples, dicts, numpy arrays and Population
+            epoch (int): number of finished epochs
+        """
+        Path(self.filename).parent.mkdir(parents=True, exist_ok=True)
+        arrays, memo = {}, {}
+        meta = {"version": self.VERSION, "epoch": epoch, "arrays": f"{Path(self.filename).name}.{epoch:05d}.npz",
+                "state": self.__encode__(state, arrays, memo)}
+        ## Write to temporary files then rename, so a crash while saving never damages the previous checkpoint
+        file_arrays = Path(self.filename).parent / meta["arrays"]
+        with open(f"{file_arrays}.tmp", "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(f"{file_arrays}.tmp", file_arrays)
+        with open(f"{self.filename}.json.tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(f"{self.filename}.json.tmp", f"{self.filename}.json")
+        for file in Path(self.filename).parent.glob(f"{Path(self.filename).name}.*.npz"):
+            if file.name != meta["arrays"]:
+                file.unlink()
+        self.time_saved = time.time()
+
+    @classmethod
+    def load(cls, filename=None):
+        """
+        Args:
+            filename (str): path of the checkpoint without extension
+
+        Returns:
+            The saved state, the number of finished epochs
+        """
+        if not Path(f"{filename}.json").exists():
+            print(f"Checkpoint: {filename}.json is not found.")
+            exit(0)
+        with open(f"{filename}.json") as f:
+            meta = json.load(f)
+        if meta["version"] != cls.VERSION:
+            print(f"Checkpoint version {meta['version']} is not supported.")
+            exit(0)
+        with np.load(Path(filename).parent / meta["arrays"], allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        return cls.__decode__(meta["state"], arrays, []), meta["epoch"]
+
+    @classmethod
+    def __encode__(cls, obj, arrays, memo):
+        ## Objects shared by many places (an agent in several lists,...) are saved once and referenced by their order,
+        ## so they are still shared after loading
+        if isinstance(obj, np.generic):
+            key = f"arr_{len(arrays)}"
+            arrays[key] = np.asarray(obj)
+            return {"__scalar__": key}
+        if obj is None or isinstance(obj, (bool, int, float, str)):
+            return obj
+        if isinstance(obj, complex):
+            return {"__complex__": [obj.real, obj.imag]}
+        if isinstance(obj, tuple):
+            return {"__tuple__": [cls.__encode__(item, arrays, memo) for item in obj]}
+        if id(obj) in memo:
+            return {"__ref__": memo[id(obj)]}
+        memo[id(obj)] = len(memo)
+        if isinstance(obj, list):
+            return [cls.__encode__(item, arrays, memo) for item in obj]
+        if isinstance(obj, np.ndarray):
+            if obj.dtype == object:
+                return {"__object_array__": [list(obj.shape), [cls.__encode__(item, arrays, memo) for item in obj.ravel()]]}
+            key = f"arr_{len(arrays)}"
+            arrays[key] = obj
+            return {"__array__": key}
+        if isinstance(obj, dict):
+            return {"__dict__": [[cls.__encode__(key, arrays, memo), cls.__encode__(value, arrays, memo)] for key, value in obj.items()]}
+        if isinstance(obj, deque):
+            return {"__deque__": [obj.maxlen, [cls.__encode__(item, arrays, memo) for item in obj]]}
+        if isinstance(obj, Population):
+            return {"__population__": [cls.__encode__(value, arrays, memo) for value in (obj.list_pos, obj.list_tar, obj.list_objs, obj.list_extra)]}
+        print(f"Checkpoint can't save the object of type: {type(obj).__name__}.")
+        exit(0)
+
+    @classmethod
+    def __decode__(cls, obj, arrays, memo):
+        if obj is None or isinstance(obj, (bool, int, float, str)):
+            return obj
+        if isinstance(obj, list):
+            result = []
+            memo.append(result)
+            result.extend([cls.__decode__(item, arrays, memo) for item in obj])
+            return result
+        tag, value = next(iter(obj.items()))
+        if tag == "__scalar__":
+            return arrays[value][()]
+        if tag == "__complex__":
+            return complex(*value)
+        if tag == "__tuple__":
+            return tuple(cls.__decode__(item, arrays, memo) for item in value)
+        if tag == "__ref__":
+            return memo[value]
+        ## Reserve the place of this object before its children, the same order as in __encode__
+        idx = len(memo)
+        memo.append(None)
+        if tag == "__array__":
+            result = arrays[value]
+        elif tag == "__object_array__":
+            result = np.empty(len(value[1]), dtype=object)
+            memo[idx] = result
+            for pos, item in enumerate(value[1]):
+                result[pos] = cls.__decode__(item, arrays, memo)
+            result = result.reshape(value[0])
+        elif tag == "__dict__":
+            result = {}
+            memo[idx] = result
+            for key, item in value:
+                key = cls.__decode__(key, arrays, memo)
+                result[key] = cls.__decode__(item, arrays, memo)
+        elif tag == "__deque__":
+            result = deque([cls.__decode__(item, arrays, memo) for item in value[1]], maxlen=value[0])
+        else:
+            result = Population(*[cls.__decode__(item, arrays, memo) for item in value])
+        memo[idx] = result
+        return result
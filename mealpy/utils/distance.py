@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+
+import numpy as np
+from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
+
+## Maximum number of distances computed at once by the blocked functions (8 bytes each, 2**22 --> 32 MB)
+BLOCK_ELEMENTS = 2**22
+
+
+def get_block_size(n_cols=None, block_elements=BLOCK_ELEMENTS):
+    """
+    Returns:
+        The number of rows of a block, so a block (n_rows, n_cols) has at most block_elements distances
+    """
+    return max(block_elements // max(n_cols, 1), 1)
+
+
+def iter_distance_blocks(list_pos_a=None, list_pos_b=None, block_elements=BLOCK_ELEMENTS):
+    """
+    Euclidean distances between the rows of 2 matrices, block by block so the memory is bounded
+
+    Args:
+        list_pos_a (nd.array): 2-D numpy array (n_a, n_dims)
+        list_pos_b (nd.array): 2-D numpy array (n_b, n_dims), default = list_pos_a
+        block_elements (int): maximum number of distances in a block
+
+    Yields:
+        index of the first row of the block in list_pos_a, 2-D numpy array (n_rows, n_b) of distances
+    """
+    list_pos_a = np.atleast_2d(list_pos_a)
+    list_pos_b = list_pos_a if list_pos_b is None else np.atleast_2d(list_pos_b)
+    block_size = get_block_size(len(list_pos_b), block_elements)
+    for idx in range(0, len(list_pos_a), block_size):
+        yield idx, cdist(list_pos_a[idx:idx + block_size], list_pos_b, 'euclidean')
+
+
+def get_pairwise_distances(list_pos_a=None, list_pos_b=None, block_elements=BLOCK_ELEMENTS):
+    """
+    All Euclidean distances between the rows of 2 matrices, computed once instead of pair by pair with np.linalg.norm.
+    Identical positions have the distance exactly 0.
+
+    Args:
+        list_pos_a (nd.array): 2-D numpy array (n_a, n_dims)
+        list_pos_b (nd.array): 2-D numpy array (n_b, n_dims), default = list_pos_a
+        block_elements (int): maximum number of distances computed at once
+
+    Returns:
+        2-D numpy array (n_a, n_b), the distance between list_pos_a[i] and list_pos_b[j] is at [i, j]
+    """
+    list_pos_a = np.atleast_2d(list_pos_a)
+    n_b = len(list_pos_a) if list_pos_b is None else len(np.atleast_2d(list_pos_b))
+    dist = np.empty((len(list_pos_a), n_b))
+    for idx, block in iter_distance_blocks(list_pos_a, list_pos_b, block_elements):
+        dist[idx:idx + len(block)] = block
+    return dist
+
+
+def get_distances_to(list_pos=None, position=None):
+    """
+    Returns:
+        1-D numpy array, the Euclidean distances between the rows of list_pos and a single position
+    """
+    return np.sqrt(np.sum((np.atleast_2d(list_pos) - position) ** 2, axis=1))
+
+
+def get_distance_sums(list_pos_a=None, list_pos_b=None, func=None, block_elements=BLOCK_ELEMENTS):
+    """
+    All-pairs interaction with a scalar result: sum_j func(d_ij) for each row i of list_pos_a, block by block
+
+    Args:
+        list_pos_a (nd.array): 2-D numpy array (n_a, n_dims)
+        list_pos_b (nd.array): 2-D numpy array (n_b, n_dims), default = list_pos_a
+        func (callable): vectorized function of the distance matrix of a block, default = the distance itself
+        block_elements (int): maximum number of distances computed at once
+
+    Returns:
+        1-D numpy array (n_a,)
+    """
+    list_pos_a = np.atleast_2d(list_pos_a)
+    list_sums = np.empty(len(list_pos_a))
+    for idx, block in iter_distance_blocks(list_pos_a, list_pos_b, block_elements):
+        list_sums[idx:idx + len(block)] = np.sum(block if func is None else func(block), axis=1)
+    return list_sums
+
+
+def get_weighted_differences(list_pos_a=None, list_pos_b=None, func=None, block_elements=BLOCK_ELEMENTS):
+    """
+    All-pairs interaction with a vector result: sum_j func(d_ij) * (a_i - b_j) for each row i of list_pos_a, computed
+    as sum_j(w_ij) * a_i - W @ B block by block, so no (n_a, n_b, n_dims) array is built
+
+    Args:
+        list_pos_a (nd.array): 2-D numpy array (n_a, n_dims)
+        list_pos_b (nd.array): 2-D numpy array (n_b, n_dims), default = list_pos_a
+        func (callable): vectorized function of the distance matrix of a block, the weights w_ij
+        block_elements (int): maximum number of distances computed at once
+
+    Returns:
+        2-D numpy array (n_a, n_dims)
+    """
+    list_pos_a = np.atleast_2d(list_pos_a)
+    list_pos_b = list_pos_a if list_pos_b is None else np.atleast_2d(list_pos_b)
+    list_sums = np.empty(list_pos_a.shape)
+    ## The differences don't change when both sides are centered, it reduces the cancellation error of the subtraction
+    center = np.mean(list_pos_b, axis=0)
+    list_pos_a_centered, list_pos_b_centered = list_pos_a - center, list_pos_b - center
+    for idx, block in iter_distance_blocks(list_pos_a, list_pos_b, block_elements):
+        ## Identical positions have no difference, their weights (often huge, w(0) / epsilon) are dropped
+        weights = np.where(block > 0, func(block), 0.0)
+        list_sums[idx:idx + len(block)] = np.sum(weights, axis=1)[:, None] * list_pos_a_centered[idx:idx + len(block)] - \
+                                          weights @ list_pos_b_centered
+    return list_sums
+
+
+class NearestNeighbourIndex:
+    """
+    Nearest neighbour queries in a population whose agents move one at a time (BRO, ...), much cheaper than computing
+    the distances to the whole population for each query:
+        + Low dimensions: a KD-tree (scipy cKDTree) of the positions. A moved agent is not removed from the tree, it is
+            marked as moved and checked by exact search until the tree is rebuilt (when too many agents moved).
+        + High dimensions (KD-tree doesn't help): exact search on the matrix of positions, updated in-place.
+
+    Examples:
+        index = NearestNeighbourIndex(list_pos)
+        j = index.query(list_pos[i])            # The nearest agent with a different position
+        index.update(j, pos_new)                # Agent j moves
+    """
+
+    def __init__(self, list_pos=None, max_tree_dims=16, rebuild_ratio=0.1):
+        """
+        Args:
+            list_pos (nd.array): 2-D numpy array (n_agents, n_dims)
+            max_tree_dims (int): the KD-tree is used when n_dims <= max_tree_dims
+            rebuild_ratio (float): the KD-tree is rebuilt when more than rebuild_ratio * n_agents agents moved
+        """
+        self.list_pos = np.array(list_pos, dtype=float, ndmin=2)
+        self.n_agents, self.n_dims = self.list_pos.shape
+        self.use_tree = self.n_dims <= max_tree_dims
+        self.max_moved = max(int(rebuild_ratio * self.n_agents), 1)
+        self.tree = None
+        self.moved = set()
+        if self.use_tree:
+            self.__build_tree__()
+
+    def __build_tree__(self):
+        self.tree = cKDTree(self.list_pos)
+        self.moved = set()
+
+    def update(self, idx=None, position=None):
+        """
+        Args:
+            idx (int): index of the moved agent
+            position (nd.array): its new position
+        """
+        self.list_pos[idx] = position
+        if self.use_tree:
+            self.moved.add(idx)
+            if len(self.moved) > self.max_moved:
+                self.__build_tree__()
+
+    def query(self, position=None):
+        """
+        Args:
+            position (nd.array): 1-D numpy array
+
+        Returns:
+            index of the nearest agent with a different position (distance > 0), None if all agents are at this position
+        """
+        if not self.use_tree:
+            dist = get_distances_to(self.list_pos, position)
+            list_idx = np.nonzero(dist)[0]
+            return list_idx[np.argmin(dist[list_idx])] if len(list_idx) > 0 else None
+        id_best, dist_best = None, np.inf
+        ## Agents moved since the tree was built, exact search on their current positions
+        if len(self.moved) > 0:
+            list_moved = np.array(sorted(self.moved))
+            dist = get_distances_to(self.list_pos[list_moved], position)
+            list_valid = np.nonzero(dist)[0]
+            if len(list_valid) > 0:
+                k = list_valid[np.argmin(dist[list_valid])]
+                id_best, dist_best = list_moved[k], dist[k]
+        ## The others from the tree, ask for more neighbours until one of them is valid
+        k = min(8, self.n_agents)
+        while True:
+            list_dist, list_idx = self.tree.query(position, k=k)
+            list_dist, list_idx = np.atleast_1d(list_dist), np.atleast_1d(list_idx)
+            for dist, idx in zip(list_dist, list_idx):
+                if dist >= dist_best:
+                    return id_best
+                if dist > 0 and idx not in self.moved:
+                    return idx
+            if k >= self.n_agents:
+                return id_best
+            k = min(2 * k, self.n_agents)
+
+    def query_all(self, block_elements=BLOCK_ELEMENTS):
+        """
+        Blocked exact search of the nearest neighbour (distance > 0) of all agents
+
+        Returns:
+            1-D numpy array (n_agents,), index of the nearest neighbour of each agent, -1 if it has no neighbour
+        """
+        list_nearest = np.full(self.n_agents, -1)
+        for idx, block in iter_distance_blocks(self.list_pos, None, block_elements):
+            block = np.where(block > 0, block, np.inf)
+            list_min = np.argmin(block, axis=1)
+            valid = np.isfinite(block[np.arange(len(block)), list_min])
+            list_nearest[idx:idx + len(block)] = np.where(valid, list_min, -1)
+        return list_nearest
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+
+class BitGenome:
+    """
+    Binary genomes packed in numpy uint8 arrays (8 bits per byte), each real variable is encoded by bits_per_param bits.
+    All operators work on a whole population at once: a 2-D array (n_genomes, n_bytes), one row per genome.
+    It is used by BaseMA and can be used by any binary genetic algorithm, for example:
+        genome = BitGenome(n_dims=10, bits_per_param=16, lb=problem.lb, ub=problem.ub)
+        pop_bits = genome.create(50)
+        child_bits = genome.mutate(genome.crossover(pop_bits[0::2], pop_bits[1::2], pc=0.9), pm=0.01)
+        list_pos = genome.decode(child_bits)
+    """
+
+    def __init__(self, n_dims=None, bits_per_param=16, lb=None, ub=None):
+        """
+        Args:
+            n_dims (int): number of variables
+            bits_per_param (int): number of bits of a variable, it should be in range [1, 52]
+            lb (list, nd.array): lower bound of variables
+            ub (list, nd.array): upper bound of variables
+        """
+        if type(bits_per_param) is not int or not 1 <= bits_per_param <= 52:
+            print("The number of bits per parameter should be an int number in range [1, 52].")
+            exit(0)
+        self.n_dims = n_dims
+        self.bits_per_param = bits_per_param
+        self.bits_total = n_dims * bits_per_param
+        self.n_bytes = (self.bits_total + 7) // 8
+        self.lb = np.asarray(lb, dtype=float)
+        self.ub = np.asarray(ub, dtype=float)
+        self.weights = 2.0 ** np.arange(bits_per_param - 1, -1, -1)     # Most significant bit first
+        self.scale = (self.ub - self.lb) / (2.0 ** bits_per_param - 1)
+
+    def pack(self, bits=None):
+        """
+        Args:
+            bits (nd.array): bool (or 0/1) array with shape (n_genomes, bits_total)
+
+        Returns:
+            packed genomes, uint8 array with shape (n_genomes, n_bytes), the padding bits are 0
+        """
+        return np.packbits(np.asarray(bits, dtype=bool), axis=-1)
+
+    def unpack(self, genomes=None):
+        """
+        Returns:
+            uint8 array of 0/1 with shape (n_genomes, bits_total)
+        """
+        return np.unpackbits(genomes, axis=-1, count=self.bits_total)
+
+    def random_mask(self, n_genomes=1, prob=0.5):
+        ## Packed mask, each bit is 1 with probability prob
+        return self.pack(np.random.uniform(size=(n_genomes, self.bits_total)) < prob)
+
+    def create(self, n_genomes=1):
+        """
+        Returns:
+            n_genomes random genomes, uint8 array with shape (n_genomes, n_bytes)
+        """
+        return self.random_mask(n_genomes, 0.5)
+
+    def decode(self, genomes=None):
+        """
+        Decode the genomes into real numbers: lb + (ub - lb) / (2^bits_per_param - 1) * integer value of each variable
+
+        Args:
+            genomes (nd.array): packed genomes with shape (n_genomes, n_bytes), or a single genome with shape (n_bytes,)
+
+        Returns:
+            positions with shape (n_genomes, n_dims), or (n_dims,) for a single genome
+        """
+        bits = self.unpack(np.atleast_2d(genomes)).reshape(-1, self.n_dims, self.bits_per_param)
+        list_pos = self.lb + self.scale * np.dot(bits, self.weights)
+        return list_pos[0] if np.ndim(genomes) == 1 else list_pos
+
+    def crossover(self, dads=None, moms=None, pc=1.0):
+        """
+        Uniform crossover, each bit of a child is taken from the dad or the mom with the same probability.
+        A child is a copy of its dad with probability 1 - pc.
+
+        Args:
+            dads (nd.array): packed genomes with shape (n_genomes, n_bytes)
+            moms (nd.array): packed genomes with shape (n_genomes, n_bytes)
+            pc (float): crossover probability
+
+        Returns:
+            the children with shape (n_genomes, n_bytes)
+        """
+        dads, moms = np.atleast_2d(dads), np.atleast_2d(moms)
+        flags = np.random.uniform(size=len(dads)) < pc
+        mask = self.random_mask(len(dads), 0.5)
+        children = (dads & mask) | (moms & ~mask)
+        return np.where(flags[:, None], children, dads)
+
+    def mutate(self, genomes=None, pm=0.01):
+        """
+        Point mutation, each bit is flipped with probability pm
+
+        Args:
+            genomes (nd.array): packed genomes with shape (n_genomes, n_bytes)
+            pm (float): mutation probability of each bit
+
+        Returns:
+            the mutated genomes with shape (n_genomes, n_bytes)
+        """
+        genomes = np.atleast_2d(genomes)
+        return genomes ^ self.random_mask(len(genomes), pm)
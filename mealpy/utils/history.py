@@ -9,6 +9,7 @@
 
 import numpy as np
 from copy import deepcopy
+from collections import deque
 from mealpy.utils.visualize import export_convergence_chart, export_explore_exploit_chart, \
     export_diversity_chart, export_objectives_chart, export_trajectory_chart
 
@@ -19,9 +20,35 @@ class History:
     Note that you can use dump() and parse() for whatever your needs. Our default
     is only for agents, best agent and best agent's index.
 
+    The history mode decides how much is recorded, from the cheapest to the most expensive one:
+        + "none": only the latest current best and global best solutions, and the best fitness of all generations
+        + "best-only": the current best, global best solutions and runtime of all generations
+        + "stats": "best-only" + diversity of population (and so exploration, exploitation) computed in each generation,
+            the population itself is not stored
+        + "full": "stats" + the population of all generations (default)
+
+    With n_populations=K, only the populations of the last K generations are kept (a ring buffer), it can be used
+    with "stats" and "full" mode to draw the trajectory chart of long runs.
+
+    With a population store (MemmapPopulationStore or ChunkedPopulationStore in mealpy.utils.storage), only the position
+    matrix of each generation is saved and it is spilled to disk instead of RAM, list_population is the store itself.
     """
 
-    def __init__(self):
+    LIST_MODES = ("none", "best-only", "stats", "full")
+
+    def __init__(self, mode="full", n_populations=None, store=None):
+        if mode not in self.LIST_MODES:
+            print(f"History mode should be one of {self.LIST_MODES}.")
+            exit(0)
+        if n_populations is not None and (type(n_populations) is not int or n_populations < 1):
+            print("The number of populations kept in history should be an int number and > 0.")
+            exit(0)
+        if n_populations is not None and store is not None:
+            print("The population store can't be used with the number of populations kept in history.")
+            exit(0)
+        self.mode = mode
+        self.n_populations = n_populations
+        self.store = store
         # Stores only the best agent
         self.list_global_best = []          # List of global best solution found so far in all previous generations
         self.list_current_best = []         # List of current best solution in each previous generations
@@ -29,11 +56,79 @@ class History:
         self.list_global_best_fit = []      # List of global best fitness found so far in all previous generations
         self.list_current_best_fit = []     # List of current best fitness in each previous generations
         self.list_population = []           # List of population in each generations
+        if n_populations is not None:
+            self.list_population = deque(maxlen=n_populations)
+        if store is not None:
+            self.list_population = store
         self.list_diversity = None          # List of diversity of swarm in all generations
         self.list_exploitation = None       # List of exploitation percentages for all generations
         self.list_exploration = None        # List of exploration percentages for all generations
         self.epoch = None
 
+    @property
+    def save_population(self):
+        if self.store is not None:
+            return True
+        return self.mode == "full" or (self.mode == "stats" and self.n_populations is not None)
+
+    @property
+    def save_best(self):
+        ## The best agents of all generations, in "none" mode the best fitness are tracked by the optimizer (BestTracker)
+        return self.mode != "none"
+
+    @property
+    def save_diversity(self):
+        return self.mode in ("stats", "full")
+
+    def save_epoch(self, epoch_time, pop=None, diversity=None):
+        """
+        Save the data of a generation depending on the history mode
+
+        Args:
+            epoch_time (float): runtime of the generation
+            pop (list, nd.array): a copy of the population (the position matrix with a population store),
+                only needed when save_population is True
+            diversity (float): diversity of the population, only needed when save_diversity is True
+        """
+        self.list_epoch_time.append(epoch_time)
+        if self.save_population:
+            self.list_population.append(pop)
+        if self.save_diversity:
+            if self.list_diversity is None:
+                self.list_diversity = []
+            self.list_diversity.append(diversity)
+        if self.mode == "none":
+            del self.list_epoch_time[:-1]
+
+    def flush(self):
+        if self.store is not None:
+            self.store.flush()
+
+    def get_state(self):
+        """
+        Returns:
+            The recorded data as a dict of lists (and arrays) for checkpoint, the population store only saves its length
+        """
+        self.flush()
+        state = {"list_global_best": self.list_global_best, "list_current_best": self.list_current_best,
+                 "list_epoch_time": self.list_epoch_time, "list_diversity": self.list_diversity}
+        if self.store is None:
+            state["list_population"] = self.list_population
+        else:
+            state["n_populations_saved"] = len(self.store)
+        return state
+
+    def set_state(self, state=None):
+        self.list_global_best = state["list_global_best"]
+        self.list_current_best = state["list_current_best"]
+        self.list_epoch_time = state["list_epoch_time"]
+        self.list_diversity = state["list_diversity"]
+        if self.store is None:
+            if "list_population" in state:
+                self.list_population.extend(state["list_population"])
+        elif "n_populations_saved" in state:
+            self.store.reopen(state["n_populations_saved"])
+
     def save_initial_best(self, best_agent):
         self.list_global_best = [best_agent]
         self.list_current_best = deepcopy(self.list_global_best)
@@ -69,6 +164,9 @@ class History:
     ## The paper: On the exploration and exploitation in popular swarm-based metaheuristic algorithms
     def save_exploration_exploitation_chart(self, title="Exploration vs Exploitation Percentages", list_colors=('blue', 'orange'),
                                             filename="exploration-exploitation-chart", verbose=True):
+        if self.list_exploration is None:
+            print(f"Exploration and exploitation are not recorded with the history mode: {self.mode}.")
+            return None
         # This exploration/exploitation chart should draws for single algorithm and single fitness function
         # Draw exploration and exploitation chart
         export_explore_exploit_chart(data=[self.list_exploration, self.list_exploitation], title=title,
@@ -76,6 +174,9 @@ class History:
 
     def save_diversity_chart(self, title='Diversity Measurement Chart', algorithm_name='GA',
                              filename="diversity-chart", verbose=True):
+        if self.list_diversity is None:
+            print(f"Diversity is not recorded with the history mode: {self.mode}.")
+            return None
         # This diversity chart should draws for multiple algorithms for a single fitness function at the same time
         # to compare the diversity spreading
         export_diversity_chart(data=[self.list_diversity], title=title, list_legends=[algorithm_name],
@@ -113,29 +214,29 @@ class History:
         list_dimensions = sorted(list_dimensions)
         n_dim = len(list_dimensions)
 
+        if len(self.list_population) == 0:
+            print(f"Population is not recorded with the history mode: {self.mode}.")
+            return None
+        pop_size, n_dims = self.__get_population_shape__()
         if n_dim not in [1, 2]:
             print("Can draw trajectory only for 1 or 2 dimensions!")
             exit(0)
         if len(list_agent_idx) < 1 or len(list_agent_idx) > 10:
             print("Can draw trajectory for 1 to 10 agents only!")
             exit(0)
-        if list_agent_idx[-1] > len(self.list_population[0]) or list_agent_idx[0] < 1:
-            print(f"The index of input agent should be in range of [1, {len(self.list_population[0])}]")
+        if list_agent_idx[-1] > pop_size or list_agent_idx[0] < 1:
+            print(f"The index of input agent should be in range of [1, {pop_size}]")
             exit(0)
-        if list_dimensions[-1] > len(self.list_population[0][0][0]) or list_dimensions[0] < 1:
-            print(f"The index of dimension should be in range of [1, {len(self.list_population[0][0][0])}]")
+        if list_dimensions[-1] > n_dims or list_dimensions[0] < 1:
+            print(f"The index of dimension should be in range of [1, {n_dims}]")
             exit(0)
 
         pos_list = []
         list_legends = []
-
-        # pop[0]: Get the first solution
-        # pop[0][0]: Get the position of the first solution
-        # pop[0][0][0]: Get the first dimension of the position of the first solution
         if n_dim == 1:
             y_label = f"x{list_dimensions[0]}"
             for idx, id_agent in enumerate(list_agent_idx):
-                x = [pop[id_agent-1][0][list_dimensions[0]-1] for pop in self.list_population]
+                x = self.__get_trajectory__(id_agent - 1, list_dimensions[0] - 1)
                 pos_list.append(x)
                 list_legends.append(f"Agent {id_agent}.")
             export_trajectory_chart(pos_list, n_dimensions=n_dim, title=title, list_legends=list_legends,
@@ -146,9 +247,23 @@ class History:
             for idx1, id_agent in enumerate(list_agent_idx):
                 pos_temp = []
                 for idx2, id_dim in enumerate(list_dimensions):
-                    x = [pop[id_agent - 1][0][id_dim - 1] for pop in self.list_population]
+                    x = self.__get_trajectory__(id_agent - 1, id_dim - 1)
                     pos_temp.append(x)
                 pos_list.append(pos_temp)
                 list_legends.append(f"Agent {id_agent}.")
             export_trajectory_chart(pos_list, n_dimensions=n_dim, title=title, list_legends=list_legends, x_label=x_label,
                                     y_label=y_label, filename=filename, verbose=verbose)
+
+    def __get_population_shape__(self):
+        ## Return (pop_size, n_dims) of the first saved generation, it can be a list of agents or a position matrix
+        pop = self.list_population[0]
+        if isinstance(pop, np.ndarray):
+            return pop.shape[0], pop.shape[1]
+        # pop[0][0]: Get the position of the first solution
+        return len(pop), len(pop[0][0])
+
+    def __get_trajectory__(self, id_agent, id_dim):
+        ## Values of a dimension of an agent in all saved generations, the store reads them lazily from disk
+        if self.store is not None:
+            return self.store.get_trajectory(id_agent, id_dim)
+        return [pop[id_agent][0][id_dim] for pop in self.list_population]
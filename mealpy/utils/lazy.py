@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+
+import importlib
+import pkgutil
+
+## The packages of mealpy don't import their modules, each module is imported on its first access as an attribute of
+## the package (PEP 562), e.g. mealpy.swarm_based.PSO.BasePSO after a plain "import mealpy". The usual
+## "from mealpy.swarm_based import PSO" and "from mealpy.swarm_based.PSO import BasePSO" are unchanged.
+
+
+def get_lazy_attributes(package_name=None, package_path=None, package_globals=None):
+    """
+    Create the module level __getattr__ and __dir__ of a package which imports its modules on demand
+
+    Args:
+        package_name (str): __name__ of the package
+        package_path (list): __path__ of the package
+        package_globals (dict): globals() of the package
+
+    Returns:
+        the functions (__getattr__, __dir__) of the package
+    """
+    list_modules = [module.name for module in pkgutil.iter_modules(package_path)]
+
+    def __getattr__(name):
+        if name in list_modules:
+            return importlib.import_module(f"{package_name}.{name}")
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(package_globals) | set(list_modules))
+
+    return __getattr__, __dir__
@@ -0,0 +1,317 @@
+#!/usr/bin/env python
+
+import numpy as np
+from copy import deepcopy
+
+
+class AgentView:
+    """
+    A thin view of a single agent inside a Population, so the old index API still works:
+        agent[ID_POS]                   --> Return: position (a row of the position matrix, writing into it changes the store)
+        agent[ID_FIT]                   --> Return: [target, [obj1, obj2, ...]]
+        agent[ID_FIT][ID_TAR]           --> Return: target
+        agent[ID_FIT][ID_OBJ]           --> Return: [obj1, obj2, ...]
+        agent[2], agent[3], ...         --> Return: the extra fields of each algorithm (velocity, local best,...)
+
+    Reading and writing go to the store: agent[ID_POS] is a row of the position matrix and agent[ID_FIT] is a
+    FitnessView, so agent[ID_FIT][ID_TAR] = target changes the target of the agent in the population.
+    """
+    __slots__ = ("population", "index")
+
+    def __init__(self, population, index):
+        self.population = population
+        self.index = index
+
+    def __len__(self):
+        return self.population.n_fields
+
+    def __iter__(self):
+        for key in range(0, len(self)):
+            yield self[key]
+
+    def __getitem__(self, key):
+        return self.population.get_field(self.index, key)
+
+    def __setitem__(self, key, value):
+        self.population.set_field(self.index, key, value)
+
+    def __deepcopy__(self, memo):
+        ## Copying a view gives a normal agent which doesn't belong to any population
+        return deepcopy(self.to_list(), memo)
+
+    def to_list(self):
+        return [self[key] for key in range(0, len(self))]
+
+    def copy(self):
+        ## Same as list.copy() on a normal agent, but arrays are detached from the store because it is updated in-place
+        return deepcopy(self.to_list())
+
+    def __repr__(self):
+        return f"AgentView({self.to_list()})"
+
+
+class FitnessView:
+    """
+    A view of the fitness wrapper [target, [obj1, obj2, ...]] of a single agent inside a Population
+        fit[ID_TAR]                     --> Return: target
+        fit[ID_OBJ]                     --> Return: objectives (a row of the objective matrix)
+        fit[ID_TAR] = target            --> Change the target in the store
+    The views are compared by their targets, as sorted(pop, key=lambda agent: agent[ID_FIT]) does with the lists.
+    """
+    __slots__ = ("population", "index")
+
+    ID_TAR = 0
+    ID_OBJ = 1
+
+    def __init__(self, population, index):
+        self.population = population
+        self.index = index
+
+    def __len__(self):
+        return 2
+
+    def __iter__(self):
+        yield self[self.ID_TAR]
+        yield self[self.ID_OBJ]
+
+    def __getitem__(self, key):
+        if key == self.ID_TAR:
+            return self.population.list_tar[self.index]
+        elif key == self.ID_OBJ:
+            return self.population.list_objs[self.index]
+        raise IndexError("Fitness index out of range")
+
+    def __setitem__(self, key, value):
+        if key == self.ID_TAR:
+            self.population.list_tar[self.index] = value
+        elif key == self.ID_OBJ:
+            self.population.set_objectives(self.index, value)
+        else:
+            raise IndexError("Fitness index out of range")
+
+    def __lt__(self, other):
+        return self[self.ID_TAR] < other[self.ID_TAR]
+
+    def __le__(self, other):
+        return self[self.ID_TAR] <= other[self.ID_TAR]
+
+    def __gt__(self, other):
+        return self[self.ID_TAR] > other[self.ID_TAR]
+
+    def __ge__(self, other):
+        return self[self.ID_TAR] >= other[self.ID_TAR]
+
+    def __deepcopy__(self, memo):
+        return self.to_list()
+
+    def to_list(self):
+        return [self[self.ID_TAR], self[self.ID_OBJ].copy()]
+
+    def __repr__(self):
+        return f"FitnessView({self.to_list()})"
+
+
+class Population:
+    """
+    Structure-of-arrays store of a population. Instead of a list of agents [position, [target, [obj1, obj2, ...]], ...],
+    it keeps contiguous numpy arrays:
+        + list_pos: (pop_size, n_dims) matrix of positions
+        + list_tar: (pop_size,) vector of targets (fitness values)
+        + list_objs: (pop_size, n_objs) matrix of objective values
+        + list_extra: dict {index of field: array with pop_size rows} for the extra fields of each algorithm
+
+    The population can be indexed like the old list of agents: pop[idx] returns an AgentView, pop[idx][ID_POS] returns
+    the position. A slice or an array of indices returns a new Population.
+    """
+
+    ID_POS = 0  # Index of position/location of solution/agent
+    ID_FIT = 1  # Index of fitness value of solution/agent
+
+    ID_TAR = 0  # Index of target (the final fitness) in fitness
+    ID_OBJ = 1  # Index of objective list in fitness
+
+    def __init__(self, list_pos=None, list_tar=None, list_objs=None, list_extra=None):
+        """
+        Args:
+            list_pos (nd.array): 2-D numpy array (pop_size, n_dims)
+            list_tar (nd.array): 1-D numpy array (pop_size,), default = np.nan (not evaluated yet)
+            list_objs (nd.array): 2-D numpy array (pop_size, n_objs), default = list_tar as the single objective
+            list_extra (dict): {index of field: array with pop_size rows}, index should start from 2
+        """
+        self.list_pos = np.array(list_pos, dtype=float, ndmin=2)
+        pop_size = len(self.list_pos)
+        if list_tar is None:
+            list_tar = np.full(pop_size, np.nan)
+        self.list_tar = np.array(list_tar, dtype=float).reshape(pop_size)
+        if list_objs is None:
+            list_objs = self.list_tar
+        self.list_objs = np.array(list_objs, dtype=float).reshape(pop_size, -1)
+        self.list_extra = {} if list_extra is None else dict(list_extra)
+
+    @classmethod
+    def from_agents(cls, pop=None):
+        """
+        Args:
+            pop (list): The population in the format of list of agents [position, [target, [obj1, obj2, ...]], ...]
+
+        Returns:
+            A Population object holding the same data
+        """
+        list_pos = np.array([agent[cls.ID_POS] for agent in pop], dtype=float)
+        list_tar = np.array([np.nan if agent[cls.ID_FIT] is None else agent[cls.ID_FIT][cls.ID_TAR] for agent in pop], dtype=float)
+        if any(agent[cls.ID_FIT] is None for agent in pop):
+            list_objs = None
+        else:
+            list_objs = np.array([np.ravel(agent[cls.ID_FIT][cls.ID_OBJ]) for agent in pop], dtype=float)
+        list_extra = {}
+        for key in range(2, len(pop[0])):
+            list_extra[key] = cls.__stack_field__([agent[key] for agent in pop])
+        return cls(list_pos, list_tar, list_objs, list_extra)
+
+    @staticmethod
+    def __stack_field__(values):
+        ## Numeric fields (scalars or vectors with the same shape) become a numpy array, the others (nested fitness wrapper
+        ## of the local best,...) are kept in an object array.
+        try:
+            stacked = np.array(values)
+            if stacked.dtype != object:
+                return stacked
+        except ValueError:
+            pass
+        stacked = np.empty(len(values), dtype=object)
+        for idx, value in enumerate(values):
+            stacked[idx] = deepcopy(value)
+        return stacked
+
+    def to_agents(self):
+        """
+        Returns:
+            The population in the format of list of agents, which is independent of this store
+        """
+        return [deepcopy(self[idx].to_list()) for idx in range(0, len(self))]
+
+    @property
+    def n_fields(self):
+        return 2 + len(self.list_extra)
+
+    def __len__(self):
+        return len(self.list_pos)
+
+    def __iter__(self):
+        for idx in range(0, len(self)):
+            yield AgentView(self, idx)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("Population index out of range")
+            return AgentView(self, key)
+        ## Slice, boolean mask or array of indices --> a new population
+        return Population(self.list_pos[key], self.list_tar[key], self.list_objs[key],
+                          {field: values[key] for field, values in self.list_extra.items()})
+
+    def __setitem__(self, key, agent):
+        for field in range(0, self.n_fields):
+            self.set_field(key, field, agent[field])
+
+    def get_field(self, idx, field):
+        if field == self.ID_POS:
+            return self.list_pos[idx]
+        elif field == self.ID_FIT:
+            return FitnessView(self, idx)
+        return self.list_extra[field][idx]
+
+    def set_field(self, idx, field, value):
+        if field == self.ID_POS:
+            self.list_pos[idx] = value
+        elif field == self.ID_FIT:
+            target, objs = value[self.ID_TAR], value[self.ID_OBJ]       # Read both before writing, value can be a view of this store
+            self.list_tar[idx] = target
+            self.set_objectives(idx, objs)
+        else:
+            self.list_extra[field][idx] = value
+
+    def set_objectives(self, idx, objs):
+        objs = np.ravel(objs)
+        if len(objs) != self.list_objs.shape[1]:
+            ## A not evaluated population has a single objective column (the nan targets)
+            self.list_objs = np.full((len(self), len(objs)), np.nan)
+        self.list_objs[idx] = objs
+
+    def set_fitness(self, list_fit=None):
+        """
+        Args:
+            list_fit (list): The fitness wrapper [target, [obj1, obj2, ...]] of each agent
+        """
+        if len(list_fit) == 0:
+            return None
+        self.list_tar = np.array([fit[self.ID_TAR] for fit in list_fit], dtype=float).reshape(len(self))
+        self.list_objs = np.array([np.ravel(fit[self.ID_OBJ]) for fit in list_fit], dtype=float).reshape(len(self), -1)
+
+    def __add__(self, other):
+        ## pop + pop_new gives a new population, as the concatenation of the lists of agents
+        if not isinstance(other, Population):
+            if len(other) == 0:
+                return self[np.arange(len(self))]
+            other = Population.from_agents(other)
+        return Population(np.concatenate((self.list_pos, other.list_pos)), np.concatenate((self.list_tar, other.list_tar)),
+                          np.concatenate((self.list_objs, other.list_objs)),
+                          {field: np.concatenate((values, other.list_extra[field])) for field, values in self.list_extra.items()})
+
+    def __radd__(self, other):
+        if len(other) == 0:
+            return self[np.arange(len(self))]
+        return Population.from_agents(other) + self
+
+    def get_sorted_index(self, minmax="min"):
+        """
+        Returns:
+            Indices of agents from the best to the worst one
+        """
+        sorted_idx = np.argsort(self.list_tar, kind="stable")
+        return sorted_idx if minmax == "min" else sorted_idx[::-1]
+
+    def get_best_index(self, minmax="min"):
+        return int(np.argmin(self.list_tar)) if minmax == "min" else int(np.argmax(self.list_tar))
+
+    def get_worst_index(self, minmax="min"):
+        return int(np.argmax(self.list_tar)) if minmax == "min" else int(np.argmin(self.list_tar))
+
+    def sort(self, minmax="min"):
+        """
+        Returns:
+            A new population sorted from the best to the worst agent
+        """
+        return self[self.get_sorted_index(minmax)]
+
+    def greedy_selection(self, pop_new=None, minmax="min"):
+        """
+        Args:
+            pop_new (Population): The next population with the same size
+            minmax (str): "min" or "max"
+
+        Returns:
+            A new population, each agent is the better one between the current and the next population
+        """
+        if len(self) != len(pop_new):
+            print("Pop old and Pop new should be the same length!")
+            exit(0)
+        if minmax == "min":
+            mask = pop_new.list_tar < self.list_tar
+        else:
+            mask = pop_new.list_tar > self.list_tar
+        list_extra = {}
+        for field, values in self.list_extra.items():
+            cond = mask.reshape((-1,) + (1,) * (values.ndim - 1))
+            list_extra[field] = np.where(cond, pop_new.list_extra[field], values)
+        return Population(np.where(mask[:, None], pop_new.list_pos, self.list_pos), np.where(mask, pop_new.list_tar, self.list_tar),
+                          np.where(mask[:, None], pop_new.list_objs, self.list_objs), list_extra)
+
+    def get_diversity(self):
+        """
+        Returns:
+            The diversity of population: mean absolute distance to the median position
+        """
+        return np.mean(np.abs(np.median(self.list_pos, axis=0) - self.list_pos))
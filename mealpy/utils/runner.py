@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+import numpy as np
+import concurrent.futures as parallel
+from copy import deepcopy
+from pathlib import Path
+import csv
+import os
+import time
+
+
+def run_single(task=None):
+    """
+    A single independent run, called in the worker processes of Runner (so it is a module-level function)
+
+    Args:
+        task (tuple): (optimizer class, its keywords, problem, seed)
+
+    Returns:
+        best fitness, global best fitness of each generation (1-D numpy array), runtime in seconds
+    """
+    optimizer, kwargs, problem, seed = task
+    np.random.seed(seed)
+    time_start = time.time()
+    ## Only the best fitness of each generation is needed, the populations are not saved unless history_mode is given
+    model = optimizer(deepcopy(problem), **{"history_mode": "none", **kwargs})
+    model.verbose = False
+    _, best_fit = model.solve()
+    return best_fit, np.asarray(model.history.list_global_best_fit, dtype=float), time.time() - time_start
+
+
+class Runner:
+    """
+    Run a grid of algorithms on a list of problems many times (one run per seed), the independent runs are spread over a
+    process pool and the results are gathered in numpy arrays:
+        + best_fit: best fitness with shape (n_algorithms, n_problems, n_runs)
+        + runtime: runtime in seconds with shape (n_algorithms, n_problems, n_runs)
+        + curves: global best fitness of each generation with shape (n_algorithms, n_problems, n_runs, n_generations),
+            padded with nan when a run stops early (termination)
+
+    Each run sets the numpy random seed before creating its model, so the results only depend on the seeds, not on the
+    number of workers. The same seed is used by all algorithms and problems in a run (common random numbers).
+
+    Examples:
+        algorithms = {"GWO": (BaseGWO, {"epoch": 100, "pop_size": 50}), "DE": (BaseDE, {"epoch": 100, "pop_size": 50, "wf": 0.8})}
+        problems = {"F1": {"obj_func": F1, "lb": [-100, ] * 30, "ub": [100, ] * 30, "minmax": "min"}, "F5": {...}}
+        runner = Runner(algorithms, problems, seeds=range(30))
+        runner.run(mode="process")
+        runner.save("history/benchmark")
+        print(np.mean(runner.best_fit, axis=2))
+
+    Notes:
+        With mode "process", the objective functions should be defined at module-level (no lambda) so they can be sent
+        to the workers, and your program needs the if __name__ == "__main__" condition on Windows
+    """
+
+    LIST_MODES = ("sequential", "process")
+
+    def __init__(self, algorithms=None, problems=None, seeds=None):
+        """
+        Args:
+            algorithms (dict): {name: (optimizer class, dict of keywords)}
+            problems (dict): {name: problem dict or Problem object}
+            seeds (list, range): the seed of each run, for example range(30) for 30 runs
+        """
+        if type(algorithms) is not dict or len(algorithms) == 0:
+            print("The algorithms should be a dict of {name: (optimizer class, dict of keywords)}.")
+            exit(0)
+        if type(problems) is not dict or len(problems) == 0:
+            print("The problems should be a dict of {name: problem}.")
+            exit(0)
+        if seeds is None or len(seeds) == 0:
+            print("Please input the seeds of the runs, for example: range(30).")
+            exit(0)
+        self.algorithms = algorithms
+        self.problems = problems
+        self.seeds = [int(seed) for seed in seeds]
+        self.list_algorithms, self.list_problems = list(algorithms.keys()), list(problems.keys())
+        self.best_fit, self.runtime, self.curves = None, None, None
+
+    def get_tasks(self):
+        tasks = []
+        for name in self.list_algorithms:
+            optimizer, kwargs = self.algorithms[name]
+            for problem_name in self.list_problems:
+                for seed in self.seeds:
+                    tasks.append((optimizer, kwargs, self.problems[problem_name], seed))
+        return tasks
+
+    def run(self, mode="process", n_workers=None):
+        """
+        Args:
+            mode (str): 'sequential' or 'process' (one run per worker process at a time, all CPUs by default)
+            n_workers (int): number of processes in the pool, default = None (number of CPUs)
+
+        Returns:
+            best_fit, numpy array with shape (n_algorithms, n_problems, n_runs)
+        """
+        if mode not in self.LIST_MODES:
+            print(f"Runner mode should be one of {self.LIST_MODES}.")
+            exit(0)
+        tasks = self.get_tasks()
+        if mode == "sequential":
+            results = [run_single(task) for task in tasks]
+        else:
+            n_workers = n_workers or os.cpu_count() or 1
+            chunk_size = max(len(tasks) // (4 * n_workers), 1)
+            with parallel.ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(run_single, tasks, chunksize=chunk_size))
+        shape = (len(self.list_algorithms), len(self.list_problems), len(self.seeds))
+        self.best_fit = np.array([result[0] for result in results], dtype=float).reshape(shape)
+        self.runtime = np.array([result[2] for result in results], dtype=float).reshape(shape)
+        n_generations = max(len(result[1]) for result in results)
+        self.curves = np.full((len(results), n_generations), np.nan)
+        for idx, result in enumerate(results):
+            self.curves[idx, :len(result[1])] = result[1]
+        self.curves = self.curves.reshape(shape + (n_generations,))
+        return self.best_fit
+
+    def get_rows(self):
+        ## One row per run: algorithm, problem, seed, best fitness, runtime
+        for idx_alg, name in enumerate(self.list_algorithms):
+            for idx_prob, problem_name in enumerate(self.list_problems):
+                for idx_run, seed in enumerate(self.seeds):
+                    yield [name, problem_name, seed, self.best_fit[idx_alg, idx_prob, idx_run], self.runtime[idx_alg, idx_prob, idx_run]]
+
+    def to_dataframe(self):
+        """
+        Returns:
+            pandas DataFrame with one row per run, columns: algorithm, problem, seed, best_fit, runtime (pandas is needed)
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            print("Please install pandas to use Runner.to_dataframe(), or use the numpy arrays of Runner directly.")
+            exit(0)
+        return pd.DataFrame(list(self.get_rows()), columns=["algorithm", "problem", "seed", "best_fit", "runtime"])
+
+    def save(self, folder="history/runner"):
+        """
+        Save all results at once:
+            + results.npz: best_fit, runtime, curves and the names of algorithms, problems and seeds
+            + best_fit.csv: one row per run (algorithm, problem, seed, best_fit, runtime)
+
+        Args:
+            folder (str): the folder of the files, it is created if needed
+        """
+        if self.best_fit is None:
+            print("Please call Runner.run() before saving the results.")
+            exit(0)
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(folder / "results.npz", best_fit=self.best_fit, runtime=self.runtime, curves=self.curves,
+                            algorithms=np.array(self.list_algorithms), problems=np.array(self.list_problems), seeds=np.array(self.seeds))
+        with open(folder / "best_fit.csv", "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["algorithm", "problem", "seed", "best_fit", "runtime"])
+            writer.writerows(self.get_rows())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+## Selection on an array of fitness (one target per agent) instead of sorting the agents with sorted(key=lambda ...).
+## The order of the indices is the same as the order of Python sorted(): stable, the equal targets keep their order.
+
+
+def get_ranked_index(list_fit=None, reverse=False):
+    """
+    Args:
+        list_fit (list, nd.array): the targets of the agents
+        reverse (bool): from the largest to the smallest target if True
+
+    Returns:
+        Indices of all agents, same order as sorted(range(n), key=lambda i: list_fit[i], reverse=reverse)
+    """
+    list_fit = np.asarray(list_fit, dtype=float)
+    return np.argsort(-list_fit if reverse else list_fit, kind="stable")
+
+
+def get_top_k_index(list_fit=None, k=None, reverse=False):
+    """
+    The first k indices of get_ranked_index() in O(n + k.log(k)) with np.argpartition
+
+    Args:
+        list_fit (list, nd.array): the targets of the agents
+        k (int): number of indices, None for all of them
+        reverse (bool): the k largest targets if True, otherwise the k smallest ones
+
+    Returns:
+        Indices of the k smallest (largest) targets, from the smallest (largest) one
+    """
+    list_fit = np.asarray(list_fit, dtype=float)
+    key = -list_fit if reverse else list_fit
+    if k is None or k >= len(key):
+        return np.argsort(key, kind="stable")
+    if k <= 0:
+        return np.array([], dtype=int)
+    kth = np.partition(key, k - 1)[k - 1]
+    ## Keep the first of the targets equal to the k-th one, same as a stable sort
+    idx_less = np.nonzero(key < kth)[0]
+    idx_equal = np.nonzero(key == kth)[0][:k - len(idx_less)]
+    selected = np.concatenate((idx_less, idx_equal))
+    return selected[np.argsort(key[selected], kind="stable")]
+
+
+def get_min_max_index(list_fit=None):
+    """
+    Returns:
+        The first index of the smallest target, the first index of the largest target
+    """
+    list_fit = np.asarray(list_fit, dtype=float)
+    return int(np.argmin(list_fit)), int(np.argmax(list_fit))
+
+
+def get_roulette_wheel_index(list_weights=None, n_select=1):
+    """
+    Roulette wheel selection of many indices with a single np.searchsorted on the cumulative weights
+
+    Args:
+        list_weights (list, nd.array): non-negative weights, the chance of an index is proportional to its weight
+        n_select (int): number of selected indices (with replacement)
+
+    Returns:
+        1-D numpy array (n_select,) of indices, uniform random indices if all weights are 0
+    """
+    cumulative = np.cumsum(np.asarray(list_weights, dtype=float))
+    if not cumulative[-1] > 0:
+        return np.random.randint(0, len(cumulative), n_select)
+    list_idx = np.searchsorted(cumulative, np.random.uniform(0, cumulative[-1], n_select), side="right")
+    return np.minimum(list_idx, len(cumulative) - 1)
+
+
+def get_kway_tournament_index(list_fit=None, k_way=2, n_select=1, minmax="min"):
+    """
+    Batched k-way tournament: n_select tournaments between k_way distinct random agents, the best agent wins
+
+    Args:
+        list_fit (list, nd.array): the targets of the agents
+        k_way (int, float): number of agents in a tournament, or a fraction of the population if in range (0, 1)
+        n_select (int): number of tournaments
+        minmax (str): "min" or "max"
+
+    Returns:
+        1-D numpy array (n_select,), the index of the winner of each tournament
+    """
+    list_fit = np.asarray(list_fit, dtype=float)
+    n_agents = len(list_fit)
+    if 0 < k_way < 1:
+        k_way = int(k_way * n_agents)
+    k_way = min(max(int(round(k_way)), 1), n_agents)
+    ## The first k_way columns of a random permutation of each row: distinct agents in a tournament
+    list_competitors = np.argpartition(np.random.random((n_select, n_agents)), k_way - 1, axis=1)[:, :k_way]
+    list_fit = list_fit[list_competitors]
+    list_winners = np.argmin(list_fit, axis=1) if minmax == "min" else np.argmax(list_fit, axis=1)
+    return list_competitors[np.arange(n_select), list_winners]
+
+
+def get_distinct_random_index(n_total=None, k=1, exclude=None, low=0):
+    """
+    Draw k distinct random indices in range [low, low + n_total) for each row, without the excluded indices of the row.
+    Each draw is mapped over the sorted excluded (and already drawn) indices, so it is exact uniform sampling without
+    replacement in O(n_rows * (n_exclude + k)^2) numpy work, no set or list of size n_total is built.
+
+    Args:
+        n_total (int): number of indices
+        k (int): number of distinct indices of each row
+        exclude (nd.array): 2-D int array (n_rows, n_exclude), the excluded indices of each row (duplicates and indices
+            out of the range are ignored), or 1-D int array (n_rows,) of a single excluded index per row
+        low (int): the first index
+
+    Returns:
+        2-D int array (n_rows, k), the distinct indices of each row in random order
+    """
+    exclude = np.zeros((1, 0), dtype=int) if exclude is None else np.asarray(exclude, dtype=int) - low
+    if exclude.ndim == 1:
+        exclude = exclude[:, None]
+    n_rows = len(exclude)
+    ## The ignored excluded indices are replaced by n_total, which is never reached by a draw
+    exclude = np.sort(np.where((exclude >= 0) & (exclude < n_total), exclude, n_total), axis=1)
+    if exclude.shape[1] > 1:
+        exclude[:, 1:] = np.where(exclude[:, 1:] == exclude[:, :-1], n_total, exclude[:, 1:])
+        exclude = np.sort(exclude, axis=1)
+    n_free = n_total - np.sum(exclude < n_total, axis=1)
+    if np.any(n_free < k):
+        ## The same error as np.random.choice(..., replace=False), the callers may handle it
+        raise ValueError(f"Can't draw {k} distinct indices from {np.min(n_free)} available indices.")
+    list_idx = np.empty((n_rows, k), dtype=int)
+    for jdx in range(0, k):
+        idx = np.floor(np.random.uniform(size=n_rows) * (n_free - jdx)).astype(int)
+        for col in range(0, exclude.shape[1]):
+            idx += idx >= exclude[:, col]
+        list_idx[:, jdx] = idx
+        exclude = np.sort(np.concatenate((exclude, idx[:, None]), axis=1), axis=1)
+    return list_idx + low
+
+
+def get_distinct_random_sample(low=0, high=None, k=1, exclude=()):
+    """
+    The single row version of get_distinct_random_index() for the calls inside the loop of agents, by rejection: a
+    draw is rejected if it is excluded or drawn before. It is fast when the k draws are a small part of the range,
+    otherwise the exact version is used.
+
+    Args:
+        low (int): the first index
+        high (int): the last index + 1
+        k (int): number of distinct indices
+        exclude (list, set): the excluded indices
+
+    Returns:
+        list of k distinct random indices in range [low, high) in random order
+    """
+    exclude = {int(idx) for idx in exclude if low <= idx < high}
+    n_free = high - low - len(exclude)
+    if n_free < 4 * k:
+        return get_distinct_random_index(high - low, k, np.array([sorted(exclude)], dtype=int).reshape(1, -1), low)[0].tolist()
+    list_idx = []
+    while len(list_idx) < k:
+        for idx in np.random.randint(low, high, 2 * k).tolist():
+            if idx not in exclude:
+                exclude.add(idx)
+                list_idx.append(idx)
+                if len(list_idx) == k:
+                    break
+    return list_idx
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+
+import numpy as np
+from bisect import bisect_right
+from pathlib import Path
+import json
+
+
+class MemmapPopulationStore:
+    """
+    Store the position matrix of each generation in a preallocated numpy memmap file (max_epochs, pop_size, n_dims),
+    so the full trajectory of a long run doesn't need to be kept in RAM. The population size must be the same in
+    all generations, use ChunkedPopulationStore for the algorithms that change their population size.
+
+    A small metadata file "filename.json" is written by flush(), it is needed to reload the store later by:
+        store = MemmapPopulationStore.load("history/pop.dat")
+    """
+
+    def __init__(self, filename="population.dat", max_epochs=None, dtype="float64"):
+        """
+        Args:
+            filename (str): path of the memmap file
+            max_epochs (int): maximum number of generations saved, it should be >= epoch of the algorithm
+            dtype (str): data type of the positions, "float32" halves the size of the file
+        """
+        if type(max_epochs) is not int or max_epochs < 1:
+            print("The maximum number of epochs of memmap store should be an int number and > 0.")
+            exit(0)
+        self.filename = str(filename)
+        self.max_epochs = max_epochs
+        self.dtype = dtype
+        self.shape = None
+        self.n_saved = 0
+        self.data = None
+
+    def __create_file__(self, shape):
+        Path(self.filename).parent.mkdir(parents=True, exist_ok=True)
+        self.shape = tuple(shape)
+        self.data = np.memmap(self.filename, dtype=self.dtype, mode="w+", shape=(self.max_epochs,) + self.shape)
+
+    def append(self, pos_matrix=None):
+        """
+        Args:
+            pos_matrix (nd.array): 2-D numpy array (pop_size, n_dims) of the current generation
+        """
+        pos_matrix = np.asarray(pos_matrix)
+        if self.data is None:
+            self.__create_file__(pos_matrix.shape)
+        if pos_matrix.shape != self.shape:
+            print(f"Memmap store needs the same population shape {self.shape} in all generations, but got {pos_matrix.shape}. "
+                  f"Please use ChunkedPopulationStore instead.")
+            exit(0)
+        if self.n_saved >= self.max_epochs:
+            print(f"Memmap store is full, the maximum number of epochs is {self.max_epochs}.")
+            exit(0)
+        self.data[self.n_saved] = pos_matrix
+        self.n_saved += 1
+
+    def flush(self):
+        if self.data is None:
+            return None
+        self.data.flush()
+        with open(f"{self.filename}.json", "w") as f:
+            json.dump({"max_epochs": self.max_epochs, "shape": list(self.shape), "dtype": self.dtype, "n_saved": self.n_saved}, f)
+
+    @classmethod
+    def load(cls, filename=None):
+        """
+        Args:
+            filename (str): path of the memmap file, its metadata file "filename.json" must exist
+
+        Returns:
+            The store opened in read-only mode
+        """
+        with open(f"{filename}.json") as f:
+            meta = json.load(f)
+        store = cls(filename, meta["max_epochs"], meta["dtype"])
+        store.shape = tuple(meta["shape"])
+        store.n_saved = meta["n_saved"]
+        store.data = np.memmap(store.filename, dtype=store.dtype, mode="r", shape=(store.max_epochs,) + store.shape)
+        return store
+
+    def reopen(self, n_saved=0):
+        """
+        Continue writing to the file of a previous run after its first n_saved generations (resume from a checkpoint)
+
+        Args:
+            n_saved (int): number of generations kept from the previous run
+        """
+        if n_saved > 0 and Path(f"{self.filename}.json").exists():
+            with open(f"{self.filename}.json") as f:
+                meta = json.load(f)
+            self.shape = tuple(meta["shape"])
+            self.data = np.memmap(self.filename, dtype=self.dtype, mode="r+", shape=(self.max_epochs,) + self.shape)
+            self.n_saved = n_saved
+
+    def __getstate__(self):
+        ## Don't copy the whole memmap when pickling (process mode, checkpoint), only reopen the file later
+        self.flush()
+        state = self.__dict__.copy()
+        state["data"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.shape is not None and Path(self.filename).exists():
+            self.data = np.memmap(self.filename, dtype=self.dtype, mode="r+", shape=(self.max_epochs,) + self.shape)
+
+    def __len__(self):
+        return self.n_saved
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.n_saved
+        if not 0 <= idx < self.n_saved:
+            raise IndexError("Population store index out of range")
+        return self.data[idx]
+
+    def __iter__(self):
+        for idx in range(0, self.n_saved):
+            yield self.data[idx]
+
+    def get_trajectory(self, id_agent=0, id_dim=0):
+        """
+        Returns:
+            1-D numpy array, the values in dimension id_dim of agent id_agent in all saved generations
+        """
+        return np.array(self.data[:self.n_saved, id_agent, id_dim])
+
+    def get_list_diversity(self):
+        """
+        Returns:
+            1-D numpy array, the diversity of all saved generations, computed one generation at a time
+        """
+        return np.array([np.mean(np.abs(np.median(pos, axis=0) - pos)) for pos in self])
+
+
+class ChunkedPopulationStore:
+    """
+    Store the position matrix of each generation in chunked .npy files inside a folder. The last generations are kept
+    in memory until chunk_size of them are collected, then they are written in a single file "chunk-xxxxx.npy".
+    The population size can change over generations, a new chunk is started whenever it changes.
+
+    The index of chunks "index.json" is written after each chunk, the store can be reloaded later by:
+        store = ChunkedPopulationStore.load("history/pop")
+    """
+
+    def __init__(self, directory="population", chunk_size=100, dtype="float64"):
+        """
+        Args:
+            directory (str): the folder of chunk files
+            chunk_size (int): number of generations in a chunk file
+            dtype (str): data type of the positions, "float32" halves the size of the files
+        """
+        if type(chunk_size) is not int or chunk_size < 1:
+            print("The chunk size should be an int number and > 0.")
+            exit(0)
+        self.directory = str(directory)
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.list_chunks = []       # List of [index of the first generation, number of generations, filename]
+        self.buffer = []            # Generations are not written yet
+        self.n_saved = 0
+
+    def append(self, pos_matrix=None):
+        """
+        Args:
+            pos_matrix (nd.array): 2-D numpy array (pop_size, n_dims) of the current generation
+        """
+        pos_matrix = np.array(pos_matrix, dtype=self.dtype)
+        if len(self.buffer) > 0 and pos_matrix.shape != self.buffer[0].shape:
+            self.__write_chunk__()
+        self.buffer.append(pos_matrix)
+        self.n_saved += 1
+        if len(self.buffer) >= self.chunk_size:
+            self.__write_chunk__()
+
+    def __write_chunk__(self):
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        filename = f"chunk-{len(self.list_chunks):05d}.npy"
+        np.save(Path(self.directory) / filename, np.stack(self.buffer))
+        self.list_chunks.append([self.n_saved - len(self.buffer), len(self.buffer), filename])
+        self.buffer = []
+        with open(Path(self.directory) / "index.json", "w") as f:
+            json.dump({"chunk_size": self.chunk_size, "dtype": self.dtype, "n_saved": self.n_saved, "chunks": self.list_chunks}, f)
+
+    def flush(self):
+        if len(self.buffer) > 0:
+            self.__write_chunk__()
+
+    @classmethod
+    def load(cls, directory=None):
+        """
+        Args:
+            directory (str): the folder of chunk files, its "index.json" file must exist
+
+        Returns:
+            The store, chunks are read lazily with memory mapping
+        """
+        with open(Path(directory) / "index.json") as f:
+            meta = json.load(f)
+        store = cls(directory, meta["chunk_size"], meta["dtype"])
+        store.list_chunks = meta["chunks"]
+        store.n_saved = meta["n_saved"]
+        return store
+
+    def reopen(self, n_saved=0):
+        """
+        Continue writing to the folder of a previous run after its first n_saved generations (resume from a checkpoint)
+
+        Args:
+            n_saved (int): number of generations kept from the previous run, all of them are written in chunk files
+        """
+        if n_saved > 0 and (Path(self.directory) / "index.json").exists():
+            with open(Path(self.directory) / "index.json") as f:
+                meta = json.load(f)
+            self.list_chunks = [chunk for chunk in meta["chunks"] if chunk[0] + chunk[1] <= n_saved]
+            self.buffer = []
+            self.n_saved = n_saved
+
+    def __load_chunk__(self, id_chunk):
+        return np.load(Path(self.directory) / self.list_chunks[id_chunk][2], mmap_mode="r")
+
+    def __len__(self):
+        return self.n_saved
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self.n_saved
+        if not 0 <= idx < self.n_saved:
+            raise IndexError("Population store index out of range")
+        n_written = self.n_saved - len(self.buffer)
+        if idx >= n_written:
+            return self.buffer[idx - n_written]
+        id_chunk = bisect_right([chunk[0] for chunk in self.list_chunks], idx) - 1
+        return self.__load_chunk__(id_chunk)[idx - self.list_chunks[id_chunk][0]]
+
+    def __iter__(self):
+        for id_chunk in range(0, len(self.list_chunks)):
+            for pos in self.__load_chunk__(id_chunk):
+                yield pos
+        for pos in self.buffer:
+            yield pos
+
+    def get_trajectory(self, id_agent=0, id_dim=0):
+        """
+        Returns:
+            1-D numpy array, the values in dimension id_dim of agent id_agent in all saved generations
+        """
+        list_values = [self.__load_chunk__(id_chunk)[:, id_agent, id_dim] for id_chunk in range(0, len(self.list_chunks))]
+        list_values += [pos[id_agent, id_dim:id_dim+1] for pos in self.buffer]
+        return np.concatenate(list_values) if len(list_values) > 0 else np.array([])
+
+    def get_list_diversity(self):
+        """
+        Returns:
+            1-D numpy array, the diversity of all saved generations, computed one generation at a time
+        """
+        return np.array([np.mean(np.abs(np.median(pos, axis=0) - pos)) for pos in self])
@@ -70,4 +70,11 @@ class Termination:
 
     def logging(self, verbose=True):
         if verbose:
-            print(f"Stopping criterion with mode {self.mode} occurs. End program!")
\ No newline at end of file
+            print(f"Stopping criterion with mode {self.mode} occurs. End program!")
+
+class BudgetExhausted(Exception):
+    """
+    Raised by the evaluation functions when the function evaluation budget (FE mode) is used up, the run is stopped
+    right away even in the middle of an epoch
+    """
+    pass
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+import numpy as np
+from copy import deepcopy
+
+
+class BestTracker:
+    """
+    Track the global best solution of a run and the best fitness of each generation, without sorting or copying the
+    population in each generation:
+        + agent: a copy of the global best agent, it is copied only when it is improved and never modified in-place
+        + current_agent: the best agent of the latest generation, a reference to the agent in the population
+        + list_current_fit, list_global_fit: the current best and global best fitness of each generation (the initial
+            population is the first one), saved in numpy arrays which are preallocated and doubled when they are full
+
+    The Optimizer updates it with the best agent of each generation (found by argmin/argmax over the fitness array),
+    the History only records the full agents when its mode is not "none".
+    """
+
+    ID_FIT = 1
+    ID_TAR = 0
+
+    def __init__(self, minmax="min", capacity=1000):
+        """
+        Args:
+            minmax (str): "min" or "max"
+            capacity (int): number of generations preallocated, usually epoch + 1
+        """
+        self.minmax = minmax
+        self.agent, self.current_agent = None, None
+        self.n_records = 0
+        self.current_fits = np.empty(max(capacity, 1))
+        self.global_fits = np.empty(max(capacity, 1))
+
+    @property
+    def position(self):
+        return self.agent[0]
+
+    @property
+    def target(self):
+        return self.agent[self.ID_FIT][self.ID_TAR]
+
+    @property
+    def current_target(self):
+        return self.current_fits[self.n_records - 1]
+
+    @property
+    def list_current_fit(self):
+        return self.current_fits[:self.n_records]
+
+    @property
+    def list_global_fit(self):
+        return self.global_fits[:self.n_records]
+
+    def get_state(self):
+        """
+        Returns:
+            The tracked data as a dict for checkpoint
+        """
+        return {"agent": self.agent, "current_agent": deepcopy(self.current_agent), "n_records": self.n_records,
+                "current_fits": self.list_current_fit.copy(), "global_fits": self.list_global_fit.copy()}
+
+    def set_state(self, state=None):
+        self.agent, self.current_agent = state["agent"], state["current_agent"]
+        self.n_records = state["n_records"]
+        capacity = max(len(self.current_fits), self.n_records)
+        self.current_fits, self.global_fits = np.empty(capacity), np.empty(capacity)
+        self.current_fits[:self.n_records] = state["current_fits"]
+        self.global_fits[:self.n_records] = state["global_fits"]
+
+    def is_better(self, target_a=None, target_b=None):
+        ## Same rule as Optimizer.get_better_solution: with equal targets, the new agent wins in a maximization problem
+        if self.minmax == "min":
+            return target_a < target_b
+        return not target_a < target_b
+
+    def __record__(self, current_target):
+        if self.n_records == len(self.current_fits):
+            self.current_fits = np.concatenate((self.current_fits, np.empty(len(self.current_fits))))
+            self.global_fits = np.concatenate((self.global_fits, np.empty(len(self.global_fits))))
+        self.current_fits[self.n_records] = current_target
+        self.global_fits[self.n_records] = self.target
+        self.n_records += 1
+
+    def reset(self, agent=None, copy_agent=deepcopy):
+        """
+        Start the records with the best agent of the initial population
+
+        Args:
+            agent (list): the best agent
+            copy_agent (callable): function to copy an agent
+        """
+        self.agent = copy_agent(agent)
+        self.current_agent = agent
+        self.n_records = 0
+        self.__record__(self.target)
+
+    def update(self, agent=None, save=True, copy_agent=deepcopy):
+        """
+        Args:
+            agent (list): the best agent of a generation
+            save (bool): True to record a new generation, False to update the latest one (an agent found in the middle
+                of a generation)
+            copy_agent (callable): function to copy an agent, only called when the global best is improved
+
+        Returns:
+            True if the agent is the current best of the latest generation
+        """
+        target = agent[self.ID_FIT][self.ID_TAR]
+        is_current = save or self.is_better(target, self.current_target)
+        if is_current:
+            self.current_agent = agent
+        if self.is_better(target, self.target):
+            self.agent = copy_agent(agent)
+        if save:
+            self.__record__(target)
+        else:
+            if is_current:
+                self.current_fits[self.n_records - 1] = target
+            self.global_fits[self.n_records - 1] = self.target
+        return is_current
@@ -8,11 +8,13 @@
 # ------------------------------------------------------------------------------------------------------%
 
 import platform
-from matplotlib import pyplot as plt
 from numpy import arange
 from pathlib import Path
 import re
 
+## matplotlib.pyplot is imported by the drawing functions, so importing mealpy (and every worker process) doesn't pay
+## for it until the first chart is drawn
+
 
 LIST_LINESTYLES = [
     '-',        # solid line style
@@ -54,6 +56,7 @@ def __check_filepath__(filename):
 
 def _draw_line_(data=None, title=None, linestyle='-', color='b', x_label="#Iteration", y_label="Function Value",
                      filename=None, exts=(".png", ".pdf"), verbose=True):
+    from matplotlib import pyplot as plt
     x = arange(0, len(data))
     y = data
     plt.title(title)
@@ -72,6 +75,7 @@ def _draw_line_(data=None, title=None, linestyle='-', color='b', x_label="#Itera
 
 def _draw_multi_line_(data=None, title=None, list_legends=None, list_styles=None, list_colors=None,
                       x_label="#Iteration", y_label="Function Value", filename=None, exts=(".png", ".pdf"), verbose=True):
+    from matplotlib import pyplot as plt
     x = arange(0, len(data[0]))
     for idx, y in enumerate(data):
         plt.plot(x, y, label=list_legends[idx], markerfacecolor=list_colors[idx], linestyle=list_styles[idx])
@@ -91,6 +95,7 @@ def _draw_multi_line_(data=None, title=None, list_legends=None, list_styles=None
 
 def _draw_multi_line_in_same_figure_(data=None, title=None, list_legends=None, list_styles=None, list_colors=None,
                                      x_label="#Iteration", y_label="Objective", filename=None, exts=(".png", ".pdf"), verbose=True):
+    from matplotlib import pyplot as plt
     n_lines = len(data)
     len_lines = len(data[0])
     x = arange(0, len_lines)
@@ -161,6 +166,7 @@ def export_objectives_chart(data=None, title="Objectives chart", list_legends=No
 def export_trajectory_chart(data=None, n_dimensions=1, title="Trajectory of some first agents after generations", list_legends=None,
                                  list_styles=None, list_colors=None, x_label="#Iteration", y_label="X1",
                                  filename="1d_trajectory", exts=(".png", ".pdf"), verbose=True):
+    from matplotlib import pyplot as plt
     if list_styles is None:
         list_styles = LIST_LINESTYLES[:len(data)]
     if list_colors is None:
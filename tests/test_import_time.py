@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# Importing a single optimizer must stay cheap: no matplotlib (imported by the first chart) and no other algorithm
+# module (loaded on demand by the packages). Each check runs in a fresh interpreter, so the modules imported by pytest
+# and by the other tests don't count.
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## Generous wall-clock budget of the import, most of it is numpy, to catch a heavy dependency coming back
+IMPORT_BUDGET = 3.0
+
+SCRIPT = """
+import json, sys, time
+time_start = time.perf_counter()
+from mealpy.swarm_based.PSO import BasePSO
+runtime = time.perf_counter() - time_start
+print(json.dumps({"runtime": runtime, "modules": sorted(sys.modules)}))
+"""
+
+FAMILIES = ("bio_based", "evolutionary_based", "human_based", "math_based", "music_based", "physics_based",
+            "probabilistic_based", "swarm_based", "system_based", "dummy")
+
+
+def run_import():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.environ.get("PYTHONPATH", "")]))
+    output = subprocess.run([sys.executable, "-c", SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_matplotlib():
+    result = run_import()
+    assert not [name for name in result["modules"] if name == "matplotlib" or name.startswith("matplotlib.")]
+
+
+def test_import_does_not_load_other_algorithms():
+    result = run_import()
+    list_algorithms = [name for name in result["modules"] if name.split(".")[0] == "mealpy"
+                       and len(name.split(".")) == 3 and name.split(".")[1] in FAMILIES]
+    assert list_algorithms == ["mealpy.swarm_based.PSO"]
+
+
+def test_import_time_budget():
+    result = run_import()
+    assert result["runtime"] < IMPORT_BUDGET, f"Importing BasePSO took {result['runtime']:.2f}s (budget: {IMPORT_BUDGET}s)"